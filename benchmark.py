@@ -0,0 +1,2521 @@
+"""
+Micro benchmarks of the python_sharp dispatch stack.
+
+Usage:
+    python benchmark.py               # runs every benchmark
+    python benchmark.py dispatch      # runs only the selected benchmarks (by name)
+
+Regression suite (fixed cases compared against stored baselines):
+    python benchmark.py --save-baseline           # measures the regression cases and stores them in benchmark_baseline.json
+    python benchmark.py --check [--threshold 0.3] # fails (exit code 1) if a case is slower than its baseline beyond the threshold
+
+Correctness checks (invariants the optimizations must keep, fail with exit code 1 when one is broken):
+    python benchmark.py --verify                  # runs every check
+    python benchmark.py --verify pickle           # runs only the selected checks (by name)
+
+Regression timings are stored relative to a calibration loop measured in the same run, so baselines tolerate machine speed changes,
+but they should be saved again when the benchmark machine or the Python version changes.
+"""
+from array import array
+import asyncio
+import copy as copymodule
+import gc
+import json
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+import timeit
+import traceback
+import tracemalloc
+import warnings
+import weakref
+from typing import Callable,Any,Dict,List
+
+from python_sharp import *
+
+try:
+    import numpy
+except ImportError: # optional, batch columns are array.array objects without it
+    numpy = None
+
+
+BENCHMARKS:Dict[str,Callable[[], None]] = {}
+CHECKS:Dict[str,Callable[[], None]] = {}
+
+
+def benchmark(function:Callable[[], None])->Callable[[], None]:
+    """
+    Registers a benchmark function under its name (without the 'bench_' prefix).
+    """
+    BENCHMARKS[function.__name__[len("bench_"):]] = function
+    return function
+
+
+def check(function:Callable[[], None])->Callable[[], None]:
+    """
+    Registers a correctness check under its name (without the 'check_' prefix), a check raises AssertionError when its invariant is broken.
+    """
+    CHECKS[function.__name__[len("check_"):]] = function
+    return function
+
+
+def compare(statements:List[tuple], number:int, repeat:int = 7)->List[tuple]:
+    """
+    Measures several (label, statement) pairs interleaving their repetitions, so every statement is exposed to the same machine noise.
+    Returns (label, best nanoseconds per execution) rows.
+    """
+    timers = [(label, timeit.Timer(statement)) for label, statement in statements]
+    best = {label: float("inf") for label, _ in timers}
+
+    for _ in range(repeat):
+        for label, timer in timers:
+            best[label] = min(best[label], timer.timeit(number) / number * 1e9)
+
+    return [(label, best[label]) for label, _ in timers]
+
+
+def report(title:str, rows:List[tuple])->None:
+    """
+    Prints a benchmark table, every row is (label, nanoseconds per operation).
+    """
+    print(title)
+    for label, nanoseconds in rows:
+        print("    %-60s %12.1f ns" % (label, nanoseconds))
+    print()
+
+
+class LegacyDelegate:
+    """
+    Copy of the original Delegate implementation (list + append + tuple copy on every call), used as reference.
+    """
+    def __init__(self)->None:
+        self._callables = []
+
+    def __iadd__(self, value:Callable)->"LegacyDelegate":
+        self._callables.append(value)
+        return self
+
+    def __isub__(self, value:Callable)->"LegacyDelegate":
+        self._callables.remove(value)
+        return self
+
+    def __call__(self, *args:Any, **kwds:Any)->tuple:
+        results = []
+
+        for callable in self._callables:
+            results.append(callable( *args, **kwds))
+
+        return tuple(results)
+
+
+class legacyevent(event):
+    """
+    event descriptor using the original proxy strategy: one proxy slot shared by every instance, replaced on every instance change.
+    """
+    _proxy = None
+
+    def _get_proxy(self, instance:Any, owner:type)->"event.Event":
+        if self._proxy is None or self._proxy._instance != instance:
+            self._proxy = event.Event(lambda: instance, self)
+        return self._proxy
+
+
+class lookupevent(event):
+    """
+    event descriptor using the proxy before it was slotted: _fadd/_fremove are looked up in the descriptor on every += and -=.
+    """
+    class Event(event.Event):
+        pass # not slotted, as the proxy was
+
+    def _bound_proxy_type(self, owner:type, name:str)->type:
+        return self.Event
+
+
+class UnguardedDelegate(Delegate):
+    """
+    Copy of the dispatch loops before the error policies (without try/except), used as reference.
+    """
+    def __call__(self, *args:Any, **kwds:Any)->tuple:
+        callables = self._invocation
+
+        if callables is None:
+            callables = self._snapshot(args, kwds)
+
+        if len(callables) == 1:
+            return (callables[0](*args, **kwds),)
+
+        if not callables:
+            return ()
+
+        return tuple([callable(*args, **kwds) for callable in callables])
+
+    def invoke(self, *args:Any, **kwds:Any)->None:
+        callables = self._invocation
+
+        if callables is None:
+            callables = self._snapshot(args, kwds)
+
+        for callable in callables:
+            callable(*args, **kwds)
+
+
+def publisher_class(descriptor:type)->type:
+    """
+    Creates a class implementing one event ('evt') with the given descriptor type.
+    """
+    class Publisher:
+        def __init__(self)->None:
+            self._evt = Delegate()
+
+        @descriptor
+        def evt(self,value:Callable[[object, EventArgs], None])->None:
+            self._evt += value
+
+        @evt.remover
+        def evt(self,value:Callable[[object, EventArgs], None])->None:
+            self._evt -= value
+
+    return Publisher
+
+
+def time_pass(function:Callable[[Any], Any], operations:int, setup:Callable[[], Any] = lambda: None, repeat:int = 3)->float:
+    """
+    Executes function (a pass of several operations) repeat times and returns the best time per operation in nanoseconds.
+    function receives the value returned by setup, setup is executed before every repetition and it is not timed.
+    """
+    best = float("inf")
+
+    for _ in range(repeat):
+        value = setup()
+        gc.collect()
+        gc.disable() # same as timeit, garbage collection is not part of the measurement
+
+        try:
+            start = time.perf_counter()
+            function(value)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    return best / operations * 1e9
+
+
+class MovedEventArgs(EventArgs):
+
+    _delta:int
+
+    def __init__(self,delta:int)->None:
+        super().__init__()
+        self._delta = delta
+
+    @property
+    def delta(self)->int:
+        return self._delta
+
+
+class LegacyCancellableEventArgs:
+    """
+    Copy of the original CancellableEventArgs implementation (without __slots__), used as reference.
+    """
+    def __init__(self)->None:
+        super().__init__()
+        self._cancel = False
+
+    @property
+    def cancel(self)->bool:
+        return self._cancel
+
+    @cancel.setter
+    def cancel(self,value:bool)->None:
+        self._cancel = value
+
+
+class LegacyLocationChangingEventArgs(LegacyCancellableEventArgs):
+
+    def __init__(self,location:int)->None:
+        super().__init__()
+        self._location = location
+
+    @property
+    def location(self)->int:
+        return self._location
+
+
+@eventargs
+class SlottedMovedEventArgs(EventArgs):
+    delta:int
+
+
+@eventargs
+class LocationChangingEventArgs(CancellableEventArgs):
+    location:int
+
+
+class Subscriber:
+    """
+    Object subscribing a bound method, the most common subscriber.
+    """
+    def handler(self,sender:object,e:EventArgs)->None:
+        pass
+
+
+def rss()->int:
+    """
+    Gets the resident set size of the process in bytes (0 if it is not available in this platform).
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def handler(sender:object,e:EventArgs)->None:
+    pass
+
+
+def cpu_handler(sender:object,e:EventArgs)->int:
+    """
+    CPU bound handler (defined at module level so it can be pickled by a ProcessPoolExecutor).
+    """
+    return sum(value * value for value in range(300000))
+
+
+# region Benchmarks
+
+@benchmark
+def bench_dispatch()->None:
+    e = EventArgs()
+
+    for size in (0, 1, 10, 1000):
+        legacy = LegacyDelegate()
+        delegate = Delegate()
+
+        for _ in range(size):
+            legacy += handler
+            delegate += handler
+
+        number = max(100, 200000 // max(size, 1))
+        report("Delegate call with %d subscribers" % size, compare([
+            ("legacy __call__ (list append + tuple copy)", lambda: legacy(None, e)),
+            ("snapshot __call__", lambda: delegate(None, e)),
+            ("snapshot invoke (fire-and-forget)", lambda: delegate.invoke(None, e)),
+        ], number))
+
+
+@benchmark
+def bench_event_proxy()->None:
+    count = 100000
+    rows = []
+
+    for label, descriptor in (("shared proxy slot (legacy)", legacyevent), ("per instance cached proxy", event)):
+        publisher = publisher_class(descriptor)
+
+        def subscribe(instances:list)->None:
+            for instance in instances:
+                instance.evt += handler
+
+        def access(instances:list)->None:
+            for instance in instances:
+                instance.evt
+
+        rows.append(("%s: first subscription" % label, time_pass(subscribe, count, lambda: [publisher() for _ in range(count)])))
+        instances = [publisher() for _ in range(count)]
+        rows.append(("%s: access, alternating instances" % label, time_pass(access, count, lambda: instances)))
+
+    report("event access across %d instances" % count, rows)
+
+    for label, descriptor in (("shared proxy slot (legacy)", legacyevent), ("per instance cached proxy", event)):
+        publisher = publisher_class(descriptor)
+        instance = publisher()
+        instance.evt
+        reference = weakref.ref(instance)
+        del instance
+        gc.collect()
+        print("    %-60s %s" % (label, "instance collected" if reference() is None else "instance LEAKED (kept alive by the descriptor)"))
+    print()
+
+
+@benchmark
+def bench_unsubscribe()->None:
+    e = EventArgs()
+
+    for size in (100, 10000):
+        rows = []
+
+        for label, factory in (("legacy (list.remove)", LegacyDelegate), ("indexed", Delegate)):
+            subscribers = [Subscriber() for _ in range(size)]
+            delegate = factory()
+
+            for subscriber in subscribers:
+                delegate += subscriber.handler
+
+            def churn(delegate:Any)->None:
+                for _ in range(1000): # short-lived subscribers, the newest one is the worst case for a linear scan
+                    subscriber = Subscriber()
+                    delegate += subscriber.handler
+                    delegate -= subscriber.handler
+
+            rows.append(("%s: subscribe + unsubscribe" % label, time_pass(churn, 1000, lambda: delegate)))
+            rows.append(("%s: call after churn" % label, compare([("call", lambda: delegate(None, e))], max(10, 100000 // size))[0][1]))
+
+        report("Delegate churn with %d bound method subscribers" % size, rows)
+
+
+@benchmark
+def bench_weak_memory()->None:
+    rounds = 10
+    subscribers = 10000
+    e = EventArgs()
+
+    def subscribe(delegate:Delegate)->None: # subscribers that never unsubscribe and are dropped by its owner
+        for subscriber in [Subscriber() for _ in range(subscribers)]:
+            delegate += subscriber.handler
+
+    for label, factory in (("Delegate (strong references)", Delegate), ("WeakDelegate", WeakDelegate)):
+        delegate = factory()
+        gc.collect()
+        tracemalloc.start()
+        start_rss = rss()
+
+        for _ in range(rounds):
+            subscribe(delegate)
+            delegate(None, e)
+
+        gc.collect()
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print("%s, %d rounds of %d dropped subscribers" % (label, rounds, subscribers))
+        print("    %-60s %12.1f KiB" % ("traced memory growth", traced / 1024))
+        print("    %-60s %12.1f KiB" % ("RSS growth", (rss() - start_rss) / 1024))
+        print("    %-60s %12d" % ("live subscribers", len(delegate._callables)))
+        print()
+
+
+@benchmark
+def bench_async_fan_out()->None:
+    durations = [0.01 * (index % 5 + 1) for index in range(10)] # 10 handlers of 10 to 50 milliseconds
+    delegate = AsyncDelegate()
+
+    def io_handler(duration:float)->Callable:
+        async def handler(sender:object,e:EventArgs)->float:
+            await asyncio.sleep(duration)
+            return duration
+        return handler
+
+    for duration in durations:
+        delegate += io_handler(duration)
+
+    async def sequential()->tuple:
+        e = EventArgs()
+        return tuple([await callable(None, e) for callable in delegate._snapshot((None, e), {})])
+
+    async def concurrent()->tuple:
+        return await delegate(None, EventArgs())
+
+    print("AsyncDelegate fan-out of %d I/O handlers (sum %.0f ms, max %.0f ms)" % (len(durations), sum(durations) * 1000, max(durations) * 1000))
+    for label, coroutine in (("sequential await", sequential), ("AsyncDelegate (asyncio.gather)", concurrent)):
+        start = time.perf_counter()
+        asyncio.run(coroutine())
+        print("    %-60s %12.1f ms" % (label, (time.perf_counter() - start) * 1000))
+    print()
+
+
+@benchmark
+def bench_executor()->None:
+    handlers = 4
+    workers = os.cpu_count() or 1
+    rows = []
+
+    with ThreadPoolExecutor(workers) as threads, ProcessPoolExecutor(workers) as processes:
+        for label, executor in (("inline", None), ("ThreadPoolExecutor", threads), ("ProcessPoolExecutor", processes)):
+            delegate = ExecutorDelegate(executor=executor)
+
+            for _ in range(handlers):
+                delegate += cpu_handler
+
+            delegate(None, None) # warms up the pool
+            rows.append((label, time_pass(lambda delegate: delegate(None, None), 1, lambda: delegate) / 1e6))
+
+    print("ExecutorDelegate with %d CPU bound handlers, %d workers (cores)" % (handlers, workers))
+    for label, milliseconds in rows:
+        print("    %-60s %12.1f ms (speedup x%.2f)" % (label, milliseconds, rows[0][1] / milliseconds))
+    print()
+
+
+@benchmark
+def bench_thread_safety()->None:
+    duration = 1.0
+    permanent = 10
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6) # forces thread switches in the middle of the dispatch loop
+
+    try:
+        print("concurrent fire/subscribe stress test, %d permanent subscribers, %.1f s per run" % (permanent, duration))
+
+        for label, factory in (("Delegate", Delegate), ("WeakDelegate", WeakDelegate)):
+            for mutators in (0, 2):
+                delegate = factory()
+                calls = [0] * permanent
+                fires = [0]
+                errors = []
+                running = threading.Event()
+                running.set()
+
+                def counter(index:int)->Callable:
+                    def handler(sender:object,e:EventArgs)->None:
+                        calls[index] += 1
+                    return handler
+
+                handlers = [counter(index) for index in range(permanent)] # referenced here for WeakDelegate
+
+                for permanent_handler in handlers:
+                    delegate += permanent_handler
+
+                def fire()->None:
+                    try:
+                        while running.is_set():
+                            delegate(None, None)
+                            fires[0] += 1
+                    except Exception as exception:
+                        errors.append(exception)
+
+                def mutate()->None:
+                    try:
+                        while running.is_set():
+                            subscriber = Subscriber()
+                            target = delegate
+                            target += subscriber.handler
+                            target -= subscriber.handler
+                    except Exception as exception:
+                        errors.append(exception)
+
+                threads = [threading.Thread(target=fire)] + [threading.Thread(target=mutate) for _ in range(mutators)]
+                for thread in threads:
+                    thread.start()
+                time.sleep(duration)
+                running.clear()
+                for thread in threads:
+                    thread.join()
+
+                consistent = all(value == fires[0] for value in calls) and not errors
+                print("    %-45s %d mutators: %10.0f fires/s, %s" % (label, mutators, fires[0] / duration,
+                    "every fire called every permanent subscriber once" if consistent else "INCONSISTENT (%d skipped or repeated calls, %d errors)" % (sum(abs(value - fires[0]) for value in calls), len(errors))))
+        print()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+@benchmark
+def bench_batch()->None:
+    updates = 20000
+    sender = object()
+
+    def unbatched(delegate:Delegate)->None:
+        for delta in range(updates):
+            delegate(sender, MovedEventArgs(delta))
+
+    def batched(mode:str)->Callable[[Delegate], None]:
+        def run(delegate:Delegate)->None:
+            with delegate.batch(mode):
+                for delta in range(updates):
+                    delegate(sender, MovedEventArgs(delta))
+        return run
+
+    for size in (1, 10, 100):
+        subscribers = [Subscriber() for _ in range(size)]
+        delegate = Delegate()
+
+        for subscriber in subscribers:
+            delegate += subscriber.handler
+
+        report("%d moved events raised in one tick, %d subscribers (ns per raise)" % (updates, size), [
+            ("unbatched", time_pass(unbatched, updates, lambda: delegate)),
+            ("batch('last')", time_pass(batched("last"), updates, lambda: delegate)),
+            ("batch('merge')", time_pass(batched("merge"), updates, lambda: delegate)),
+        ])
+
+
+@benchmark
+def bench_eventargs()->None:
+    count = 100000
+    print("memory of %d EventArgs alive" % count)
+
+    for label, factory in (
+        ("MovedEventArgs (__dict__)", MovedEventArgs),
+        ("@eventargs MovedEventArgs (__slots__)", SlottedMovedEventArgs),
+        ("LocationChangingEventArgs (__dict__)", LegacyLocationChangingEventArgs),
+        ("@eventargs LocationChangingEventArgs (__slots__)", LocationChangingEventArgs),
+    ):
+        gc.collect()
+        tracemalloc.start()
+        instances = [factory(5) for _ in range(count)]
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        statistics = [statistic for statistic in snapshot.statistics("lineno") if statistic.count >= count]
+        blocks = sum(statistic.count for statistic in statistics)
+        size = sum(statistic.size for statistic in statistics)
+        print("    %-60s %6.1f allocations, %6.1f bytes per instance" % (label, blocks / count, size / count))
+        del instances
+    print()
+
+    pool = EventArgsPool(LocationChangingEventArgs)
+
+    def pooled()->None:
+        e = pool.acquire(5)
+        pool.release(e)
+
+    report("EventArgs creation", compare([
+        ("MovedEventArgs (__dict__)", lambda: MovedEventArgs(5)),
+        ("@eventargs MovedEventArgs (__slots__)", lambda: SlottedMovedEventArgs(5)),
+        ("LocationChangingEventArgs (__dict__)", lambda: LegacyLocationChangingEventArgs(5)),
+        ("@eventargs LocationChangingEventArgs (__slots__)", lambda: LocationChangingEventArgs(5)),
+        ("EventArgsPool acquire + release", pooled),
+    ], 200000))
+
+
+@benchmark
+def bench_cancellable()->None:
+    validators = 100
+
+    def validator(sender:object,e:LocationChangingEventArgs)->None:
+        if e.location > 100:
+            e.cancel = True
+
+    for position in (0, 10, validators):
+        rows = []
+
+        for label, factory in (("Delegate (executes every validator)", Delegate), ("CancellableDelegate", CancellableDelegate)):
+            delegate = factory()
+
+            for index in range(validators):
+                delegate += validator if index == position else handler
+
+            rows.append((label, compare([(label, lambda: delegate(None, LocationChangingEventArgs(500)))], 2000)[0][1]))
+
+        report("pre-event with %d validators, veto by validator %s" % (validators, position if position < validators else "none"), rows)
+
+
+class DelegatePublisher:
+    """
+    Publisher defining 5 events the classic way, creating a Delegate per event in the constructor.
+    """
+    def __init__(self)->None:
+        self._first = Delegate()
+        self._second = Delegate()
+        self._third = Delegate()
+        self._fourth = Delegate()
+        self._fifth = Delegate()
+
+    @event
+    def first(self,value:Callable[[object, EventArgs], None])->None:
+        self._first += value
+
+    @first.remover
+    def first(self,value:Callable[[object, EventArgs], None])->None:
+        self._first -= value
+
+    def raise_first(self)->None:
+        self._first(self, EventArgs())
+
+
+class FieldPublisher:
+    """
+    Publisher defining 5 field-like events, delegates are created only when subscribed.
+    """
+    first = event.field()
+    second = event.field()
+    third = event.field()
+    fourth = event.field()
+    fifth = event.field()
+
+    def raise_first(self)->None:
+        self._first(self, EventArgs())
+
+
+@benchmark
+def bench_field_events()->None:
+    count = 100000
+    target = 1000000
+    rows = []
+    raises = []
+    memory = []
+
+    for label, publisher in (("5 Delegates created in __init__", DelegatePublisher), ("5 field-like events", FieldPublisher)):
+        rows.append(("%s: construction" % label, time_pass(lambda _: [publisher() for _ in range(count)], count)))
+        rows.append(("%s: first subscription" % label, time_pass(lambda instances: [instance.first.__iadd__(handler) for instance in instances], count, lambda: [publisher() for _ in range(count)])))
+        subscribed = publisher()
+        subscribed.first += handler
+        raises.append(("%s: raise, 1 subscriber" % label, subscribed.raise_first))
+        raises.append(("%s: raise, no subscribers" % label, publisher().raise_first))
+
+        gc.collect()
+        tracemalloc.start()
+        instances = [publisher() for _ in range(count)]
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory.append((label, traced / count))
+        del instances
+
+    report("construction and dispatch of objects with 5 events", rows + compare(raises, 100000))
+    print("memory of objects with 5 events (%d objects measured, projected to %d)" % (count, target))
+    for label, size in memory:
+        print("    %-60s %9.0f B/object %9.0f MiB" % (label, size, size * target / 2**20))
+    print()
+
+
+@benchmark
+def bench_filtered()->None:
+    handlers = 50
+    threshold = 10
+
+    class Filtering:
+        def handler(self,sender:object,e:SlottedMovedEventArgs)->None:
+            if e.delta <= threshold:
+                return
+
+    def moved_far(sender:object,e:SlottedMovedEventArgs)->bool:
+        return e.delta > threshold
+
+    filtering = Delegate()
+    shared = Delegate()
+    distinct = Delegate()
+
+    for index in range(handlers):
+        filtering += Filtering().handler
+        shared.subscribe(Subscriber().handler, priority=index % 3, predicate=moved_far)
+        distinct.subscribe(Subscriber().handler, priority=index % 3, predicate=lambda sender, e: e.delta > threshold)
+
+    for delta in (1, 100):
+        e = SlottedMovedEventArgs(delta)
+        report("%d handlers, event %s by the filter" % (handlers, "rejected" if delta <= threshold else "accepted"), compare([
+            ("handlers filtering internally", lambda: filtering.invoke(None, e)),
+            ("subscribe, one shared predicate", lambda: shared.invoke(None, e)),
+            ("subscribe, one predicate per handler", lambda: distinct.invoke(None, e)),
+        ], 2000))
+
+    def mutate(delegate:Delegate)->None:
+        for index in range(1000):
+            delegate.subscribe(handler, priority=index % 5, predicate=moved_far)
+            delegate.invoke(None, e)
+            delegate -= handler
+
+    report("subscribe + execute + unsubscribe (dispatch plan rebuilt on every change), %d handlers" % handlers, [
+        ("subscribe with priority and predicate", time_pass(mutate, 1000, lambda: shared)),
+    ])
+
+
+@benchmark
+def bench_event_bus()->None:
+    e = EventArgs()
+    rows = []
+
+    for size in (100, 1000, 10000, 100000):
+        bus = EventBus()
+
+        def subscribe(_:Any)->None:
+            for index in range(size):
+                bus.subscribe("topic.%d" % index, handler)
+
+        subscription = time_pass(subscribe, size, repeat=1)
+
+        for index in range(size // 100): # 1% wildcard topics
+            bus.subscribe("topic.%d.*" % index, handler)
+
+        bus.subscribe("#", handler)
+        bus.publish(None, e, "topic.7")
+        row = compare([
+            ("publish (cached route)", lambda: bus.publish(None, e, "topic.7")),
+            ("publish resolving every time (trie walk)", lambda: [delegate.invoke(None, e) for delegate in bus._resolve("topic.7")]),
+        ], 20000)
+        rows += [("%d topics: subscribe" % size, subscription)] + [("%d topics: %s" % (size, label), nanoseconds) for label, nanoseconds in row]
+
+    report("EventBus publish latency (1 subscriber per topic, 1% wildcard topics, '#' subscriber)", rows)
+
+    bus = EventBus()
+    topics = {}
+
+    for topic in (EventArgs, CancellableEventArgs, LocationChangingEventArgs):
+        bus.subscribe(topic, handler)
+        topics[topic] = Delegate(handler)
+
+    def walk(e:EventArgs)->None: # resolving the hierarchy on every publish
+        for base in type(e).__mro__:
+            delegate = topics.get(base)
+
+            if delegate is not None:
+                delegate.invoke(None, e)
+
+    e = LocationChangingEventArgs(5)
+    report("publish LocationChangingEventArgs, subscribers on 3 levels of the hierarchy", compare([
+        ("MRO walk per publish", lambda: walk(e)),
+        ("EventBus (cached hierarchy)", lambda: bus.publish(None, e)),
+    ], 20000))
+
+
+@benchmark
+def bench_instrumentation()->None:
+    e = EventArgs()
+
+    for size in (1, 10):
+        disabled = Delegate()
+        uninstrumented = Delegate()
+        enabled = Delegate()
+
+        for _ in range(size):
+            for delegate in (disabled, uninstrumented, enabled):
+                delegate += Subscriber().handler
+
+        uninstrumented.instrument()
+        uninstrumented.uninstrument()
+        enabled.instrument()
+
+        report("instrumentation overhead, %d bound method subscribers" % size, compare([
+            ("disabled (never instrumented)", lambda: disabled(None, e)),
+            ("disabled (instrumented, then uninstrumented)", lambda: uninstrumented(None, e)),
+            ("enabled", lambda: enabled(None, e)),
+        ], 20000))
+
+
+@benchmark
+def bench_error_policy()->None:
+    e = EventArgs()
+    logging.disable(logging.CRITICAL)
+
+    def failing(sender:object,e:EventArgs)->None:
+        raise ValueError("failing subscriber")
+
+    for size in (1, 10):
+        rows = []
+        delegates = [("before error policies (no try/except)", UnguardedDelegate())]
+        delegates += [(policy, Delegate(errors=policy)) for policy in ("raise_first", "continue_and_aggregate", "log_and_continue")]
+
+        for _, delegate in delegates:
+            for _ in range(size):
+                delegate += Subscriber().handler
+
+        rows += compare([("call, %s" % label, lambda delegate=delegate: delegate(None, e)) for label, delegate in delegates], 20000)
+        rows += compare([("invoke, %s" % label, lambda delegate=delegate: delegate.invoke(None, e)) for label, delegate in delegates], 20000)
+        report("no exceptions, %d bound method subscribers" % size, rows)
+
+    def execute(delegate:Delegate)->None:
+        try:
+            delegate(None, e)
+        except Exception:
+            pass
+
+    rows = []
+
+    for policy in ("raise_first", "continue_and_aggregate", "log_and_continue"):
+        delegate = Delegate(errors=policy)
+
+        for index in range(10):
+            delegate += failing if index == 2 else Subscriber().handler
+
+        rows.append((policy, compare([(policy, lambda: execute(delegate))], 5000)[0][1]))
+
+    report("10 subscribers, the third one raises (logging disabled)", rows)
+    logging.disable(logging.NOTSET)
+
+
+def spin_handler(microseconds:float)->Callable[[object, EventArgs], None]:
+    """
+    Creates a handler that keeps the CPU busy during some microseconds (subscriber cost).
+    """
+    def spin(sender:object,e:EventArgs)->None:
+        end = time.perf_counter() + microseconds / 1e6
+
+        while time.perf_counter() < end:
+            pass
+
+    return spin
+
+
+@benchmark
+def bench_queued()->None:
+    raises = 2000
+    e = EventArgs()
+
+    for cost in (0, 10, 100):
+        rows = []
+
+        for label, factory in (
+            ("Delegate.invoke (subscriber in the producer)", Delegate),
+            ("QueuedDelegate, block, maxsize %d" % raises, lambda: QueuedDelegate(maxsize=raises)),
+            ("QueuedDelegate, block, maxsize 64 (backpressure)", lambda: QueuedDelegate(maxsize=64)),
+            ("QueuedDelegate, drop_newest, maxsize 64", lambda: QueuedDelegate(maxsize=64, overflow="drop_newest")),
+        ):
+            delegate = factory()
+            delegate += spin_handler(cost)
+            latencies = []
+            perf_counter = time.perf_counter
+
+            for _ in range(raises):
+                start = perf_counter()
+                delegate.invoke(None, e)
+                latencies.append(perf_counter() - start)
+
+            if isinstance(delegate, QueuedDelegate):
+                delegate.join()
+
+            latencies.sort()
+            rows.append(("%s: p50" % label, latencies[len(latencies) // 2] * 1e9))
+            rows.append(("%s: p99" % label, latencies[len(latencies) * 99 // 100] * 1e9))
+
+        report("producer latency per raise, 1 subscriber costing %d us" % cost, rows)
+
+
+@benchmark
+def bench_lazy_results()->None:
+    subscribers = 100
+    e = EventArgs()
+
+    def answer(sender:object,e:EventArgs)->int:
+        return 42
+
+    def no_answer(sender:object,e:EventArgs)->None:
+        return None
+
+    for position in (0, 10, subscribers):
+        delegate = Delegate()
+
+        for index in range(subscribers):
+            delegate += answer if index == position else no_answer
+
+        report("%d subscribers, answer from subscriber %s" % (subscribers, position if position < subscribers else "none"), compare([
+            ("first(delegate(...)) (every subscriber + tuple)", lambda: first(delegate(None, e))),
+            ("delegate.collect(first, ...)", lambda: delegate.collect(first, None, e)),
+            ("any(delegate(...))", lambda: any(delegate(None, e))),
+            ("delegate.collect(any, ...)", lambda: delegate.collect(any, None, e)),
+        ], 2000))
+
+
+@benchmark
+def bench_descriptor_access()->None:
+    count = 100000
+
+    def add(instance:Any, value:Callable)->None:
+        pass
+
+    def static_add(value:Callable)->None:
+        pass
+
+    class Methods:
+        def subscribe(self, value:Callable)->None:
+            pass
+
+        def unsubscribe(self, value:Callable)->None:
+            pass
+
+    class Lookup:
+        evt = lookupevent(add, add)
+
+    class Bound:
+        evt = event(add, add)
+
+    class Static:
+        evt = staticevent(static_add, static_add)
+
+    methods, lookup, bound = Methods(), Lookup(), Bound()
+
+    def call_methods()->None:
+        methods.subscribe(handler)
+        methods.unsubscribe(handler)
+
+    def lookup_event()->None:
+        lookup.evt += handler
+        lookup.evt -= handler
+
+    def bound_event()->None:
+        bound.evt += handler
+        bound.evt -= handler
+
+    def static_event()->None:
+        Static.evt += handler
+        Static.evt -= handler
+
+    report("subscribe + unsubscribe overhead (adder/remover do nothing)", compare([
+        ("plain method calls", call_methods),
+        ("event, descriptor lookup on every operation (previous)", lookup_event),
+        ("event, slotted proxy bound at class creation", bound_event),
+        ("staticevent, proxy created at class creation", static_event),
+    ], 200000, 9))
+
+    rows = []
+    memory = []
+
+    for label, descriptor in (("descriptor lookup (previous)", lookupevent), ("slotted proxy, bound at class creation", event)):
+        publisher = publisher_class(descriptor)
+        rows.append(("%s: first subscription" % label, time_pass(lambda instances: [instance.evt.__iadd__(handler) for instance in instances], count, lambda: [publisher() for _ in range(count)])))
+
+        instances = [publisher() for _ in range(count)]
+        gc.collect()
+        tracemalloc.start()
+        for instance in instances:
+            instance.evt
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory.append((label, traced / count))
+        del instances
+
+    report("first access of %d instances (proxy creation)" % count, rows)
+    print("memory of the cached proxies (%d instances)" % count)
+    for label, size in memory:
+        print("    %-60s %9.0f B/instance" % (label, size))
+    print()
+
+class TeardownSubscriber:
+    """
+    Object subscribing 3 bound methods to the events of a publisher.
+    """
+    def moved(self,sender:object,e:EventArgs)->None:
+        pass
+
+    def renamed(self,sender:object,e:EventArgs)->None:
+        pass
+
+    def died(self,sender:object,e:EventArgs)->None:
+        pass
+
+
+@benchmark
+def bench_teardown()->None:
+    count = 10000
+
+    def subscribe(publisher:FieldPublisher, subscriber:TeardownSubscriber)->None:
+        publisher.first += subscriber.moved
+        publisher.second += subscriber.renamed
+        publisher.third += subscriber.died
+
+    def subscribe_handles(publisher:FieldPublisher, subscriber:TeardownSubscriber)->List[Subscription]:
+        return [publisher.first.subscribe(subscriber.moved), publisher.second.subscribe(subscriber.renamed), publisher.third.subscribe(subscriber.died)]
+
+    def shared()->tuple:
+        publisher = FieldPublisher()
+        subscribers = [TeardownSubscriber() for _ in range(count)]
+
+        for subscriber in subscribers:
+            subscribe(publisher, subscriber)
+
+        return publisher, subscribers
+
+    def shared_handles()->List[Subscription]:
+        publisher = FieldPublisher()
+        return [handle for _ in range(count) for handle in subscribe_handles(publisher, TeardownSubscriber())]
+
+    def unsubscribe(value:tuple)->None:
+        publisher, subscribers = value
+
+        for subscriber in subscribers:
+            publisher.first -= subscriber.moved
+            publisher.second -= subscriber.renamed
+            publisher.third -= subscriber.died
+
+    def unsubscribe_handles(handles:List[Subscription])->None:
+        for handle in handles:
+            handle.unsubscribe()
+
+    def unsubscribe_all_shared(value:tuple)->None:
+        publisher, subscribers = value
+        publisher.first.unsubscribe_all(*subscribers)
+        publisher.second.unsubscribe_all(*subscribers)
+        publisher.third.unsubscribe_all(*subscribers)
+
+    report("teardown of %d subscribers (3 handlers each) of one publisher, per subscriber" % count, [
+        ("operator -= for every handler", time_pass(unsubscribe, count, shared)),
+        ("Subscription.unsubscribe for every handler", time_pass(unsubscribe_handles, count, shared_handles)),
+        ("unsubscribe_all(*subscribers) once per event", time_pass(unsubscribe_all_shared, count, shared)),
+    ])
+
+    def pairs()->List[tuple]:
+        pairs = [(FieldPublisher(), TeardownSubscriber()) for _ in range(count)]
+
+        for publisher, subscriber in pairs:
+            subscribe(publisher, subscriber)
+
+        return pairs
+
+    def pairs_handles()->List[Subscription]:
+        return [handle for _ in range(count) for handle in subscribe_handles(FieldPublisher(), TeardownSubscriber())]
+
+    def unsubscribe_pairs(pairs:List[tuple])->None:
+        for publisher, subscriber in pairs:
+            publisher.first -= subscriber.moved
+            publisher.second -= subscriber.renamed
+            publisher.third -= subscriber.died
+
+    def unsubscribe_all_pairs(pairs:List[tuple])->None:
+        for publisher, subscriber in pairs:
+            publisher.first.unsubscribe_all(subscriber)
+            publisher.second.unsubscribe_all(subscriber)
+            publisher.third.unsubscribe_all(subscriber)
+
+    report("teardown of %d subscribers (3 handlers each) of its own publisher, per subscriber" % count, [
+        ("operator -= for every handler", time_pass(unsubscribe_pairs, count, pairs)),
+        ("Subscription.unsubscribe for every handler", time_pass(unsubscribe_handles, count, pairs_handles)),
+        ("unsubscribe_all(subscriber) for every event", time_pass(unsubscribe_all_pairs, count, pairs)),
+    ])
+
+@benchmark
+def bench_recording()->None:
+    count = 100000
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_recording.log")
+
+    def publisher(args:EventArgs, record:bool)->tuple:
+        publisher = FieldPublisher()
+        publisher.first += handler
+        recorder = EventRecorder(path) if record else None
+
+        if recorder is not None:
+            recorder.record(publisher.first)
+
+        return publisher, args, recorder
+
+    def raises(value:tuple)->None:
+        publisher, args, recorder = value
+
+        for _ in range(count):
+            publisher._first(publisher, args)
+
+        if recorder is not None:
+            recorder.close() # serializes the last buffered raises
+
+    rows = [("not recorded", time_pass(raises, count, lambda: publisher(MovedEventArgs(5), False)))]
+    rows.append(("recorded, MovedEventArgs (__dict__)", time_pass(raises, count, lambda: publisher(MovedEventArgs(5), True))))
+    rows.append(("recorded, slotted MovedEventArgs", time_pass(raises, count, lambda: publisher(SlottedMovedEventArgs(5), True))))
+    report("raise of a field-like event with 1 subscriber, per raise (recording includes serialization)", rows)
+
+    delegate = Delegate(handler)
+    e = SlottedMovedEventArgs(5)
+
+    def direct(_:Any)->None:
+        for _ in range(count):
+            delegate(None, e)
+
+    def replay(_:Any)->None:
+        EventRecorder.replay(path, {"first": delegate})
+
+    report("replay of %d recorded raises into a Delegate with 1 subscriber, per raise" % count, [
+        ("direct execution (reference)", time_pass(direct, count)),
+        ("replay (read, decode and execute)", time_pass(replay, count)),
+    ])
+    print("    log size: %.1f bytes/raise" % (os.path.getsize(path) / count))
+    print()
+    os.remove(path)
+
+
+class TickSubscriber:
+    """
+    Subscriber accumulating the deltas of a tick, per item (legacy handler) or per batch (vectorized handler).
+    """
+    def __init__(self)->None:
+        self.total = 0
+
+    def moved(self,sender:object,e:SlottedMovedEventArgs)->None:
+        self.total += e.delta
+
+    def moved_batch(self,sender:object,e:BatchEventArgs)->None:
+        self.total += int(e.deltas.sum()) if numpy is not None else sum(e.deltas)
+
+
+@benchmark
+def bench_batch_args()->None:
+    count = 100000
+
+    if numpy is not None:
+        ids, deltas = numpy.arange(count, dtype = numpy.uint32), numpy.ones(count, dtype = numpy.int64)
+    else:
+        ids, deltas = array("I", range(count)), array("q", [1]) * count
+
+    def per_entity(subscriber:TickSubscriber)->None:
+        delegate = Delegate(subscriber.moved)
+
+        for delta in deltas.tolist():
+            delegate(None, SlottedMovedEventArgs(delta))
+
+    def batch(subscriber:TickSubscriber)->None:
+        Delegate(subscriber.moved_batch)(None, BatchEventArgs(ids = ids, deltas = deltas))
+
+    def batch_per_item(subscriber:TickSubscriber)->None:
+        Delegate(per_item(subscriber.moved, SlottedMovedEventArgs, delta = "deltas"))(None, BatchEventArgs(ids = ids, deltas = deltas))
+
+    report("tick of %d entities with 1 subscriber, per entity (columns: %s)" % (count, "numpy" if numpy is not None else "array.array"), [
+        ("one raise per entity (SlottedMovedEventArgs)", time_pass(per_entity, count, TickSubscriber)),
+        ("one raise per tick (BatchEventArgs), vectorized subscriber", time_pass(batch, count, TickSubscriber)),
+        ("one raise per tick (BatchEventArgs), per_item legacy handler", time_pass(batch_per_item, count, TickSubscriber)),
+    ])
+
+
+@eventargs
+class PingEventArgs(EventArgs):
+    sequence:int
+    echo:bool
+    timestamp:float = 0.0
+
+
+def remote_echo(requests:str, replies:str, transport:str)->None:
+    """
+    Process of bench_remote: counts the raises of the requests RemoteDelegate and replies the count to the raises with echo,
+    until a raise with echo and a negative sequence.
+    """
+    reply = RemoteDelegate(replies, transport = transport)
+    listener = RemoteListener(requests, transport = transport)
+    state = {"received": 0, "running": True}
+
+    def echo(sender:object, e:PingEventArgs)->None:
+        state["received"] += 1
+
+        if e.echo:
+            reply(None, PingEventArgs(state["received"], True, e.timestamp))
+            state["received"] = 0
+            state["running"] = e.sequence >= 0
+
+    listener += echo
+
+    while state["running"]:
+        listener.poll(0.1)
+
+    listener.close()
+    reply.close()
+
+
+@benchmark
+def bench_remote()->None:
+    count = 20000
+    rounds = 500
+    e = SlottedMovedEventArgs(5)
+    delegate = Delegate(handler)
+    remote = RemoteDelegate("benchmark-%d" % os.getpid(), handler, batch = 1024)
+
+    report("raise on the publisher with 1 local subscriber, no listeners (encoding included)", compare([
+        ("Delegate", lambda: delegate(None, e)),
+        ("RemoteDelegate, batch 1024 (%s)" % remote.transport, lambda: remote(None, e)),
+        ("pickle.dumps of the EventArgs (reference)", lambda: pickle.dumps(e, pickle.HIGHEST_PROTOCOL)),
+    ], 20000, 5))
+    remote.close()
+
+    for transport in ("ring", "socket"):
+        for batch in (1, 64):
+            requests, replies = "benchmark-requests-%d" % os.getpid(), "benchmark-replies-%d" % os.getpid()
+
+            try:
+                publisher = RemoteDelegate(requests, batch = batch, transport = transport, size = 1 << 22) # the ring holds the whole burst
+            except OSError as error: # the ring is only available on x86
+                print("RemoteDelegate %s transport not available: %s\n" % (transport, error))
+                continue
+
+            process = multiprocessing.Process(target = remote_echo, args = (requests, replies, transport), daemon = True)
+            process.start()
+            listener = None
+
+            while listener is None:
+                try:
+                    listener = RemoteListener(replies, transport = transport)
+                except OSError:
+                    time.sleep(0.01)
+
+            received = []
+            listener += lambda sender, e: received.append(e)
+
+            while not received: # the echo process may not be listening yet, ping until it replies
+                publisher(None, PingEventArgs(0, True))
+                publisher.flush()
+                listener.poll(0.05)
+
+            time.sleep(0.1)
+            listener.poll()
+            received.clear()
+            rows = []
+
+            if batch == 1:
+                latencies = []
+
+                for sequence in range(rounds):
+                    start = time.perf_counter()
+                    publisher(None, PingEventArgs(sequence, True, start))
+
+                    while not listener.poll(1):
+                        pass
+
+                    latencies.append((time.perf_counter() - received.pop().timestamp) * 1e9)
+
+                latencies.sort()
+                rows.append(("round trip, median", latencies[len(latencies) // 2]))
+                rows.append(("round trip, p99", latencies[len(latencies) * 99 // 100]))
+
+            start = time.perf_counter()
+
+            for sequence in range(count):
+                publisher(None, PingEventArgs(sequence, False))
+
+            publisher(None, PingEventArgs(count, True))
+            publisher.flush()
+
+            while not listener.poll(1):
+                pass
+
+            elapsed = time.perf_counter() - start
+            delivered = received.pop().sequence
+            rows.append(("throughput, %d raises delivered (%.0f raises/s)" % (delivered, delivered / elapsed), elapsed / (count + 1) * 1e9))
+
+            publisher(None, PingEventArgs(-1, True))
+            publisher.flush()
+            process.join(10)
+            listener.close()
+            publisher.close()
+            report("RemoteDelegate to another process, %s transport, batch %d, per raise" % (transport, batch), rows)
+
+
+# endregion
+
+
+@benchmark
+def bench_static_hierarchy()->None:
+    e = EventArgs()
+
+    class Base:
+        created = staticevent.field()
+
+    leaf = Base
+
+    for _ in range(7):
+        leaf = type("Derived", (leaf,), {})
+
+    descriptor = Base.__dict__["created"]
+
+    for subscribed in ((Base,), (Base, leaf.__mro__[3])):
+        descriptor._delegates.clear()
+        descriptor._invalidate()
+        delegates = {}
+
+        for klass in subscribed:
+            klass.created += handler
+            delegates[klass] = Delegate(handler)
+
+        def mro_walk()->tuple:
+            results = []
+            for klass in leaf.__mro__:
+                delegate = delegates.get(klass)
+                if delegate is not None:
+                    results += delegate(None, e)
+            return tuple(results)
+
+        def mro_walk_invoke()->None:
+            for klass in leaf.__mro__:
+                delegate = delegates.get(klass)
+                if delegate is not None:
+                    delegate.invoke(None, e)
+
+        raise_leaf = leaf._created
+
+        report("raise of a static event from a class %d levels deep, subscribed on %d of its classes" % (len(leaf.__mro__) - 2, len(subscribed)), compare([
+            ("walking the MRO on every raise", mro_walk),
+            ("staticevent.field(), cached chain", lambda: raise_leaf(None, e)),
+            ("walking the MRO on every raise, invoke", mro_walk_invoke),
+            ("staticevent.field(), cached chain, invoke", lambda: raise_leaf.invoke(None, e)),
+        ], 100000))
+
+    def mutate()->None:
+        leaf.created += handler
+        leaf._created(None, e)
+        leaf.created -= handler
+
+    report("subscribe + raise + unsubscribe (chain computed again)", compare([("staticevent.field()", mutate)], 20000))
+
+
+class TimerDebounce:
+    """
+    Naive debounce used as reference, a threading.Timer (one thread) per pending operator, cancelled and created again on every execution.
+    """
+    def __init__(self, handler:Callable, interval:float)->None:
+        self.handler = handler
+        self.interval = interval
+        self.timer = None
+
+    def __call__(self, *args:Any)->None:
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer = threading.Timer(self.interval, self.handler, args)
+        self.timer.start()
+
+
+@benchmark
+def bench_debounce()->None:
+    operators, burst, interval = 5000, 20, 0.2
+    executed = []
+    e = EventArgs()
+
+    def save(sender:object, e:EventArgs)->None:
+        executed.append(sender)
+
+    rows = []
+    notes = []
+
+    for label, factory, count, expected in (
+        ("handler executed on every raise (no operator)", lambda: save, operators, operators * burst),
+        ("debounce, shared timer thread", lambda: debounce(save, interval), operators, operators),
+        ("threading.Timer per operator (reference, %d operators)" % (operators // 10), lambda: TimerDebounce(save, interval), operators // 10, operators // 10),
+    ):
+        executed.clear()
+        subscribers = [factory() for _ in range(count)]
+        start = time.perf_counter()
+
+        for _ in range(burst):
+            for subscriber in subscribers:
+                subscriber(None, e)
+
+        raised = time.perf_counter()
+        threads = threading.active_count()
+
+        while len(executed) < expected:
+            time.sleep(0.001)
+
+        late = max(time.perf_counter() - raised - interval, 0)
+        rows.append((label, (raised - start) / (count * burst) * 1e9))
+        notes.append((label, "%d threads, %d executions, %.0f ms late" % (threads, len(executed), late * 1e3)))
+
+    report("%d raises of events debounced by %d operators (%.1f s interval), per raise" % (operators * burst, operators, interval), rows)
+    print("threads alive while pending, handler executions, last execution after the interval")
+    for label, note in notes:
+        print("    %-60s %s" % (label, note))
+    print()
+
+
+# region Regression suite
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+
+class PipelinePerson:
+    """
+    Person-style publisher (same as test.py without prints): property setters raising a property changed event, a pre-event and an event with arguments.
+    """
+    _instances_created:Delegate = Delegate()
+
+    def __init__(self,name:str)->None:
+        self._name = name
+        self._location = 0
+        self._name_changed = Delegate()
+        self._moved = Delegate()
+        self._location_changing = CancellableDelegate()
+        PipelinePerson._instances_created(None, EventArgs())
+
+    @property
+    def name(self)->str:
+        return self._name
+
+    @name.setter
+    def name(self,value:str)->None:
+        self._name = value
+        self._name_changed(self, EventArgs())
+
+    @property
+    def location(self)->int:
+        return self._location
+
+    @location.setter
+    def location(self,value:int)->None:
+        e = LocationChangingEventArgs(value)
+        self._location_changing(self, e)
+
+        if not e.cancel:
+            previous = self._location
+            self._location = value
+            self._moved(self, SlottedMovedEventArgs(value - previous))
+
+    @event
+    def name_changed(self,value:Callable[[object, EventArgs], None])->None:
+        self._name_changed += value
+
+    @name_changed.remover
+    def name_changed(self,value:Callable[[object, EventArgs], None])->None:
+        self._name_changed -= value
+
+    @event
+    def moved(self,value:Callable[[object, SlottedMovedEventArgs], None])->None:
+        self._moved += value
+
+    @moved.remover
+    def moved(self,value:Callable[[object, SlottedMovedEventArgs], None])->None:
+        self._moved -= value
+
+    @event
+    def location_changing(self,value:Callable[[object, LocationChangingEventArgs], None])->None:
+        self._location_changing += value
+
+    @location_changing.remover
+    def location_changing(self,value:Callable[[object, LocationChangingEventArgs], None])->None:
+        self._location_changing -= value
+
+    @staticevent
+    def instances_created(value:Callable[[object, EventArgs], None])->None:
+        PipelinePerson._instances_created += value
+
+    @instances_created.remover
+    def instances_created(value:Callable[[object, EventArgs], None])->None:
+        PipelinePerson._instances_created -= value
+
+
+class FieldPerson:
+    """
+    Publisher with a field-like event.
+    """
+    moved = event.field()
+
+
+def calibration()->None:
+    """
+    Pure Python workload (calls, attribute access, loop) used as unit of the regression timings.
+    """
+    subscriber = Subscriber()
+
+    for index in range(10):
+        subscriber.handler(None, index)
+
+
+def regression_cases()->List[tuple]:
+    """
+    Returns the regression cases, every case is (name, statement, number of executions per repetition).
+    """
+    e = EventArgs()
+    cases = []
+
+    for size in (0, 1, 10, 100):
+        delegate = Delegate()
+
+        for _ in range(size):
+            delegate += Subscriber().handler
+
+        cases.append(("delegate_call_%d" % size, lambda delegate=delegate: delegate(None, e), 20000))
+        cases.append(("delegate_invoke_%d" % size, lambda delegate=delegate: delegate.invoke(None, e), 20000))
+
+    for size in (10, 1000):
+        delegate = Delegate()
+
+        for _ in range(size):
+            delegate += Subscriber().handler
+
+        def add_remove(delegate:Delegate = delegate)->None:
+            delegate += handler
+            delegate -= handler
+
+        cases.append(("delegate_add_remove_%d" % size, add_remove, 20000))
+
+    person = PipelinePerson("Carlos")
+    field_person = FieldPerson()
+
+    def event_add_remove()->None:
+        person.moved += handler
+        person.moved -= handler
+
+    def field_event_add_remove()->None:
+        field_person.moved += handler
+        field_person.moved -= handler
+
+    def staticevent_add_remove()->None:
+        PipelinePerson.instances_created += handler
+        PipelinePerson.instances_created -= handler
+
+    cases.append(("event_access", lambda: person.moved, 100000))
+    cases.append(("event_add_remove", event_add_remove, 20000))
+    cases.append(("field_event_add_remove", field_event_add_remove, 20000))
+    cases.append(("staticevent_access", lambda: PipelinePerson.instances_created, 100000))
+    cases.append(("staticevent_add_remove", staticevent_add_remove, 20000))
+    cases.append(("cancellable_eventargs", lambda: CancellableEventArgs(), 100000))
+    cases.append(("cancellable_eventargs_subclass", lambda: LocationChangingEventArgs(5), 100000))
+
+    subscribed = PipelinePerson("Susa")
+    subscribed.name_changed += Subscriber().handler
+    subscribed.name_changed += handler
+    subscribed.moved += Subscriber().handler
+    subscribed.location_changing += Subscriber().handler
+
+    def rename()->None:
+        subscribed.name = "Nos"
+
+    def move()->None:
+        subscribed.location += 1
+
+    cases.append(("pipeline_property_changed", rename, 20000))
+    cases.append(("pipeline_pre_event_and_moved", move, 20000))
+    cases.append(("pipeline_construction", lambda: PipelinePerson("Carlos"), 20000))
+    return cases
+
+
+def measure_regression(names:List[str] | None = None)->Dict[str, Dict[str, float]]:
+    """
+    Measures the regression cases (every case if names is None) interleaved with the calibration workload.
+    Returns {case name: {"ns": nanoseconds per execution, "relative": nanoseconds / calibration nanoseconds}}.
+    """
+    results = {}
+
+    for name, statement, number in regression_cases():
+        if names is not None and name not in names:
+            continue
+
+        rows = dict(compare([(name, statement), ("calibration", calibration)], number, repeat=15))
+        results[name] = {"ns": rows[name], "relative": rows[name] / rows["calibration"]}
+
+    return results
+
+
+def save_baseline()->None:
+    results = measure_regression()
+
+    with open(BASELINE, "w") as file:
+        json.dump({"python": sys.version.split()[0], "cases": results}, file, indent=4, sort_keys=True)
+
+    for name, result in results.items():
+        print("    %-60s %12.1f ns" % (name, result["ns"]))
+    print("baseline stored in %s" % BASELINE)
+
+
+def check_baseline(threshold:float)->int:
+    """
+    Compares the regression cases against the stored baselines, returns the exit code (1 if any case regressed beyond the threshold).
+    """
+    with open(BASELINE) as file:
+        baseline = json.load(file)["cases"]
+
+    results = measure_regression()
+    regressions = []
+
+    for _ in range(2): # noise only makes cases slower, suspected regressions are measured again and its best measure is kept
+        suspected = [name for name, result in results.items() if name in baseline and result["relative"] / baseline[name]["relative"] - 1 > threshold]
+
+        if not suspected:
+            break
+
+        for name, result in measure_regression(suspected).items():
+            if result["relative"] < results[name]["relative"]:
+                results[name] = result
+
+    for name, result in results.items():
+        if name not in baseline:
+            print("    %-44s %12.1f ns %12s" % (name, result["ns"], "new"))
+            continue
+
+        change = result["relative"] / baseline[name]["relative"] - 1
+        status = "REGRESSION" if change > threshold else ""
+        print("    %-44s %12.1f ns %+11.1f%% %s" % (name, result["ns"], change * 100, status))
+
+        if status:
+            regressions.append(name)
+
+    if regressions:
+        print("%d cases slower than its baseline by more than %.0f%%: %s" % (len(regressions), threshold * 100, ", ".join(regressions)))
+        return 1
+
+    print("no regressions (threshold %.0f%%)" % (threshold * 100))
+    return 0
+
+# endregion
+
+# region Checks
+
+class PickledHolder:
+    """
+    Object holding a delegate, copied and pickled by the checks.
+    """
+    def __init__(self)->None:
+        self.moved = Delegate()
+
+
+@check
+def check_pickle()->None:
+    delegate = Delegate(handler, errors = "log_and_continue")
+    delegate += cpu_handler
+    delegate.subscribe(handler, priority = 5)
+    delegate -= cpu_handler
+
+    for copy in (pickle.loads(pickle.dumps(delegate)), copymodule.copy(delegate), copymodule.deepcopy(delegate)):
+        assert type(copy) is Delegate and copy._errors == "log_and_continue"
+        assert list(copy._callables.values()) == list(delegate._callables.values())
+        assert copy._options == delegate._options
+
+        copy += cpu_handler # the copy is independent and keeps generating new keys
+        assert len(copy._callables) == 3 and len(delegate._callables) == 2
+        assert len(set(copy._callables)) == 3
+        copy -= handler
+        copy -= handler
+        copy -= cpu_handler
+        assert not copy._callables and len(delegate._callables) == 2
+        assert copy(None, None) == ()
+
+    holder = PickledHolder()
+    holder.moved += handler
+    restored = copymodule.deepcopy(holder)
+    assert restored.moved is not holder.moved and list(restored.moved._callables.values()) == [handler]
+
+
+@check
+def check_thread_safety()->None:
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6) # forces thread switches in the middle of the dispatch loop
+
+    try:
+        for factory in (Delegate, WeakDelegate):
+            delegate = factory()
+            calls = [0] * 10
+            fires = [0]
+            errors = []
+            running = threading.Event()
+            running.set()
+
+            def counter(index:int)->Callable:
+                def handler(sender:object,e:EventArgs)->None:
+                    calls[index] += 1
+                return handler
+
+            handlers = [counter(index) for index in range(len(calls))] # referenced here for WeakDelegate
+
+            for permanent_handler in handlers:
+                delegate += permanent_handler
+
+            def fire()->None:
+                try:
+                    while running.is_set():
+                        delegate(None, None)
+                        fires[0] += 1
+                except Exception as exception:
+                    errors.append(exception)
+
+            def mutate()->None:
+                try:
+                    subscribers = []
+                    target = delegate
+
+                    while running.is_set():
+                        subscriber = Subscriber()
+                        subscribers.append(subscriber)
+                        target += subscriber.handler
+
+                        if len(subscribers) > 3:
+                            target -= subscribers.pop(0).handler
+
+                    for subscriber in subscribers:
+                        target -= subscriber.handler
+                except Exception as exception:
+                    errors.append(exception)
+
+            threads = [threading.Thread(target=fire)] + [threading.Thread(target=mutate) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.3)
+            running.clear()
+            for thread in threads:
+                thread.join()
+
+            assert not errors, errors
+            assert fires[0] and calls == [fires[0]] * len(calls), "every fire must call every permanent subscriber once (%d fires, %s)" % (fires[0], calls)
+            assert len(delegate._callables) == len(calls), "subscriptions lost or leaked (%d callables)" % len(delegate._callables)
+            assert delegate(None, None) == (None,) * len(calls)
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+@check
+def check_event_proxy()->None:
+    person = PipelinePerson("Carlos")
+    field_person = FieldPerson()
+    person.moved
+    field_person.moved += handler
+
+    for instance in (person, field_person):
+        assert "moved" not in vars(instance), "the proxy must not be stored in the instance"
+
+    restored = pickle.loads(pickle.dumps(field_person))
+    assert list(restored._moved._callables.values()) == [handler]
+
+    original = FieldPerson()
+    original.moved
+    copy = copymodule.copy(original)
+    copy.moved += handler
+    assert copy.moved._instance is copy and "_moved" not in vars(original), "subscribing through a copy must not reach the original"
+
+    for factory in (lambda: PipelinePerson("Susa"), FieldPerson):
+        instance = factory()
+        instance.moved += handler
+        reference = weakref.ref(instance)
+        del instance
+        gc.collect()
+        assert reference() is None, "the cached proxy keeps its instance alive"
+
+    descriptor = vars(FieldPerson)["moved"]
+    assert not any(proxy._instance is None for proxy in descriptor._proxies.values()), "proxies of collected instances are not discarded"
+
+
+@check
+def check_event_validation()->None:
+    proxy = FieldPerson().moved
+    assert type(proxy).__qualname__ == "FieldPerson.moved.<proxy>"
+
+    for operation in (pickle.dumps, copymodule.copy):
+        try:
+            operation(proxy)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("event proxies must not be pickled or copied")
+
+    def add(instance:Any, value:Callable)->None:
+        pass
+
+    class Publisher:
+        pass
+
+    Publisher.evt = event(add) # not assigned in a class body, __set_name__ is not called
+
+    try:
+        Publisher().evt
+    except NotImplementedError:
+        pass
+    else:
+        raise AssertionError("an event without remover must fail on its first access")
+
+    try:
+        class Incomplete:
+            evt = event(add)
+    except RuntimeError as error: # Python 3.11 wraps exceptions raised by __set_name__
+        assert isinstance(error.__cause__, NotImplementedError)
+    except NotImplementedError:
+        pass
+    else:
+        raise AssertionError("an event without remover must fail when its class is created")
+
+
+@check
+def check_priority()->None:
+    delegate = Delegate()
+    order = []
+    delegate += lambda sender, e: order.append("default")
+    delegate.subscribe(lambda sender, e: order.append("low"), priority = -1)
+    delegate.subscribe(lambda sender, e: order.append("high"), priority = 10)
+    delegate.subscribe(lambda sender, e: order.append("high, second"), priority = 10)
+    delegate.subscribe(lambda sender, e: order.append("filtered"), priority = 5, predicate = lambda sender, e: False)
+    delegate(None, EventArgs())
+    assert order == ["high", "high, second", "default", "low"], order
+
+    def late(sender:object, e:EventArgs)->None:
+        order.append("late")
+
+    def subscribe_late(sender:object, e:EventArgs)->None:
+        order.append("subscriber")
+        delegate.subscribe(late, priority = 20)
+
+    subscription = delegate.subscribe(subscribe_late, priority = 15, predicate = lambda sender, e: "late" not in order)
+    order.clear()
+    delegate(None, EventArgs())
+    assert order == ["subscriber", "high", "high, second", "default", "low"], "a raise executes the callables it started with: %r" % order
+    subscription.unsubscribe()
+    order.clear()
+    delegate(None, EventArgs())
+    assert order == ["late", "high", "high, second", "default", "low"], "the plan must be rebuilt after a subscribe during a raise: %r" % order
+
+
+@check
+def check_batch()->None:
+    executions = []
+    delegate = Delegate(lambda sender, e: executions.append((sender, e)) or len(executions))
+    first, second = object(), object()
+    moves = [MovedEventArgs(delta) for delta in range(4)]
+
+    with delegate.batch():
+        with delegate.batch(): # nested, executed when the outermost batch exits
+            assert delegate(first, moves[0]) == (None,), "executions inside a batch return a tuple containing None"
+            delegate(second, moves[1])
+            delegate(first, moves[2])
+
+        assert executions == []
+
+    assert executions == [(first, moves[2]), (second, moves[1])], "one execution per sender with its last arguments"
+    assert delegate(first, moves[3]) == (3,), "the delegate executes its callables again after the batch"
+    executions.clear()
+
+    with delegate.batch("merge"):
+        for index, sender in enumerate((first, second, first, first)):
+            delegate(sender, moves[index])
+
+    assert [sender for sender, e in executions] == [first, second]
+    assert [e.events for sender, e in executions] == [(moves[0], moves[2], moves[3]), (moves[1],)], "merge keeps every EventArgs in order"
+
+    try:
+        with delegate.batch("merge"):
+            with delegate.batch("last"):
+                pass
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("nested batches must use the same mode")
+
+
+@check
+def check_batch_items()->None:
+    e = BatchEventArgs(ids = array("q", [1, 2, 3]), echoes = [True, False, True], timestamp = [0.5, 1.0, 1.5])
+    items = list(e.items(PingEventArgs, sequence = "ids", echo = "echoes"))
+    assert [(item.sequence, item.echo, item.timestamp) for item in items] == [(1, True, 0.5), (2, False, 1.0), (3, True, 1.5)]
+    assert type(items[0].sequence) is int, "array columns must be converted to Python values"
+    assert list(BatchEventArgs(second = [1, 2], first = ["a", "b"]).items(lambda x, y: (x, y))) == [(1, "a"), (2, "b")], \
+        "types that are not @eventargs receive the columns in declaration order"
+
+    try:
+        e.items(PingEventArgs)
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("a missing column must raise KeyError")
+
+    subscriber = TickSubscriber()
+    delegate = Delegate()
+    delegate += per_item(subscriber.moved, SlottedMovedEventArgs, delta = "deltas")
+    delegate(None, BatchEventArgs(ids = [1, 2], deltas = [3, 4]))
+    assert subscriber.total == 7
+    delegate -= per_item(subscriber.moved, SlottedMovedEventArgs, delta = "deltas")
+    assert not delegate._callables, "an equal per_item subscriber must remove the subscriber"
+    delegate.subscribe(per_item(subscriber.moved, SlottedMovedEventArgs, delta = "deltas"))
+    assert delegate.unsubscribe_all(subscriber) == 1, "per_item subscribers belong to the owner of the handler"
+
+
+@check
+def check_cancellable()->None:
+    for instrumented in (False, True):
+        delegate = CancellableDelegate()
+        executed = []
+
+        def veto(sender:object, e:LocationChangingEventArgs)->None:
+            executed.append("veto")
+            e.cancel = True
+
+        delegate += lambda sender, e: executed.append("first")
+        delegate += veto
+        delegate += lambda sender, e: executed.append("after the veto")
+
+        if instrumented:
+            delegate.instrument()
+
+        for execute in (delegate, delegate.invoke, lambda *args: list(delegate.invoke_iter(*args))):
+            executed.clear()
+            e = LocationChangingEventArgs(5)
+            execute(None, e)
+            assert executed == ["first", "veto"], "the dispatch must stop at the first veto: %r" % executed
+            assert e.cancel and e.cancelled_by is veto, "cancelled_by must be the vetoing callable: %r" % (e.cancelled_by,)
+
+        assert not hasattr(delegate, "batch"), "CancellableDelegate must hide batch"
+
+
+@check
+def check_subscriptions()->None:
+    class Owner:
+        def first(self, sender:object, e:EventArgs)->None:
+            pass
+
+        def second(self, sender:object, e:EventArgs)->None:
+            pass
+
+    delegate = Delegate()
+    handles = [delegate.subscribe(handler), delegate.subscribe(handler)]
+    assert handles[0].unsubscribe() and list(delegate._callables.values()) == [handler], "a handle removes exactly its callable"
+    assert not handles[0].unsubscribe(), "unsubscribing twice must do nothing"
+    assert handles[1].unsubscribe() and not delegate._callables
+
+    owner = Owner()
+    handles = delegate.subscribe_many([owner.first, handler, owner.second])
+    assert len(handles) == 3 and delegate.unsubscribe_all(owner) == 2 and list(delegate._callables.values()) == [handler]
+    assert not handles[0].unsubscribe() and handles[1].unsubscribe()
+
+    person = FieldPerson()
+    subscription = person.moved.subscribe(handler)
+    assert list(person._moved._callables.values()) == [handler]
+    assert subscription.unsubscribe() and not subscription.unsubscribe() and not person._moved._callables
+
+    publisher = DelegatePublisher()
+    publisher.first += owner.second # not added through subscribe, unsubscribe_all keeps it
+    subscription = publisher.first.subscribe(handler)
+    publisher.first.subscribe_many([owner.first])
+    assert subscription.unsubscribe() and not subscription.unsubscribe(), "events with a remover remove the callable once"
+    assert publisher.first.unsubscribe_all(owner) == 1 and list(publisher._first._callables.values()) == [owner.second]
+
+    class Base:
+        changed = staticevent.field()
+
+    class Derived(Base):
+        pass
+
+    executed = []
+    subscription = Derived.changed.subscribe(lambda sender, e: executed.append("derived"))
+    Base.changed.subscribe_many([owner.first, lambda sender, e: executed.append("base")])
+    Derived._changed(None, EventArgs())
+    assert executed == ["derived", "base"], executed
+    assert subscription.unsubscribe() and not subscription.unsubscribe()
+    assert Base.changed.unsubscribe_all(owner) == 1
+    executed.clear()
+    Derived._changed(None, EventArgs())
+    assert executed == ["base"], "static field events must stop executing unsubscribed callables: %r" % executed
+
+
+class SlottedCounter:
+    """
+    Callable without __weakref__, stored by WeakDelegate as a strong reference.
+    """
+    __slots__ = ("count",)
+
+    def __init__(self)->None:
+        self.count = 0
+
+    def __call__(self, sender:object, e:EventArgs)->None:
+        self.count += 1
+
+
+@check
+def check_weak_delegate()->None:
+    delegate = WeakDelegate()
+    subscriber = TickSubscriber()
+    counter = SlottedCounter()
+    kept = lambda sender, e: None
+    delegate += subscriber.moved
+    delegate.subscribe(TickSubscriber().moved, priority = 5, predicate = lambda sender, e: True) # only referenced by the delegate
+    delegate += counter
+    delegate += kept
+    delegate += lambda sender, e: None # only referenced by the delegate, collected right away
+    del subscriber
+    gc.collect()
+    delegate(None, SlottedMovedEventArgs(1))
+    references = list(delegate._callables.values())
+    assert len(references) == 2 and [reference() for reference in references] == [counter, kept], "collected subscribers must be pruned"
+    assert not isinstance(references[0], weakref.ref) and counter.count == 1, "callables without weak references must be kept alive"
+    assert len(delegate._index) == 2 and not delegate._options, "the index and the options of collected subscribers must be pruned"
+    del counter, kept
+    gc.collect()
+    delegate(None, SlottedMovedEventArgs(1))
+    assert len(delegate._callables) == 1, "the strong reference must survive its last outside reference"
+
+    only = WeakDelegate(TickSubscriber().moved)
+    gc.collect()
+    assert only(None, SlottedMovedEventArgs(1)) == () and len(only._callables) == 0
+
+
+@check
+def check_recorder()->None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "check.log")
+        delegate = CancellableDelegate()
+        moved = Delegate()
+
+        def veto(sender:object, e:LocationChangingEventArgs)->None:
+            e.cancel = True
+
+        delegate += veto
+
+        with EventRecorder(path, buffer = 7) as recorder:
+            recorder.record(delegate, "location_changing")
+            recorder.record(moved, "moved")
+            e = LocationChangingEventArgs(5)
+            delegate(None, e)
+            assert e.cancel
+
+            def raise_moved()->None:
+                for delta in range(1000):
+                    moved(None, MovedEventArgs(delta))
+
+            threads = [threading.Thread(target=raise_moved) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        replayed = []
+        EventRecorder.replay(path, {"location_changing": lambda sender, e: replayed.append(e.cancel)})
+        assert replayed == [False], "EventArgs must be recorded as raised, before the subscribers change them"
+        assert sum(1 for name, *_ in EventRecorder.read(path) if name == "moved") == 4000, "raises lost while the buffer is flushed"
+
+
+@check
+def check_recorder_instrument()->None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "check.log")
+
+        with EventRecorder(path) as recorder:
+            instrumented_first = Delegate(handler)
+            instrumented_first.instrument()
+            recorder.record(instrumented_first, "instrumented_first")
+            instrumented_first.uninstrument()
+            instrumented_first(None, EventArgs())
+            assert "recorded" in getattr(type(instrumented_first), "_layers", ()), "uninstrument must keep the delegate recorded"
+
+            recorded_first = Delegate(handler)
+            recorder.record(recorded_first, "recorded_first")
+            stats = recorded_first.instrument()
+            recorded_first(None, EventArgs())
+            recorder.stop(recorded_first)
+            recorded_first(None, EventArgs())
+            assert stats.as_dict()["count"] == 2, "stopping the recorder must keep the delegate instrumented"
+
+            recorded_first.uninstrument()
+            recorder.stop(instrumented_first)
+            assert type(instrumented_first) is Delegate and type(recorded_first) is Delegate
+
+        names = [name for name, *_ in EventRecorder.read(path)]
+        assert names == ["instrumented_first", "recorded_first"], names
+
+
+@check
+def check_recorder_dropped()->None:
+    with tempfile.TemporaryDirectory() as directory:
+        with EventRecorder(os.path.join(directory, "check.log")) as recorder:
+            delegate = Delegate(handler)
+            recorder.record(delegate, "unset")
+            e = PingEventArgs.__new__(PingEventArgs) # slots without value can not be recorded
+            logging.disable(logging.WARNING)
+
+            def raise_unset()->None:
+                for _ in range(2000):
+                    delegate(None, e)
+
+            try:
+                threads = [threading.Thread(target=raise_unset) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            finally:
+                logging.disable(logging.NOTSET)
+
+            assert recorder.dropped == 8000, "dropped raises lost by concurrent raises (%d)" % recorder.dropped
+
+
+@check
+def check_async_errors()->None:
+    async def answer(sender:object, e:EventArgs)->int:
+        return 42
+
+    def broken(sender:object, e:EventArgs)->None:
+        raise ValueError("raised before returning an awaitable")
+
+    async def run(errors:str)->Any:
+        delegate = AsyncDelegate(answer, errors = errors)
+        delegate += broken
+        delegate += answer
+        return await delegate(None, EventArgs())
+
+    with warnings.catch_warnings(record = True) as caught:
+        warnings.simplefilter("always")
+
+        try:
+            asyncio.run(run("raise_first"))
+        except ValueError:
+            gc.collect() # a coroutine never awaited is reported when it is collected
+        else:
+            raise AssertionError("raise_first must raise the exception of the callable")
+
+    assert not caught, "coroutines created before the failing callable must be closed: %s" % caught[0].message
+
+    logging.disable(logging.ERROR)
+
+    try:
+        assert asyncio.run(run("log_and_continue")) == (42, None, 42)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    try:
+        asyncio.run(run("continue_and_aggregate"))
+    except ExceptionGroup as group:
+        assert [type(exception) for exception in group.exceptions] == [ValueError]
+    else:
+        raise AssertionError("continue_and_aggregate must raise an ExceptionGroup")
+
+
+@check
+def check_async_api()->None:
+    async def slow(sender:object, e:Any)->int:
+        await asyncio.sleep(0.02)
+        return 1
+
+    async def none(sender:object, e:Any)->None:
+        return None
+
+    async def run()->None:
+        delegate = AsyncDelegate(none)
+        delegate += slow
+        stats = delegate.instrument()
+        assert await delegate(None, 1) == (None, 1)
+        await delegate.invoke(None, 2)
+        assert stats.as_dict()["count"] == 2 and stats.mean >= 0.02, "durations must include the time the callables are awaited"
+        delegate.uninstrument()
+
+        assert [result async for result in delegate.invoke_iter(None, 3)] == [None, 1]
+        assert await delegate.collect(first, None, 4) == 1
+
+        received = []
+        delegate += lambda sender, e: received.append(e)
+
+        async with delegate.batch():
+            for step in range(5):
+                assert await delegate(None, step) == (None,)
+
+        assert received == [4], received
+
+    asyncio.run(run())
+
+
+@check
+def check_executor_api()->None:
+    with ThreadPoolExecutor(4) as threads, ProcessPoolExecutor(2) as processes:
+        for executor in (threads, processes):
+            delegate = ExecutorDelegate(handler, executor = executor)
+            delegate += cpu_handler
+            stats = delegate.instrument()
+            assert delegate(None, 1) == (None, cpu_handler(None, 1))
+            delegate.invoke(None, 2)
+            assert stats.as_dict()["count"] == 2, "invoke must be recorded once"
+            assert sum(handler.as_dict()["count"] for handler in stats.handlers.values()) == 4
+
+            with delegate.batch():
+                for step in range(5):
+                    assert delegate(None, step) == (None,)
+
+            assert delegate.collect(first, None, 3) == cpu_handler(None, 3)
+            assert list(delegate.invoke_iter(None, 4)) == [None, cpu_handler(None, 4)]
+            delegate.uninstrument()
+
+
+@check
+def check_queued_api()->None:
+    received = []
+    delegate = QueuedDelegate(lambda sender, e: received.append((sender, e)))
+    assert not hasattr(delegate, "invoke_iter") and not hasattr(delegate, "collect"), "results of a QueuedDelegate are discarded"
+
+    with delegate.batch():
+        for step in range(100):
+            delegate("a", step)
+            delegate("b", step)
+
+    delegate.join()
+    assert received == [("a", 99), ("b", 99)], received
+
+    delegate = QueuedDelegate(handler)
+    stats = delegate.instrument()
+    delegate(None, 1)
+    delegate.invoke(None, 2)
+    delegate.join()
+    assert stats.as_dict()["count"] == 2, "invoke must be recorded once"
+
+
+@check
+def check_event_bus()->None:
+    bus = EventBus()
+    received = []
+    bus.subscribe("person.*", lambda sender, e: received.append(e))
+
+    for identifier in range(1000):
+        bus.publish(None, EventArgs(), "order.%d" % identifier)
+        bus.publish(None, EventArgs(), "person.%d" % (identifier % 10))
+
+    assert len(received) == 1000
+    assert len(bus._routes) == 10, "topics reaching no delegate must not be cached (%d routes)" % len(bus._routes)
+
+
+@check
+def check_remote()->None:
+    for transport in ("ring", "socket"):
+        name = "check-%d-%s" % (os.getpid(), transport)
+
+        try:
+            publisher = RemoteDelegate(name, transport = transport)
+        except OSError: # the ring is only available on x86
+            continue
+
+        with publisher, RemoteListener(name, transport = transport) as listener:
+            path = publisher._writer._path
+            assert os.stat(path).st_mode & 0o777 == 0o600 and os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+            received = []
+            listener += lambda sender, e: received.append((e.sequence, e.echo, e.timestamp))
+
+            for arguments in ((None, MovedEventArgs(5)), (None, PingEventArgs(1, True, [0.5])), (None, {"delta": 5})):
+                try:
+                    publisher(*arguments)
+                except TypeError:
+                    pass
+                else:
+                    raise AssertionError("%r must not be forwarded, listeners never unpickle" % (arguments[1],))
+
+            publisher(None, PingEventArgs(2, False, 0.5))
+            publisher.flush()
+            listener.poll(1)
+            assert received == [(2, False, 0.5)], received
+
+    local = []
+
+    with RemoteDelegate("check-%d-errors" % os.getpid(), lambda sender, e: local.append(e), errors = "log_and_continue") as publisher:
+        logging.disable(logging.ERROR)
+
+        try:
+            assert publisher(None, MovedEventArgs(5)) == (None,) and len(local) == 1, "the local dispatch must not depend on the encoding"
+        finally:
+            logging.disable(logging.NOTSET)
+
+    def fail(sender:object, e:EventArgs)->None:
+        local.append(e)
+        raise LookupError("handler")
+
+    local.clear()
+
+    with RemoteDelegate("check-%d-outcome" % os.getpid(), fail) as publisher:
+        try:
+            publisher(None, MovedEventArgs(5))
+        except TypeError:
+            assert not local, "raise_first must refuse the arguments before the local dispatch"
+        else:
+            raise AssertionError("arguments that can not be encoded must raise TypeError")
+
+        def broken(record:bytes)->None:
+            raise OSError("transport lost")
+
+        publisher._send = broken
+        logging.disable(logging.ERROR)
+
+        try:
+            publisher(None, PingEventArgs(1, False))
+        except LookupError:
+            assert len(local) == 1
+        else:
+            raise AssertionError("the exception of the handler must reach the caller")
+        finally:
+            logging.disable(logging.NOTSET)
+
+    local.clear()
+
+    with RemoteDelegate("check-%d-aggregate" % os.getpid(), lambda sender, e: local.append(e), errors = "continue_and_aggregate") as publisher:
+        try:
+            publisher(None, MovedEventArgs(5))
+        except ExceptionGroup as group:
+            assert len(local) == 1 and isinstance(group.exceptions[0], TypeError)
+        else:
+            raise AssertionError("arguments that can not be encoded must be aggregated")
+
+
+@eventargs
+class FloodEventArgs(EventArgs):
+    sequence:int
+    payload:bytes
+
+
+def flood_payload(sequence:int)->bytes:
+    """
+    Payload of the raise of check_remote_ring with a sequence, a frame copied while it was overwritten mixes the payloads of two sequences.
+    """
+    return sequence.to_bytes(8, "little") * 1024
+
+
+def ring_flood(name:str, ready:Any, seconds:float)->None:
+    """
+    Process of check_remote_ring: raises a RemoteDelegate whose ring holds barely one frame in bursts as fast as possible for some seconds,
+    once the listener is ready.
+    """
+    with RemoteDelegate(name + "-measure", transport = "ring") as measure:
+        measure(None, FloodEventArgs(0, flood_payload(0)))
+        measure.flush()
+        size = measure._writer._position
+
+    with RemoteDelegate(name, transport = "ring", size = size + 8) as publisher:
+        ready.wait()
+        deadline = time.perf_counter() + seconds
+        sequence = 0
+
+        while time.perf_counter() < deadline:
+            publisher(None, FloodEventArgs(sequence, flood_payload(sequence)))
+            sequence += 1
+
+            if sequence % 16 == 0: # short pauses, so the listener reads some frames between the bursts
+                time.sleep(0.0001)
+
+
+@check
+def check_remote_ring()->None:
+    name = "check-%d-flood" % os.getpid()
+    ready = multiprocessing.Event()
+    process = multiprocessing.Process(target = ring_flood, args = (name, ready, 1.0), daemon = True)
+    process.start()
+    listener = None
+
+    while listener is None and process.is_alive():
+        try:
+            listener = RemoteListener(name, transport = "ring")
+        except OSError: # not created yet, or the ring is not available (x86 only)
+            time.sleep(0.01)
+
+    if listener is None:
+        process.join()
+        return
+
+    received = []
+    listener += lambda sender, e: received.append(e)
+    ready.set()
+    logging.disable(logging.WARNING) # the listener falls behind on almost every frame
+
+    try:
+        while process.is_alive():
+            try:
+                listener.poll(0.01)
+            except Exception as error: # a frame copied while it was being overwritten
+                raise AssertionError("a corrupted frame was decoded: %r" % (error,))
+    finally:
+        logging.disable(logging.NOTSET)
+        listener.close()
+        process.join()
+
+    assert received, "no frame was read"
+
+    for previous, e in zip([None] + received, received):
+        assert e.payload == flood_payload(e.sequence), "a corrupted frame of the sequence %d was decoded" % e.sequence
+        assert previous is None or previous.sequence < e.sequence
+
+
+def timed_scenario(loop:asyncio.AbstractEventLoop | None)->None:
+    """
+    Scenario of check_timed_operators, executed with the timer thread (loop None) or with an event loop running in another thread.
+    """
+    received = {"debounce": [], "throttle": [], "sample": [], "rate_limit": []}
+    handlers = {name: values.append for name, values in received.items()}
+    debounced = debounce(handlers["debounce"], 0.05, loop)
+    throttled = throttle(handlers["throttle"], 0.1, loop)
+    sampled = sample(handlers["sample"], 0.05, loop)
+    limited = rate_limit(handlers["rate_limit"], 20, burst = 2, backlog = 1, loop = loop)
+
+    for value in range(1, 6):
+        debounced(value)
+        throttled(value)
+        sampled(value)
+        limited(value)
+
+    assert received["debounce"] == [] and received["sample"] == [], "debounce and sample only execute deferred executions"
+    assert received["throttle"] == [1], "throttle executes the first execution right away (leading edge)"
+    assert received["rate_limit"] == [1, 2], "rate_limit executes a burst right away"
+    time.sleep(0.5)
+    assert received["debounce"] == [5], "debounce executes the last execution: %r" % received["debounce"]
+    assert received["throttle"] == [1, 5], "throttle executes the last execution at the end of the interval: %r" % received["throttle"]
+    assert received["sample"] == [5], received["sample"]
+    assert received["rate_limit"] == [1, 2, 5] and limited.dropped == 2, "rate_limit keeps the newest backlog: %r" % received["rate_limit"]
+    assert not any(operator.pending for operator in (debounced, throttled, sampled, limited))
+
+
+@check
+def check_timed_operators()->None:
+    collected = []
+
+    for _ in range(2):
+        timed_scenario(None)
+        handler = lambda value: None
+        operator = debounce(handler, 0.01)
+        operator(None)
+        collected.append(weakref.ref(handler)) # only referenced by the operator
+        del handler, operator
+        time.sleep(0.1)
+
+    gc.collect()
+    assert all(handler() is None for handler in collected), "the timer must not keep fired operators alive"
+    timers = [thread for thread in threading.enumerate() if thread.name == "python_sharp timer"]
+    assert len(timers) == 1, "the operators must share one timer thread (%d)" % len(timers)
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target = loop.run_forever, daemon = True)
+    thread.start()
+
+    try:
+        timed_scenario(loop)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    async def scenario()->List[int]:
+        received = []
+
+        async def save(value:int)->None:
+            await asyncio.sleep(0)
+            received.append(value)
+
+        debounced = debounce(save, 0.05, asyncio.get_running_loop())
+
+        for value in range(1, 6):
+            debounced(value)
+
+        await asyncio.sleep(0.3)
+        return received
+
+    assert asyncio.run(scenario()) == [5], "awaitables returned by the handler must run as tasks of the loop"
+
+
+@check
+def check_static_events()->None:
+    class Base:
+        changed = staticevent.field()
+
+    Sub = type("Sub", (Base,), {})
+    stop = threading.Event()
+
+    def raiser()->None:
+        while not stop.is_set():
+            Sub._changed(None, EventArgs())
+
+    thread = threading.Thread(target = raiser)
+    thread.start()
+
+    try:
+        for _ in range(2000):
+            subscription = Base.changed.subscribe(lambda sender, e: True)
+            assert Sub._changed(None, EventArgs()) == (True,), "a chain computed before a subscription must not be cached"
+            subscription.unsubscribe()
+    finally:
+        stop.set()
+        thread.join()
+
+    Dynamic = type("Dynamic", (Base,), {})
+    Dynamic.changed.subscribe(lambda sender, e: None)
+    Dynamic._changed(None, EventArgs())
+    collected = weakref.ref(Dynamic)
+    del Dynamic
+    gc.collect()
+    assert collected() is None, "a class created at runtime must be collected with its subscribers"
+
+
+def run_checks(names:List[str])->int:
+    """
+    Executes the checks (every check if names is empty), returns the exit code (1 if any check failed).
+    """
+    failures = 0
+
+    for name in names or list(CHECKS):
+        try:
+            CHECKS[name]()
+        except AssertionError:
+            failures += 1
+            print("    %-60s FAILED" % name)
+            traceback.print_exc()
+        else:
+            print("    %-60s ok" % name)
+
+    return 1 if failures else 0
+
+# endregion
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+
+    if arguments[:1] == ["--save-baseline"]:
+        save_baseline()
+    elif arguments[:1] == ["--check"]:
+        threshold = float(arguments[arguments.index("--threshold") + 1]) if "--threshold" in arguments else 0.3
+        sys.exit(check_baseline(threshold))
+    elif arguments[:1] == ["--verify"]:
+        sys.exit(run_checks(arguments[1:]))
+    else:
+        for name in arguments or list(BENCHMARKS):
+            BENCHMARKS[name]()
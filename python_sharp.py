@@ -1,383 +1,7415 @@
-from typing import Callable,Any,List,Generic,TypeVar,Union
+from typing import Callable,Any,List,Dict,Iterable,Iterator,AsyncIterator,Generic,TypeVar,Union
 from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from concurrent.futures import Executor, Future
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from copy import deepcopy
+from heapq import heappop, heappush
+from inspect import isawaitable, iscoroutinefunction
+from itertools import count
+from operator import attrgetter
+import asyncio
+import logging
+import mmap
+import os
+import pickle
+import platform
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import threading
+from time import monotonic, perf_counter, sleep, time_ns
+from weakref import ref, WeakMethod, WeakKeyDictionary
 
 T=TypeVar("T")
+E=TypeVar("E", bound="EventArgs")
+
+_logger = logging.getLogger(__name__)
 
 class Delegate(Generic[T]):
     """
     Delegate is a simple class that represents a collection of Callables. When is being called execute all the callables in its collection.
 
+    Callables are stored in insertion order under an increasing key, and indexed by value, so adding and removing a callable are O(1) operations.
+    Calling the delegate executes an immutable snapshot (tuple) of the collection, the snapshot is discarded every time the collection
+    changes (operators += and -=) and it is taken again the next time the delegate is called, so the collection is never copied
+    while the delegate is being called.
+
+    Delegates are thread safe: adding and removing callables is serialized with a lock, and calling the delegate is lock free, due it only
+    reads the current snapshot. Same as C#, an execution of the delegate executes the collection as it was when the execution began, callables
+    added or removed while the delegate is being executed (from other threads or from the callables themselves) only affect next executions.
+
+    Callables added with the subscribe method can have a priority (executed before callables with lower priority) and a predicate (executed
+    only when the predicate accepts the arguments). They are sorted and grouped into a dispatch plan when the collection changes, never when
+    the delegate is called, and consecutive callables sharing the same predicate evaluate it once per execution.
+
+    The error policy of the delegate decides what happens when a callable raises an exception (see constructor), it is only consulted after
+    an exception, so executions without exceptions cost the same with every policy.
+
     Attributes:
-        _callables (list): Stores a collection of Callables.
+        _callables (Dict[int, Callable]): Stores a collection of Callables in insertion order, by key.
+        _index (Dict[Callable, List[int]]): Stores the keys (in insertion order) of every callable in the collection.
+        _keys (count): Generates the key of every callable added into the collection.
+        _options (Dict[int, tuple]): Stores (priority, predicate) of the callables added with subscribe method, by key.
+        _invocation (tuple | None): Immutable snapshot of the collection of Callables used to execute the delegate, None if it has to be taken again
+            (always None when there are callables with predicate, then the snapshot is selected from the dispatch plan on every execution).
+        _plan (tuple | None): Dispatch plan, groups (predicate, callables) in execution order, None if there are no callables with predicate
+            or it has to be built again.
+        _lock (threading.Lock): Serializes the changes of the collection of callables.
+        _batch (_Batch | None): State of the active batch context (see batch method), None if the delegate is not batching.
+        _errors (str): Error policy, "raise_first", "continue_and_aggregate" or "log_and_continue".
     """
-    _callables:list
+    _callables:Dict[int, Callable]
+    _index:Dict[Callable, List[int]]
+    _keys:count
+    _options:Dict[int, tuple]
+    _invocation:tuple | None
+    _plan:tuple | None
+    _lock:threading.Lock
+    _batch:"_Batch | None"
+    _errors:str
 
-    def __init__(self,callable:Callable[..., T] | None = None)->None:
+    def __init__(self,callable:Callable[..., T] | None = None, errors:str = "raise_first")->None:
         """
         Delegate constructor.
 
         Parameters:
             callable (Callable[..., T] | None): first callable to be added to the collection of callables.
+            errors (str): Error policy, what happens when a callable raises an exception:
+                - "raise_first": the exception is raised right away, the rest of the callables are not executed.
+                - "continue_and_aggregate": the rest of the callables are executed, then an ExceptionGroup with every exception is raised.
+                - "log_and_continue": the exception is logged (logger 'python_sharp'), the rest of the callables are executed and the result
+                  of the failing callables is None.
 
         Return:
             None
+
+        Raises:
+            ValueError: errors is not a valid error policy.
         """
-        self._callables = [] 
+        if errors not in ("raise_first", "continue_and_aggregate", "log_and_continue"):
+            raise ValueError("errors must be 'raise_first', 'continue_and_aggregate' or 'log_and_continue', not %r" % (errors,))
+
+        self._errors = errors
+        self._callables = {}
+        self._index = {}
+        self._keys = count()
+        self._options = {}
+        self._invocation = ()
+        self._plan = None
+        self._lock = threading.Lock()
+        self._batch = None
 
         if callable is not None:
             self += callable
 
+    def __getstate__(self)->Dict[str, Any]:
+        """
+        Gets the state of the delegate to pickle or copy it, without the lock, the key generator, the active batch and the cached snapshot
+        and dispatch plan (they are rebuilt by __setstate__).
+
+        Return:
+            Dict[str, Any]: state of the delegate.
+        """
+        with self._lock:
+            state = self.__dict__.copy()
+            state["_callables"] = self._callables.copy()
+            state["_index"] = {value: keys.copy() for value, keys in self._index.items()}
+            state["_options"] = self._options.copy()
 
-    def __iadd__(self, value:Callable[..., T])->"Delegate":
+        for name in ("_lock", "_keys", "_batch", "_invocation", "_plan"):
+            state.pop(name, None)
+
+        return state
+
+    def __setstate__(self, state:Dict[str, Any])->None:
         """
-        Implements the addition of a callable into the callable collection.
+        Restores the state of the delegate (see __getstate__), rebuilding the lock and the key generator.
 
         Parameters:
-            value (Callable[..., T]): callable to be added to the collection of callables.
+            state (Dict[str, Any]): state of the delegate.
 
         Return:
-            Delegate: Current instance with the extra callable.
+            None
         """
-        self._callables.append(value)
-        return self
+        self.__dict__.update(state)
+        self._keys = count(max(self._callables, default=-1) + 1)
+        self._lock = threading.Lock()
+        self._batch = None
+        self._invocation = None
+        self._plan = None
 
-    def __isub__(self, value:Callable[..., T])->"Delegate":
+    def __copy__(self)->"Delegate":
         """
-        Implements the subtraction of a callable into the callable collection.
-
-        Parameters:
-            value (Callable[..., T]): callable to be subtracted to the collection of callables.
+        Creates a delegate of the same type with the same callables, both delegates can be changed independently.
 
         Return:
-            Delegate: Current instance with without the passed callable.
+            Delegate: copy of the delegate.
         """
-        self._callables.remove(value)
-        return self
-    
+        copy = self.__class__.__new__(self.__class__)
+        copy.__setstate__(self.__getstate__())
+        return copy
 
-    def __call__(self, *args:Any, **kwds:Any)->List[T]:
+    def __deepcopy__(self, memo:Dict[int, Any])->"Delegate":
         """
-        Allows the Delegate instance to be called as a function.
+        Creates a delegate of the same type with copies of the callables.
 
         Parameters:
-            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
-            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+            memo (Dict[int, Any]): objects already copied (see copy.deepcopy).
 
         Return:
-            List[T]: A list of the results of every callable in the callable collection.
+            Delegate: copy of the delegate.
         """
-        results = []
+        copy = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copy
+        copy.__setstate__(deepcopy(self.__getstate__(), memo))
+        return copy
 
-        for callable in self._callables:
-            results.append(callable( *args, **kwds))
 
-        return tuple(results)
-    
-
-class EventArgs:
-    """
-    EventArgs is a class that represents a object that contains the event arguments (reasons or extra information about why the event was triggered)
-    """
-    pass
+    def __iadd__(self, value:Callable[..., T])->"Delegate":
+        """
+        Implements the addition of a callable into the callable collection.
 
+        Parameters:
+            value (Callable[..., T]): callable to be added to the collection of callables.
 
-class CancellableEventArgs(EventArgs):
-    """
-    CancellableEventArgs is a class that represents an EventArg that implements the posibility of cancelling the upcomming event setting the property Cancel to 'True'.
+        Return:
+            Delegate: Current instance with the extra callable.
+        """
+        with self._lock:
+            self._add(value)
 
-    Attributes:
-        _cancel (bool): Contains the value if the action advertise by the pre-event should continue or not.
-    """
-    _cancel:bool
+        return self
 
-    def __init__(self)->None:
+    def subscribe(self, value:Callable[..., T], priority:int = 0, predicate:Callable[..., bool] | None = None)->"Subscription":
         """
-        CancellableEventArgs constructor.
+        Adds a callable into the callable collection with a priority and/or a predicate.
+        Callables with higher priority are executed first, callables with the same priority are executed in insertion order (callables added
+        with += operator have priority 0). The predicate receives the same arguments as the callable, and the callable is only executed (and
+        only returns a result) when the predicate returns True, in this way the callable does not pay the call just to return early:
+
+            delegate.subscribe(handler, priority=10, predicate=lambda sender, e: e.delta > threshold)
+
+        Share the same predicate object between callables to evaluate it once for all of them.
+
+        Parameters:
+            value (Callable[..., T]): callable to be added to the collection of callables.
+            priority (int): Execution priority of the callable, higher first.
+            predicate (Callable[..., bool] | None): Decides if the callable is executed, None to execute it always.
 
         Return:
-            None
+            Subscription: Handle removing exactly this callable (without searching it) when it is unsubscribed.
         """
-        super().__init__()
-        self._cancel = False 
+        with self._lock:
+            key = self._add(value)
 
-    
-    @property
-    def cancel(self)->bool:
+            if priority or predicate is not None:
+                self._options[key] = (priority, predicate)
+
+        return Subscription(self, key)
+
+    def subscribe_many(self, values:Iterable[Callable[..., T]], priority:int = 0, predicate:Callable[..., bool] | None = None)->List["Subscription"]:
         """
-        Gets property value.
+        Adds several callables into the callable collection in one operation (the collection changes only once), with the same priority and predicate
+        (see subscribe method).
+
+        Parameters:
+            values (Iterable[Callable[..., T]]): callables to be added to the collection of callables, in order.
+            priority (int): Execution priority of the callables, higher first.
+            predicate (Callable[..., bool] | None): Decides if the callables are executed, None to execute them always.
 
         Return:
-            bool: current value.
+            List[Subscription]: Handle of every callable, in order.
         """
-        return self._cancel
-    
-    @cancel.setter
-    def cancel(self,value:bool)->None:
+        values = list(values)
+
+        with self._lock:
+            keys = [self._add(value) for value in values]
+
+            if priority or predicate is not None:
+                for key in keys:
+                    self._options[key] = (priority, predicate)
+
+        return [Subscription(self, key) for key in keys]
+
+    def _add(self, value:Callable[..., T])->int:
         """
-        Sets a new value.
+        Adds a callable into the callable collection, the lock must be held by the caller.
 
         Parameters:
-            value (bool): New value to set.
+            value (Callable[..., T]): callable to be added to the collection of callables.
+
+        Return:
+            int: Key of the callable.
         """
-        self._cancel = value
+        key = next(self._keys)
+        self._callables[key] = value
 
-class BaseEvent(ABC):
-    """
-    BaseEvent an abstaract class to define a base event
+        try:
+            self._index.setdefault(value, []).append(key)
+        except TypeError: # unhashable callables are not indexed, _find searches them
+            pass
 
-    Attributes:
-        _fadd (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for adding a callable value.
-        _fremove (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for removing a callable value.
-        _proxy: object | None: Object to be use as proxy for the descriptor
-    """
-    _fadd: Callable[[Callable[[object,EventArgs], None]], None] | None
-    _fremove:Callable[[Callable[[object,EventArgs], None]], None] | None
-    _proxy: object | None
+        self._invocation = None
+        self._plan = None
+        return key
 
-    def __init__(
-        self,
-        fadd:Callable[[Callable[[object,EventArgs], None]], None] | None = None,
-        fremove:Callable[[Callable[[object,EventArgs], None]], None] | None = None
-    )->None:
+    def __isub__(self, value:Callable[..., T])->"Delegate":
         """
-        event constructor.
+        Implements the subtraction of a callable into the callable collection.
+        If the callable was added more than once, its last occurrence is removed (same as C# delegates).
 
         Parameters:
-            fadd (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for adding a callable value.
-            fremove (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for removing a callable value.
+            value (Callable[..., T]): callable to be subtracted to the collection of callables.
+
         Return:
-            None
+            Delegate: Current instance with without the passed callable.
+
+        Raises:
+            ValueError: The callable is not in the collection of callables.
         """
-        self._fadd = None
-        self._fremove = None
+        with self._lock:
+            try:
+                keys = self._index[value]
+            except KeyError:
+                raise ValueError("%s is not in the delegate" % (value,)) from None
+            except TypeError:
+                key = self._find(value)
+            else:
+                key = keys.pop()
 
-        self.adder(fadd)
-        self.remover(fremove)
+                if not keys:
+                    del self._index[value]
 
-        self._proxy = None
+            del self._callables[key]
+            self._options.pop(key, None)
+            self._invocation = None
+            self._plan = None
 
-    
-    def adder(self,fadd:Callable[[Callable[[object,EventArgs], None]], None] | None)->"BaseEvent":
+        return self
+
+    def _unsubscribe(self, key:int)->bool:
         """
-        Allows provide the function will be use to add a callable.
+        Removes the callable added under a key (see Subscription).
 
         Parameters:
-            fadd (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for adding a callable value.
+            key (int): Key of the callable.
+
         Return:
-            BaseEvent: Current instance with the new fadd function
+            bool: True if the callable was removed, False if it was already removed.
         """
-        if fadd is not None and self._fremove is not None and self._fremove.__name__ != fadd.__name__:
-            raise AttributeError("adder function '%s'and remover function '%s' name missmatch, both members must have same name" % (fadd.__name__,self._fremove.__name__))
+        with self._lock:
+            value = self._callables.pop(key, None)
 
-        self._fadd = fadd
-        return self
+            if value is None:
+                return False
 
-    def remover(self,fremove:Callable[[Callable[[object,EventArgs], None]], None] | None)->"BaseEvent":
+            self._unindex(value, key)
+            self._options.pop(key, None)
+            self._invocation = None
+            self._plan = None
+
+        return True
+
+    def unsubscribe_all(self, *owners:Any)->int:
         """
-        Allows provide the function will be use to remove a callable.
+        Removes every callable belonging to any of the owners in one operation (the collection changes only once, no matter how many callables
+        or owners are removed), a callable belongs to an owner when it is a method bound to the owner or the owner itself:
+
+            delegate.unsubscribe_all(school)            # removes school.person_moved, school.person_died...
+            delegate.unsubscribe_all(*closed_schools)
 
         Parameters:
-            fremove (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for removing a callable value.
+            *owners (Any): owners of the callables to remove.
+
         Return:
-            BaseEvent: Current instance with the new fremove function
+            int: Number of callables removed.
         """
-        if fremove is not None and self._fadd is not None and self._fadd.__name__ != fremove.__name__:
-            raise AttributeError("remover function '%s'and adder function '%s' name missmatch, both members must have same name" % (fremove.__name__,self._fadd.__name__))
+        owners = {id(owner) for owner in owners if owner is not None}
 
-        self._fremove = fremove
-        return self
-    
-    @abstractmethod
-    def _get_proxy(self, instance: Any, owner: type) -> Any:
+        with self._lock:
+            keys = self._owned_keys(owners)
+
+            for key in keys:
+                self._unindex(self._callables.pop(key), key)
+                self._options.pop(key, None)
+
+            if keys:
+                self._invocation = None
+                self._plan = None
+
+        return len(keys)
+
+    def _owned_keys(self, owners:set)->List[int]:
         """
-        Allows provide the specific proxy use for every child of this class
+        Searches the keys of the callables belonging to any of the owners (see unsubscribe_all), the lock must be held by the caller.
 
         Parameters:
-            instance (Any): The instance of the owning class. This parameter
-                is `None` when accessed from the class instead of from the instance.
-            owner (type): The type of the owning class.
+            owners (set): ids of the owners.
 
         Return:
-            Any: Descriptor proxy.
+            List[int]: Keys of the callables.
         """
-        pass
+        return [key for key, value in self._callables.items() if id(value) in owners or id(getattr(value, "__self__", None)) in owners]
 
-    def __get__(self, instance:Any, owner:type)->Any:
+    def _unindex(self, value:Callable[..., T], key:int)->None:
         """
-        Method to get descriptor value.
+        Removes a key from the index of the callables, the lock must be held by the caller.
 
         Parameters:
-            instance (Any): The instance of the owning class. This parameter
-                is `None` when accessed from the class instead of from the instance.
-            owner (type): The type of the owning class.
+            value (Callable[..., T]): callable stored under the key.
+            key (int): Key of the callable.
 
         Return:
-            Any: Descriptor proxy.
+            None
         """
+        try:
+            keys = self._index[value]
+        except (KeyError, TypeError): # unhashable callables are not indexed
+            return
 
-        if self._fadd is None or self._fremove is None:
-            error_message = ""
+        keys.remove(key)
 
-            if self._fadd is None and self._fremove is None:
-                error_message = "event in %s is not defining any function (adder/remover)" % owner
-            else:
-                function_info= (self._fremove,"adder") if self._fadd is None else (self._fadd,"remover") 
-                error_message = "event %s does not have '%s' function assigned in %s" % (function_info[0].__name__,function_info[1],owner)
-            
-            raise NotImplementedError(error_message) 
+        if not keys:
+            del self._index[value]
 
-        return self._get_proxy(instance,owner) 
+    def _find(self, value:Callable[..., T])->int:
+        """
+        Searches the key of the last occurrence of a callable that is not indexed (unhashable callables).
 
+        Parameters:
+            value (Callable[..., T]): callable to search.
 
-class event(BaseEvent):
-    """
-    event attribute, used to define a managed callback in an instance
+        Return:
+            int: Key of the callable.
 
-    Attributes:
-    _proxy: Event: Object to be use as proxy for the descriptor
-    """
+        Raises:
+            ValueError: The callable is not in the collection of callables.
+        """
+        for key in reversed(self._callables):
+            if self._callables[key] == value:
+                return key
 
-    _proxy:"Event"
+        raise ValueError("%s is not in the delegate" % (value,))
 
-    class Event:
+    def _snapshot(self, args:tuple, kwds:Dict[str, Any])->tuple:
         """
-        Event is class used as proxy for the 'event' descriptor. its responsability is execute _fadd and _fremove when operators += and -- are used over the member marked as @event.
+        Takes the immutable snapshot of the collection of callables used to execute the delegate.
+        When there are callables with predicate the snapshot is not stored, the callables accepted by its predicates are selected from
+        the dispatch plan (built only once after every change).
 
-        Attributes:
-            _instance (Any): Stores the object using @event as memeber (the object implementing the event).
-            _event_descriptor (event): Stores the descriptor that is using the instance as proxy.
+        Parameters:
+            args (tuple): Positional arguments of the execution.
+            kwds (Dict[str, Any]): Named arguments of the execution.
+
+        Return:
+            tuple: Callables to execute, in execution order.
         """
-        _instance:Any
-        _event_descriptor:"event"
+        plan = self._plan
 
-        def __init__(self, instance:Any, event_descriptor:"event")->None:
-            """
-            Event constructor.
+        if plan is None:
+            with self._lock:
+                if self._batch is not None:
+                    invocation = self._invocation = self._batch._invocation
+                    return invocation
 
-            Parameters:
-                instance (Any): object using @event as memeber (the object implementing the event).
-                event_descriptor (event): descriptor that is going to use this instance as proxy.
-            Return:
-                None
-            """
-            self._instance = instance
-            self._event_descriptor = event_descriptor
+                if not self._options:
+                    invocation = self._invocation = tuple(self._callables.values())
+                    return invocation
 
-        def __iadd__(self, value:Callable[[object,EventArgs], None])->"event.Event":
-            """
-            Executes the _fadd (responsible of describe how the callable sholud be added) passing the callable as parameter.
+                plan = self._dispatch_plan()
 
-            Parameters:
-                value (Callable[[object,EventArgs], None]): callable to be passed as parammeter to _fadd.
+                if len(plan) == 1 and plan[0][0] is None: # only priorities, the sorted snapshot is stored
+                    invocation = self._invocation = plan[0][1]
+                    return invocation
 
-            Return:
-                event.Event: Current instance.
-            """
-            self._event_descriptor._fadd(self._instance, value)
-            return self
+                self._plan = plan
 
-        def __isub__(self, value:Callable[[object,EventArgs], None])->"event.Event":
-            """
-            Executes the _fremove (responsible of describe how the callable sholud be removed) passing the callable as parameter.
+        selected = []
 
-            Parameters:
-                value (Callable[[object,EventArgs], None]): callable to be passed as parammeter to _fremove.
+        for predicate, callables in plan:
+            if predicate is None or predicate(*args, **kwds):
+                selected += callables
 
-            Return:
-                event.Event: Current instance.
-            """
-            self._event_descriptor._fremove(self._instance, value)
-            return self
+        return selected
 
-    def _get_proxy(self, instance: Any, owner: type) -> "event.Event":
+    def _dispatch_plan(self)->tuple:
         """
-        Allows provide the specific proxy use for every child of this class
-
-        Parameters:
-            instance (Any): The instance of the owning class. This parameter
-                is `None` when accessed from the class instead of from the instance.
-            owner (type): The type of the owning class.
+        Builds the dispatch plan, callables sorted by priority (stable, keeps insertion order) and grouped with the consecutive callables
+        sharing the same predicate, the lock must be held by the caller.
 
         Return:
-            event.Event: Descriptor proxy.
+            tuple: groups (predicate, callables) in execution order.
         """
-        if self._proxy is None or self._proxy._instance != instance:
-            self._proxy = event.Event(instance, self)
-        return self._proxy
- 
+        options = self._options
+        no_options = (0, None)
+        plan = []
 
-class staticevent(BaseEvent):
-    """
-    static event attribute, used to define a managed callback in a class
+        for key, value in sorted(self._callables.items(), key=lambda item: -options.get(item[0], no_options)[0]):
+            predicate = options.get(key, no_options)[1]
 
-    Attributes:
-    _proxy: StaticEvent: Object to be use as proxy for the descriptor
-    """
+            if plan and plan[-1][0] is predicate:
+                plan[-1][1].append(value)
+            else:
+                plan.append((predicate, [value]))
 
-    _proxy:"StaticEvent"
+        return tuple([(predicate, tuple(callables)) for predicate, callables in plan])
 
-    class StaticEvent:
+    def _batch_entry(self, callable:Callable[..., Any])->Any:
         """
-        StaticEvent is class used as proxy for the 'staticevent' descriptor. its responsability is execute _fadd and _fremove when operators += and -- are used over the member marked as @staticevent.
+        Converts a callable into an item of the snapshot (the only item of the snapshot used while batching).
 
-        Attributes:
-            _event_descriptor (staticevent): Stores the descriptor that is using the instance as proxy.
+        Parameters:
+            callable (Callable[..., Any]): callable to convert.
+
+        Return:
+            Any: snapshot item.
         """
-        _event_descriptor: "staticevent"
+        return callable
 
+    @contextmanager
+    def batch(self, mode:str = "last")->Iterator[None]:
+        """
+        Returns a context manager that buffers the executions of the delegate (instead of executing the callables) until the context exits,
+        then the buffered executions are coalesced and the callables are executed once for every sender (first positional argument):
 
-        def __init__(self, event_descriptor: "staticevent") -> None:
-            """
-            StaticEvent constructor.
+            - "last": with the arguments of the last execution of the sender.
+            - "merge": with (sender, CoalescedEventArgs) where CoalescedEventArgs contains the EventArgs (second positional argument) of every
+              execution of the sender, in order. Keyword arguments are ignored in this mode.
 
-            Parameters:
-                event_descriptor (staticevent): descriptor that is going to use this instance as proxy.
-            Return:
-                None
-            """
-            self._event_descriptor = event_descriptor
+        While batching, executing the delegate only appends its arguments to the buffer, and returns a tuple containing None.
+        Batches can be nested (with the same mode), callables are executed when the outermost batch exits.
 
+        Parameters:
+            mode (str): How the buffered executions are coalesced, "last" or "merge".
 
-        def __iadd__(self, value: Callable[[object, EventArgs], None]) -> "staticevent.StaticEvent":
-            """
-            Executes the _fadd (responsible of describe how the callable sholud be added) passing the callable as parameter.
+        Return:
+            Iterator[None]: context manager.
 
-            Parameters:
-                value (Callable[[object,EventArgs], None]): callable to be passed as parammeter to _fadd.
+        Raises:
+            ValueError: mode is not valid or it is different to the mode of the active batch.
+        """
+        batch = self._begin_batch(mode)
+
+        try:
+            yield
+        finally:
+            for args, kwds in self._end_batch(batch):
+                self(*args, **kwds)
+
+    def _begin_batch(self, mode:str)->"_Batch":
+        """
+        Enters a batch context (see batch), the first context replaces the snapshot with the buffering callable.
+
+        Parameters:
+            mode (str): How the buffered executions are coalesced, "last" or "merge".
+
+        Return:
+            _Batch: Active batch.
+
+        Raises:
+            ValueError: mode is not valid or it is different to the mode of the active batch.
+        """
+        if mode not in ("last", "merge"):
+            raise ValueError("batch mode must be 'last' or 'merge', not %r" % (mode,))
+
+        with self._lock:
+            batch = self._batch
+
+            if batch is None:
+                batch = self._batch = _Batch(mode)
+                batch._invocation = (self._batch_entry(batch.record),)
+                self._invocation = batch._invocation
+                self._plan = None
+            elif batch._mode != mode:
+                raise ValueError("batch mode %r does not match the mode of the active batch %r" % (mode, batch._mode))
+
+            batch._depth += 1
+
+        return batch
+
+    def _end_batch(self, batch:"_Batch")->List[tuple]:
+        """
+        Exits a batch context (see batch), the outermost context restores the snapshot.
+
+        Parameters:
+            batch (_Batch): Active batch.
+
+        Return:
+            List[tuple]: Arguments (args, kwds) of the coalesced executions to execute, empty if the batch is still active.
+        """
+        with self._lock:
+            batch._depth -= 1
+
+            if batch._depth:
+                return []
+
+            self._batch = None
+            self._invocation = None
+            self._plan = None
+
+        return batch.coalesce()
+    
+
+    def instrument(self, stats:"DispatchStats | None" = None)->"DispatchStats":
+        """
+        Starts recording the executions of the delegate and of its callables (count, durations and exceptions) into a DispatchStats.
+        The delegate becomes an instance of an instrumented subtype of its type, in this way a delegate that is not instrumented does not
+        pay anything for the instrumentation.
+
+        Parameters:
+            stats (DispatchStats | None): Statistics where executions are recorded, None to create new ones.
+
+        Return:
+            DispatchStats: Statistics of the delegate.
+        """
+        if stats is None:
+            stats = DispatchStats(type(self).__name__)
+
+        with self._lock:
+            self.__class__ = _layered_type(self.__class__, "instrumented", True)
+            self._stats = stats
+            self._invocation = None
+            self._plan = None
+
+        return stats
+
+    def uninstrument(self)->None:
+        """
+        Stops recording the executions of the delegate, a delegate that is also recorded by an EventRecorder is still recorded.
+
+        Return:
+            None
+        """
+        with self._lock:
+            if "instrumented" in getattr(self.__class__, "_layers", ()):
+                self.__class__ = _layered_type(self.__class__, "instrumented", False)
+                self._stats = None
+                self._invocation = None
+                self._plan = None
+
+    def _instrumented_entry(self, callable:Callable[..., Any], stats:"DispatchStats")->Any:
+        """
+        Converts an item of the snapshot into an instrumented item.
+
+        Parameters:
+            callable (Callable[..., Any]): snapshot item.
+            stats (DispatchStats): Statistics of the delegate.
+
+        Return:
+            Any: instrumented snapshot item.
+        """
+        return _InstrumentedCallable(callable, stats._handler(callable))
+
+    def __call__(self, *args:Any, **kwds:Any)->List[T]:
+        """
+        Allows the Delegate instance to be called as a function.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            List[T]: A list of the results of every executed callable in the callable collection (callables whose predicate rejects the arguments are not executed).
+        """
+        callables = self._invocation
+
+        if callables is None:
+            callables = self._snapshot(args, kwds)
+
+        if len(callables) == 1:
+            try:
+                return (callables[0](*args, **kwds),)
+            except Exception as exception:
+                if self._errors == "raise_first":
+                    raise
+                failure = exception
+
+            return self._continue(failure, iter(()), [], args, kwds)
+
+        if not callables:
+            return ()
+
+        results = []
+        append = results.append
+        remaining = iter(callables)
+
+        try:
+            for callable in remaining:
+                append(callable(*args, **kwds))
+        except Exception as exception: # the error policy is only consulted here, it does not cost anything without exceptions
+            if self._errors == "raise_first":
+                raise
+            failure = exception
+        else:
+            return tuple(results)
+
+        return self._continue(failure, remaining, results, args, kwds) # out of the except clause, next exceptions are not chained to this one
+
+    def invoke(self, *args:Any, **kwds:Any)->None:
+        """
+        Executes every callable in the callable collection discarding its results (fire-and-forget), in this way no result tuple is built.
+        Useful to raise events, where the results of the subscribers are not needed.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            None
+        """
+        callables = self._invocation
+
+        if callables is None:
+            callables = self._snapshot(args, kwds)
+
+        remaining = iter(callables)
+
+        try:
+            for callable in remaining:
+                callable(*args, **kwds)
+        except Exception as exception:
+            if self._errors == "raise_first":
+                raise
+            failure = exception
+        else:
+            return
+
+        self._continue(failure, remaining, None, args, kwds)
+
+    def invoke_iter(self, *args:Any, **kwds:Any)->Iterator[T]:
+        """
+        Executes the callables in the callable collection lazily, returns a generator that executes the next callable every time a result
+        is requested, in this way when only some results are needed (the first answer, any/all) the rest of the callables are not executed
+        and no result tuple is built. Exceptions raised by the callables are raised by the generator (the error policy is not applied).
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            Iterator[T]: Generator of the results of the callables, in execution order.
+        """
+        callables = self._invocation
+
+        if callables is None:
+            callables = self._snapshot(args, kwds)
+
+        for callable in callables:
+            yield callable(*args, **kwds)
+
+    def collect(self, reducer:Callable[[Iterator[T]], Any], *args:Any, **kwds:Any)->Any:
+        """
+        Executes the callables lazily (see invoke_iter) and reduces its results with a reducer, a function consuming an iterator, it can be
+        a built-in function (any, all, sum, max...), the first function of this module (first result that is not None) or a custom one.
+        The callables are only executed until the reducer stops consuming results:
+
+            handled = delegate.collect(any, sender, e)    # stops at the first callable returning a true value
+            answer = delegate.collect(first, sender, e)   # stops at the first callable returning a value that is not None
+
+        Parameters:
+            reducer (Callable[[Iterator[T]], Any]): function reducing the results.
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            Any: Value returned by the reducer.
+        """
+        results = self.invoke_iter(*args, **kwds)
+
+        try:
+            return reducer(results)
+        finally:
+            results.close()
+
+    def _continue(self, exception:Exception, remaining:Iterator[Callable], results:List[Any] | None, args:tuple, kwds:Dict[str, Any])->tuple | None:
+        """
+        Applies the error policy after a callable raised an exception (the policy is not "raise_first"): executes the remaining callables
+        collecting its exceptions, then raises an ExceptionGroup ("continue_and_aggregate") or logs the exceptions ("log_and_continue").
+
+        Parameters:
+            exception (Exception): Exception raised by the failing callable.
+            remaining (Iterator[Callable]): callables after the failing callable.
+            results (List[Any] | None): Results of the callables before the failing callable, None if the results are discarded (invoke).
+            args (tuple): Positional arguments of the execution.
+            kwds (Dict[str, Any]): Named arguments of the execution.
+
+        Return:
+            tuple | None: Results of every callable (None for the failing callables), None if the results are discarded.
+
+        Raises:
+            ExceptionGroup: The error policy is "continue_and_aggregate".
+        """
+        exceptions = [exception]
+
+        if results is not None:
+            results.append(None)
+
+        for callable in remaining:
+            try:
+                result = callable(*args, **kwds)
+            except Exception as error:
+                exceptions.append(error)
+                result = None
+
+            if results is not None:
+                results.append(result)
+
+        self._raise_or_log(exceptions)
+        return None if results is None else tuple(results)
+
+    def _raise_or_log(self, exceptions:List[Exception])->None:
+        """
+        Raises an ExceptionGroup with the exceptions raised by the callables ("continue_and_aggregate") or logs them ("log_and_continue").
+
+        Parameters:
+            exceptions (List[Exception]): Exceptions raised by the callables, in execution order.
+
+        Return:
+            None
+
+        Raises:
+            ExceptionGroup: The error policy is "continue_and_aggregate".
+        """
+        if self._errors == "continue_and_aggregate":
+            raise ExceptionGroup("%d callables of the delegate raised an exception" % len(exceptions), exceptions)
+
+        for exception in exceptions:
+            _logger.error("exception raised by a callable of the delegate", exc_info=exception)
+    
+
+def first(results:Iterator[Any], default:Any = None)->Any:
+    """
+    Reducer returning the first result that is not None (see Delegate.collect), it stops consuming results as soon as it finds it.
+
+    Parameters:
+        results (Iterator[Any]): results of the callables of a delegate.
+        default (Any): Value returned when every result is None.
+
+    Return:
+        Any: First result that is not None, default if there is not any.
+    """
+    for result in results:
+        if result is not None:
+            return result
+
+    return default
+
+
+def _owned_by(callable:Callable[..., Any] | None, owners:set)->bool:
+    """
+    Checks if a callable belongs to an owner (see Delegate.unsubscribe_all): it is a method bound to the owner or the owner itself.
+
+    Parameters:
+        callable (Callable[..., Any] | None): callable to check, None for collected callables.
+        owners (set): ids of the owners.
+
+    Return:
+        bool: True if the callable belongs to any of the owners.
+    """
+    return callable is not None and (id(callable) in owners or id(getattr(callable, "__self__", None)) in owners)
+
+
+class Subscription:
+    """
+    Subscription is a handle of a callable added to a delegate or to an event (see Delegate.subscribe), unsubscribing through the handle removes
+    exactly that callable from a delegate without searching it (even if the same callable was added more than once), events implemented with
+    adder and remover functions remove it with its remover:
+
+        subscription = person.moved.subscribe(school.person_moved)
+        subscription.unsubscribe()
+
+    Attributes:
+        _source (Any): Delegate or event proxy the callable was added to, None after unsubscribing.
+        _key (int): Key of the callable in its source.
+    """
+    __slots__ = ("_source", "_key")
+
+    _source:Any
+    _key:int
+
+    def __init__(self, source:Any, key:int)->None:
+        """
+        Subscription constructor.
+
+        Parameters:
+            source (Any): Delegate or event proxy the callable was added to.
+            key (int): Key of the callable in its source.
+
+        Return:
+            None
+        """
+        self._source = source
+        self._key = key
+
+    def unsubscribe(self)->bool:
+        """
+        Removes the callable from its source, unsubscribing more than once does nothing.
+
+        Return:
+            bool: True if the callable was removed, False if it was already removed.
+        """
+        source = self._source
+
+        if source is None:
+            return False
+
+        self._source = None
+        return source._unsubscribe(self._key)
+
+
+class _Unsupported:
+    """
+    _Unsupported is a descriptor hiding a method inherited from Delegate that a delegate type can not support: accessing it raises
+    AttributeError (so hasattr returns False) with the reason.
+
+    Attributes:
+        _reason (str): Why the method is not supported.
+        _name (str): Name of the method.
+    """
+    __slots__ = ("_reason", "_name")
+
+    _reason:str
+    _name:str
+
+    def __init__(self, reason:str)->None:
+        """
+        _Unsupported constructor.
+
+        Parameters:
+            reason (str): Why the method is not supported.
+
+        Return:
+            None
+        """
+        self._reason = reason
+        self._name = ""
+
+    def __set_name__(self, owner:type, name:str)->None:
+        """
+        Stores the name of the hidden method.
+
+        Parameters:
+            owner (type): Delegate type.
+            name (str): Name of the method.
+
+        Return:
+            None
+        """
+        self._name = name
+
+    def __get__(self, instance:Any, owner:type | None = None)->Any:
+        """
+        Raises:
+            AttributeError: always.
+        """
+        raise AttributeError("%s does not support %s, %s" % ((owner or type(instance)).__name__, self._name, self._reason))
+
+
+class CancellableDelegate(Delegate[T]):
+    """
+    CancellableDelegate is a Delegate for pre-events (events with CancellableEventArgs), when the last positional argument is a CancellableEventArgs
+    the execution stops as soon as a callable sets its cancel property to True, the rest of the callables are not executed (validation chains
+    stop at the first veto), and the callable that cancelled is reported through the cancelled_by property of the CancellableEventArgs.
+
+    If the last positional argument is not a CancellableEventArgs every callable is executed, the same as a Delegate.
+    The cancellation is checked after every callable reading the '_cancel' attribute directly (not the property) to keep the dispatch loop fast.
+    """
+
+    def __call__(self, *args:Any, **kwds:Any)->List[T]:
+        """
+        Allows the CancellableDelegate instance to be called as a function.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            List[T]: A list of the results of every executed callable, callables after the cancellation are not executed.
+        """
+        callables = self._invocation
+
+        if callables is None:
+            callables = self._snapshot(args, kwds)
+
+        e = args[-1] if args else None
+        results = []
+        append = results.append
+        remaining = iter(callables)
+
+        try:
+            if not isinstance(e, CancellableEventArgs):
+                for callable in remaining:
+                    append(callable(*args, **kwds))
+            elif not e._cancel:
+                for callable in remaining:
+                    append(callable(*args, **kwds))
+
+                    if e._cancel:
+                        e._cancelled_by = callable._callable if callable.__class__ is _InstrumentedCallable else callable
+                        break
+        except Exception as exception:
+            if self._errors == "raise_first":
+                raise
+            failure = exception
+        else:
+            return tuple(results)
+
+        return self._continue(failure, remaining, results, args, kwds)
+
+    def invoke(self, *args:Any, **kwds:Any)->None:
+        """
+        Executes the callables in the callable collection until one of them cancels, discarding its results (fire-and-forget).
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            None
+        """
+        callables = self._invocation
+
+        if callables is None:
+            callables = self._snapshot(args, kwds)
+
+        e = args[-1] if args else None
+        remaining = iter(callables)
+
+        try:
+            if not isinstance(e, CancellableEventArgs):
+                for callable in remaining:
+                    callable(*args, **kwds)
+            elif not e._cancel:
+                for callable in remaining:
+                    callable(*args, **kwds)
+
+                    if e._cancel:
+                        e._cancelled_by = callable._callable if callable.__class__ is _InstrumentedCallable else callable
+                        break
+        except Exception as exception:
+            if self._errors == "raise_first":
+                raise
+            failure = exception
+        else:
+            return
+
+        self._continue(failure, remaining, None, args, kwds)
+
+    def invoke_iter(self, *args:Any, **kwds:Any)->Iterator[T]:
+        """
+        Executes the callables in the callable collection lazily (see Delegate.invoke_iter), until one of them cancels.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            Iterator[T]: Generator of the results of the executed callables, in execution order.
+        """
+        callables = self._invocation
+
+        if callables is None:
+            callables = self._snapshot(args, kwds)
+
+        e = args[-1] if args else None
+
+        if not isinstance(e, CancellableEventArgs):
+            for callable in callables:
+                yield callable(*args, **kwds)
+            return
+
+        if e._cancel:
+            return
+
+        for callable in callables:
+            result = callable(*args, **kwds)
+
+            if e._cancel:
+                e._cancelled_by = callable._callable if callable.__class__ is _InstrumentedCallable else callable
+                yield result
+                return
+
+            yield result
+
+    # buffered executions return before the callables are executed, so the caller would never see a veto (and "merge" would replace the
+    # CancellableEventArgs), pre-events must be executed one by one
+    batch = _Unsupported("the vetoes of buffered executions would be ignored")
+
+    def _continue(self, exception:Exception, remaining:Iterator[Callable], results:List[Any] | None, args:tuple, kwds:Dict[str, Any])->tuple | None:
+        """
+        Applies the error policy after a callable raised an exception (see Delegate._continue), the remaining callables are not executed
+        if the execution was cancelled.
+
+        Parameters:
+            exception (Exception): Exception raised by the failing callable.
+            remaining (Iterator[Callable]): callables after the failing callable.
+            results (List[Any] | None): Results of the callables before the failing callable, None if the results are discarded (invoke).
+            args (tuple): Positional arguments of the execution.
+            kwds (Dict[str, Any]): Named arguments of the execution.
+
+        Return:
+            tuple | None: Results of every executed callable (None for the failing callables), None if the results are discarded.
+
+        Raises:
+            ExceptionGroup: The error policy is "continue_and_aggregate".
+        """
+        e = args[-1] if args else None
+
+        if not isinstance(e, CancellableEventArgs):
+            return super()._continue(exception, remaining, results, args, kwds)
+
+        exceptions = [exception]
+
+        if results is not None:
+            results.append(None)
+
+        if not e._cancel:
+            for callable in remaining:
+                try:
+                    result = callable(*args, **kwds)
+                except Exception as error:
+                    exceptions.append(error)
+                    result = None
+
+                if results is not None:
+                    results.append(result)
+
+                if e._cancel:
+                    e._cancelled_by = callable._callable if callable.__class__ is _InstrumentedCallable else callable
+                    break
+
+        self._raise_or_log(exceptions)
+        return None if results is None else tuple(results)
+
+
+class _Batch:
+    """
+    _Batch is a class that represents the state of an active batch context of a Delegate (see Delegate.batch).
+
+    Attributes:
+        _mode (str): How the buffered executions are coalesced, "last" or "merge".
+        _depth (int): Number of nested batch contexts active.
+        _calls (list): Arguments (args, kwds) of every buffered execution, in order.
+        _invocation (tuple): Snapshot used by the delegate while batching, its only callable buffers the execution.
+    """
+    __slots__ = ("_mode", "_depth", "_calls", "_invocation")
+
+    _mode:str
+    _depth:int
+    _calls:list
+    _invocation:tuple
+
+    def __init__(self, mode:str)->None:
+        """
+        _Batch constructor.
+
+        Parameters:
+            mode (str): How the buffered executions are coalesced, "last" or "merge".
+
+        Return:
+            None
+        """
+        self._mode = mode
+        self._depth = 0
+        self._calls = []
+        self._invocation = ()
+
+    def record(self, *args:Any, **kwds:Any)->None:
+        """
+        Buffers the arguments of an execution of the delegate.
+
+        Return:
+            None
+        """
+        self._calls.append((args, kwds))
+
+    def coalesce(self)->List[tuple]:
+        """
+        Coalesces the buffered executions, one execution for every sender (first positional argument), in the order senders were seen.
+
+        Return:
+            List[tuple]: Arguments (args, kwds) of every coalesced execution.
+        """
+        executions = {} # by sender id, senders are kept alive by _calls
+
+        for args, kwds in self._calls:
+            sender_id = id(args[0]) if args else None
+
+            if self._mode == "last":
+                executions[sender_id] = (args, kwds)
+            else:
+                executions.setdefault(sender_id, (args[0] if args else None, []))[1].append(args[1])
+
+        if self._mode == "last":
+            return list(executions.values())
+
+        return [((sender, CoalescedEventArgs(events)), {}) for sender, events in executions.values()]
+
+
+class WeakDelegate(Delegate[T]):
+    """
+    WeakDelegate is a Delegate that does not keep its callables alive, in this way a subscriber that is not referenced anywhere else
+    can be collected even if it never unsubscribed from the delegate.
+
+    Bound methods are stored as WeakMethod, any other callable as a weak reference (callables that do not support weak references are
+    stored as strong references). Callables that are already collected are removed from the collection the next time the delegate is executed.
+
+    Keep in mind a callable only referenced by the delegate (like a lambda created in the same line it is added) is collected right away.
+
+    Attributes:
+        _callables (Dict[int, Callable[[], Callable | None]]): Stores a collection of references to Callables in insertion order, by key.
+        _index (Dict[Callable[[], Callable | None], List[int]]): Stores the keys (in insertion order) of every reference in the collection.
+    """
+    _callables:Dict[int, Callable[[], Callable | None]]
+    _index:Dict[Callable[[], Callable | None], List[int]]
+
+    def __iadd__(self, value:Callable[..., T])->"WeakDelegate":
+        """
+        Implements the addition of a callable (as a weak reference) into the callable collection.
+
+        Parameters:
+            value (Callable[..., T]): callable to be added to the collection of callables.
+
+        Return:
+            WeakDelegate: Current instance with the extra callable.
+        """
+        return super().__iadd__(_weak_reference(value))
+
+    def subscribe(self, value:Callable[..., T], priority:int = 0, predicate:Callable[..., bool] | None = None)->"Subscription":
+        """
+        Adds a callable (as a weak reference) into the callable collection with a priority and/or a predicate (see Delegate.subscribe).
+
+        Parameters:
+            value (Callable[..., T]): callable to be added to the collection of callables.
+            priority (int): Execution priority of the callable, higher first.
+            predicate (Callable[..., bool] | None): Decides if the callable is executed, None to execute it always.
+
+        Return:
+            Subscription: Handle removing exactly this callable (without searching it) when it is unsubscribed.
+        """
+        return super().subscribe(_weak_reference(value), priority, predicate)
+
+    def subscribe_many(self, values:Iterable[Callable[..., T]], priority:int = 0, predicate:Callable[..., bool] | None = None)->List["Subscription"]:
+        """
+        Adds several callables (as weak references) into the callable collection in one operation (see Delegate.subscribe_many).
+
+        Parameters:
+            values (Iterable[Callable[..., T]]): callables to be added to the collection of callables, in order.
+            priority (int): Execution priority of the callables, higher first.
+            predicate (Callable[..., bool] | None): Decides if the callables are executed, None to execute them always.
+
+        Return:
+            List[Subscription]: Handle of every callable, in order.
+        """
+        return super().subscribe_many([_weak_reference(value) for value in values], priority, predicate)
+
+    def _owned_keys(self, owners:set)->List[int]:
+        """
+        Searches the keys of the callables (not collected yet) belonging to any of the owners (see Delegate.unsubscribe_all), the lock must
+        be held by the caller.
+
+        Parameters:
+            owners (set): ids of the owners.
+
+        Return:
+            List[int]: Keys of the callables.
+        """
+        return [key for key, reference in self._callables.items() if _owned_by(reference(), owners)]
+
+    def __isub__(self, value:Callable[..., T])->"WeakDelegate":
+        """
+        Implements the subtraction of a callable into the callable collection.
+        If the callable was added more than once, its last occurrence is removed (same as C# delegates).
+
+        Parameters:
+            value (Callable[..., T]): callable to be subtracted to the collection of callables.
+
+        Return:
+            WeakDelegate: Current instance with without the passed callable.
+
+        Raises:
+            ValueError: The callable is not in the collection of callables.
+        """
+        try:
+            return super().__isub__(_weak_reference(value))
+        except ValueError:
+            raise ValueError("%s is not in the delegate" % (value,)) from None
+
+    def _batch_entry(self, callable:Callable[..., Any])->Callable[[], Callable]:
+        """
+        Converts a callable into an item of the snapshot (the only item of the snapshot used while batching).
+
+        Parameters:
+            callable (Callable[..., Any]): callable to convert.
+
+        Return:
+            Callable[[], Callable]: strong reference to the callable.
+        """
+        return _StrongReference(callable)
+
+    def _instrumented_entry(self, reference:Callable[[], Callable | None], stats:"DispatchStats")->Callable[[], Callable | None]:
+        """
+        Converts an item of the snapshot (reference) into an instrumented item.
+
+        Parameters:
+            reference (Callable[[], Callable | None]): snapshot item.
+            stats (DispatchStats): Statistics of the delegate.
+
+        Return:
+            Callable[[], Callable | None]: reference returning the instrumented callable.
+        """
+        return _InstrumentedReference(reference, stats._handler(reference() or reference))
+
+    def _prune(self)->None:
+        """
+        Removes the references of collected callables from the callable collection.
+
+        Return:
+            None
+        """
+        with self._lock:
+            self._callables = {key: reference for key, reference in self._callables.items() if reference() is not None}
+            self._index = {reference: keys for reference, keys in self._index.items() if reference() is not None}
+            self._options = {key: options for key, options in self._options.items() if key in self._callables}
+            self._invocation = None
+            self._plan = None
+
+    def __call__(self, *args:Any, **kwds:Any)->List[T]:
+        """
+        Allows the WeakDelegate instance to be called as a function.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            List[T]: A list of the results of every callable (not collected yet) in the callable collection.
+        """
+        references = self._invocation
+
+        if references is None:
+            references = self._snapshot(args, kwds)
+
+        results = []
+        collected = False
+        remaining = iter(references)
+
+        try:
+            for reference in remaining:
+                callable = reference()
+
+                if callable is None:
+                    collected = True
+                else:
+                    results.append(callable(*args, **kwds))
+        except Exception as exception:
+            if self._errors == "raise_first":
+                raise
+            failure = exception
+        else:
+            if collected:
+                self._prune()
+
+            return tuple(results)
+
+        return self._continue(failure, remaining, results, args, kwds)
+
+    def invoke(self, *args:Any, **kwds:Any)->None:
+        """
+        Executes every callable (not collected yet) in the callable collection discarding its results (fire-and-forget).
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            None
+        """
+        references = self._invocation
+
+        if references is None:
+            references = self._snapshot(args, kwds)
+
+        collected = False
+        remaining = iter(references)
+
+        try:
+            for reference in remaining:
+                callable = reference()
+
+                if callable is None:
+                    collected = True
+                else:
+                    callable(*args, **kwds)
+        except Exception as exception:
+            if self._errors == "raise_first":
+                raise
+            failure = exception
+        else:
+            if collected:
+                self._prune()
+            return
+
+        self._continue(failure, remaining, None, args, kwds)
+
+    def invoke_iter(self, *args:Any, **kwds:Any)->Iterator[T]:
+        """
+        Executes the callables (not collected yet) in the callable collection lazily (see Delegate.invoke_iter).
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            Iterator[T]: Generator of the results of the callables, in execution order.
+        """
+        references = self._invocation
+
+        if references is None:
+            references = self._snapshot(args, kwds)
+
+        collected = False
+
+        try:
+            for reference in references:
+                callable = reference()
+
+                if callable is None:
+                    collected = True
+                else:
+                    yield callable(*args, **kwds)
+        finally:
+            if collected:
+                self._prune()
+
+    def _continue(self, exception:Exception, remaining:Iterator[Callable[[], Callable | None]], results:List[Any] | None, args:tuple, kwds:Dict[str, Any])->tuple | None:
+        """
+        Applies the error policy after a callable raised an exception (see Delegate._continue), references of collected callables are pruned.
+
+        Parameters:
+            exception (Exception): Exception raised by the failing callable.
+            remaining (Iterator[Callable[[], Callable | None]]): references to the callables after the failing callable.
+            results (List[Any] | None): Results of the callables before the failing callable, None if the results are discarded (invoke).
+            args (tuple): Positional arguments of the execution.
+            kwds (Dict[str, Any]): Named arguments of the execution.
+
+        Return:
+            tuple | None: Results of every callable (None for the failing callables), None if the results are discarded.
+
+        Raises:
+            ExceptionGroup: The error policy is "continue_and_aggregate".
+        """
+        callables = [callable for callable in (reference() for reference in remaining) if callable is not None]
+        self._prune()
+        return super()._continue(exception, iter(callables), results, args, kwds)
+
+
+class AsyncDelegate(Delegate[T]):
+    """
+    AsyncDelegate is a Delegate whose callables are coroutine functions, executing the delegate (await delegate(...)) calls every callable
+    and awaits all the returned awaitables concurrently, so the time needed to execute the delegate is close to the time of the slowest callable
+    instead of the sum of the time of every callable.
+
+    Callables returning a value that is not awaitable (regular functions) are supported as well, their value is used as result.
+    The rest of the Delegate API is asynchronous too: batch is an asynchronous context manager, invoke_iter an asynchronous generator and
+    collect a coroutine, and instrument records the time until the awaitable of every callable finished.
+
+    Attributes:
+        _timeout (float | None): Maximum time in seconds to wait for every callable, None to wait without limit.
+    """
+    _timeout:float | None
+
+    def __init__(self,callable:Callable[..., T] | None = None, timeout:float | None = None, errors:str = "raise_first")->None:
+        """
+        AsyncDelegate constructor.
+
+        Parameters:
+            callable (Callable[..., T] | None): first callable to be added to the collection of callables.
+            timeout (float | None): Maximum time in seconds to wait for every callable, None to wait without limit.
+                When a callable exceeds it asyncio.TimeoutError is raised by the delegate.
+            errors (str): Error policy (see Delegate constructor), applied to the exceptions raised while the callables are awaited.
+
+        Return:
+            None
+
+        Raises:
+            ValueError: errors is not a valid error policy.
+        """
+        super().__init__(callable, errors)
+        self._timeout = timeout
+
+    async def __call__(self, *args:Any, **kwds:Any)->List[T]:
+        """
+        Allows the AsyncDelegate instance to be called (and awaited) as a coroutine function.
+        If a callable raises an exception, the exception is raised by the delegate, the rest of the callables are not cancelled.
+        A callable raising while it is called (before returning its awaitable) is handled by the error policy too: with "raise_first" the
+        coroutines already created are closed without being awaited and the exception is raised, otherwise the rest of the callables are
+        called and awaited and the exception is aggregated or logged with the exceptions raised while awaiting.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            List[T]: A list of the results of every callable in the callable collection, in the order the callables were added.
+        """
+        callables = self._invocation
+
+        if callables is None:
+            callables = self._snapshot(args, kwds)
+
+        isolated = self._errors != "raise_first"
+        failed = None
+        results = []
+
+        for callable in callables:
+            try:
+                results.append(callable(*args, **kwds))
+            except Exception as exception:
+                if not isolated:
+                    _close_coroutines(results)
+                    raise
+
+                if failed is None:
+                    failed = {}
+
+                failed[len(results)] = exception
+                results.append(None)
+
+        pending = [index for index, result in enumerate(results) if isawaitable(result)]
+
+        if pending:
+            timeout = self._timeout
+
+            if timeout is None:
+                values = await asyncio.gather(*[results[index] for index in pending], return_exceptions=isolated)
+            else:
+                values = await asyncio.gather(*[asyncio.wait_for(results[index], timeout) for index in pending], return_exceptions=isolated)
+
+            for index, value in zip(pending, values):
+                if isolated and isinstance(value, BaseException):
+                    if not isinstance(value, Exception): # cancellation is not isolated
+                        raise value
+
+                    if failed is None:
+                        failed = {}
+
+                    failed[index] = value
+                    value = None
+
+                results[index] = value
+
+        if failed:
+            self._raise_or_log([failed[index] for index in sorted(failed)])
+
+        return tuple(results)
+
+    async def invoke(self, *args:Any, **kwds:Any)->None:
+        """
+        Executes (and awaits) every callable in the callable collection discarding its results (fire-and-forget).
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            None
+        """
+        await self(*args, **kwds)
+
+    @asynccontextmanager
+    async def batch(self, mode:str = "last")->AsyncIterator[None]:
+        """
+        Returns an asynchronous context manager that buffers the executions of the delegate until the context exits (see Delegate.batch),
+        then the coalesced executions are awaited one after another:
+
+            async with delegate.batch():
+                await delegate(sender, e) # buffered, returns a tuple containing None
+
+        Parameters:
+            mode (str): How the buffered executions are coalesced, "last" or "merge".
+
+        Return:
+            AsyncIterator[None]: asynchronous context manager.
+
+        Raises:
+            ValueError: mode is not valid or it is different to the mode of the active batch.
+        """
+        batch = self._begin_batch(mode)
+
+        try:
+            yield
+        finally:
+            for args, kwds in self._end_batch(batch):
+                await self(*args, **kwds)
+
+    async def invoke_iter(self, *args:Any, **kwds:Any)->AsyncIterator[T]:
+        """
+        Executes the callables lazily, returns an asynchronous generator that calls and awaits the next callable every time a result is
+        requested (async for), so callables are awaited one after another instead of concurrently. Exceptions raised by the callables are
+        raised by the generator (the error policy is not applied), the timeout is applied to every callable.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            AsyncIterator[T]: Asynchronous generator of the results of the callables, in execution order.
+        """
+        callables = self._invocation
+
+        if callables is None:
+            callables = self._snapshot(args, kwds)
+
+        timeout = self._timeout
+
+        for callable in callables:
+            result = callable(*args, **kwds)
+
+            if isawaitable(result):
+                result = await (result if timeout is None else asyncio.wait_for(result, timeout))
+
+            yield result
+
+    async def collect(self, reducer:Callable[[Iterator[T]], Any], *args:Any, **kwds:Any)->Any:
+        """
+        Executes the delegate (awaiting every callable concurrently) and reduces its results with a reducer (see Delegate.collect). The
+        reducer can not stop the callables, they are already awaited, use invoke_iter to await them lazily one after another.
+
+        Parameters:
+            reducer (Callable[[Iterator[T]], Any]): function reducing the results.
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            Any: Value returned by the reducer.
+        """
+        return reducer(iter(await self(*args, **kwds)))
+
+    def _instrumented_entry(self, callable:Callable[..., Any], stats:"DispatchStats")->Any:
+        """
+        Converts an item of the snapshot into an instrumented item, whose durations include the time its awaitable is awaited.
+
+        Parameters:
+            callable (Callable[..., Any]): snapshot item.
+            stats (DispatchStats): Statistics of the delegate.
+
+        Return:
+            Any: instrumented snapshot item.
+        """
+        return _InstrumentedAsyncCallable(callable, stats._handler(callable))
+
+
+def _close_coroutines(results:List[Any])->None:
+    """
+    Closes the coroutines returned by the callables of an AsyncDelegate that will not be awaited (another callable raised an exception
+    before they were awaited), so they are not reported as never awaited.
+
+    Parameters:
+        results (List[Any]): Values returned by the callables.
+
+    Return:
+        None
+    """
+    for result in results:
+        if asyncio.iscoroutine(result):
+            result.close()
+
+
+class ExecutorDelegate(Delegate[T]):
+    """
+    ExecutorDelegate is a Delegate that executes its callables through an executor (concurrent.futures.Executor), in this way the callables of one
+    execution run in parallel, across threads with a ThreadPoolExecutor (I/O bound callables) or across cores with a ProcessPoolExecutor (CPU bound callables).
+    Without executor (inline) callables are executed in the calling thread, the same as a Delegate.
+
+    Results are always returned in the order the callables were added. When callables raise exceptions, all callables are executed anyway
+    and the exception of the first failing callable (in the order the callables were added) is raised once all of them finished.
+
+    Keep in mind a ProcessPoolExecutor requires callables and arguments that can be pickled (functions defined at module level), and a bound
+    method is executed over a copy of its object in the other process.
+
+    While batching the executions are buffered in the calling thread (the buffering callable is never submitted), and an instrumented
+    ExecutorDelegate submits the callables themselves and records every callable from its submission until its future is done.
+
+    Attributes:
+        _executor (Executor | None): Executor used to execute the callables, None to execute them inline.
+    """
+    _executor:Executor | None
+
+    def __init__(self,callable:Callable[..., T] | None = None, executor:Executor | None = None, errors:str = "raise_first")->None:
+        """
+        ExecutorDelegate constructor.
+
+        Parameters:
+            callable (Callable[..., T] | None): first callable to be added to the collection of callables.
+            executor (Executor | None): Executor used to execute the callables, None to execute them inline (in the calling thread).
+            errors (str): Error policy (see Delegate constructor), every callable is executed anyway, so "raise_first" raises the
+                exception of the first failing callable once all of them finished.
+
+        Return:
+            None
+
+        Raises:
+            ValueError: errors is not a valid error policy.
+        """
+        super().__init__(callable, errors)
+        self._executor = executor
+
+    def submit(self, *args:Any, **kwds:Any)->tuple:
+        """
+        Submits every callable in the callable collection to the executor without waiting for them.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            tuple: A tuple of Future objects (concurrent.futures.Future), one for every callable, in the order the callables were added.
+        """
+        callables = self._invocation
+
+        if callables is None:
+            callables = self._snapshot(args, kwds)
+
+        executor = self._executor
+
+        if executor is not None and not _batching(callables): # the buffering callable of a batch is executed inline
+            futures = []
+
+            for callable in callables:
+                if callable.__class__ is _InstrumentedCallable: # the callable is submitted, the stats stay in this process
+                    future = executor.submit(callable._callable, *args, **kwds)
+                    future.add_done_callback(_record_future(callable._stats, perf_counter()))
+                else:
+                    future = executor.submit(callable, *args, **kwds)
+
+                futures.append(future)
+
+            return tuple(futures)
+
+        futures = []
+
+        for callable in callables:
+            future = Future()
+
+            try:
+                future.set_result(callable(*args, **kwds))
+            except Exception as exception:
+                future.set_exception(exception)
+
+            futures.append(future)
+
+        return tuple(futures)
+
+    def __call__(self, *args:Any, **kwds:Any)->List[T]:
+        """
+        Allows the ExecutorDelegate instance to be called as a function, waits until every callable finished.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            List[T]: A list of the results of every callable in the callable collection, in the order the callables were added.
+        """
+        return self._results(self.submit(*args, **kwds))
+
+    def _results(self, futures:tuple)->tuple:
+        """
+        Waits until every submitted callable finished and applies the error policy.
+
+        Parameters:
+            futures (tuple): Futures of the callables (see submit).
+
+        Return:
+            tuple: Results of every callable (None for the failing callables), in the order the callables were added.
+        """
+        exceptions = [exception for exception in [future.exception() for future in futures] if exception is not None] # waits for every callable
+
+        if exceptions:
+            if self._errors == "raise_first":
+                raise exceptions[0]
+
+            self._raise_or_log(exceptions)
+            return tuple([None if future.exception() is not None else future.result() for future in futures])
+
+        return tuple([future.result() for future in futures])
+
+    def invoke(self, *args:Any, **kwds:Any)->None:
+        """
+        Executes every callable in the callable collection through the executor discarding its results, waits until every callable finished.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            None
+        """
+        self._results(self.submit(*args, **kwds)) # not self(...), an instrumented delegate would record the execution twice
+
+    def invoke_iter(self, *args:Any, **kwds:Any)->Iterator[T]:
+        """
+        Submits every callable to the executor and returns a generator waiting for its results one by one, in the order the callables were
+        added (see Delegate.invoke_iter). The callables run in parallel, so they are not executed lazily, but when the generator is closed
+        before its end (collect, for example) the callables that did not start yet are cancelled. Exceptions raised by the callables are
+        raised by the generator (the error policy is not applied).
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            Iterator[T]: Generator of the results of the callables, in the order the callables were added.
+        """
+        futures = self.submit(*args, **kwds)
+
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _batching(callables:tuple)->bool:
+    """
+    Checks if a snapshot is the snapshot of an active batch (see Delegate.batch), its only callable buffers the execution.
+
+    Parameters:
+        callables (tuple): Snapshot of a delegate.
+
+    Return:
+        bool: True if the snapshot buffers the execution.
+    """
+    return len(callables) == 1 and getattr(callables[0], "__self__", None).__class__ is _Batch
+
+
+def _record_future(stats:"DispatchStats", start:float)->Callable[[Future], None]:
+    """
+    Creates the callback recording the execution of an instrumented callable submitted to an executor, when its future is done.
+
+    Parameters:
+        stats (DispatchStats): Statistics of the callable.
+        start (float): perf_counter value when the callable was submitted.
+
+    Return:
+        Callable[[Future], None]: Callback of the future, the duration includes the time the callable waited for a worker.
+    """
+    def record(future:Future)->None:
+        stats._record(perf_counter() - start, None if future.cancelled() else future.exception())
+
+    return record
+
+
+class QueuedDelegate(Delegate[T]):
+    """
+    QueuedDelegate is a Delegate whose executions are deferred: executing the delegate only enqueues its arguments into a bounded queue, and a
+    dispatcher thread drains the queue in batches executing the callables, in this way the cost of the callables is taken out of the thread
+    executing the delegate (raising the event). Executions are dispatched in the order they were enqueued, with the callables of the delegate
+    at dispatch time (+=, -= and subscribe work the same as Delegate).
+
+    When the queue is full the overflow policy decides what happens:
+        - "block": the execution waits until the queue has space (backpressure on the producer).
+        - "drop_oldest": the oldest queued execution is discarded.
+        - "drop_newest": the new execution is discarded.
+
+    The dispatcher thread is started with the first execution, it is a daemon thread, so call join before exiting to dispatch the queued executions.
+    Exceptions raised by the callables can not be raised to the producer, they are handled by the error policy and then logged by the dispatcher.
+    The results of the callables are discarded, so invoke_iter and collect are not available, and batch coalesces the executions before
+    they are enqueued.
+
+    Attributes:
+        _queue (deque): Arguments (args, kwds) of the queued executions.
+        _maxsize (int): Maximum number of queued executions.
+        _overflow (str): Overflow policy, "block", "drop_oldest" or "drop_newest".
+        _mutex (threading.Lock): Serializes the access to the queue.
+        _not_empty (threading.Condition): Notified when an execution is enqueued into an empty queue.
+        _not_full (threading.Condition): Notified when the dispatcher takes the queued executions.
+        _all_done (threading.Condition): Notified when every queued execution was dispatched.
+        _unfinished (int): Number of executions queued or being dispatched.
+        _dropped (int): Number of executions discarded by the overflow policy.
+        _dispatcher (threading.Thread | None): Dispatcher thread, None if it was not started yet.
+        _closed (bool): True when the delegate does not accept more executions (see join method).
+        _buffered (_Batch | None): Active batch buffering the executions, None when not batching (see batch).
+    """
+    _queue:deque
+    _maxsize:int
+    _overflow:str
+    _mutex:threading.Lock
+    _not_empty:threading.Condition
+    _not_full:threading.Condition
+    _all_done:threading.Condition
+    _unfinished:int
+    _dropped:int
+    _dispatcher:threading.Thread | None
+    _closed:bool
+    _buffered:"_Batch | None"
+
+    def __init__(self, callable:Callable[..., T] | None = None, maxsize:int = 1024, overflow:str = "block", errors:str = "log_and_continue")->None:
+        """
+        QueuedDelegate constructor.
+
+        Parameters:
+            callable (Callable[..., T] | None): first callable to be added to the collection of callables.
+            maxsize (int): Maximum number of queued executions.
+            overflow (str): What happens when the queue is full, "block", "drop_oldest" or "drop_newest".
+            errors (str): Error policy of every dispatched execution (see Delegate constructor).
+
+        Return:
+            None
+
+        Raises:
+            ValueError: overflow is not a valid overflow policy or maxsize is not positive.
+        """
+        if overflow not in ("block", "drop_oldest", "drop_newest"):
+            raise ValueError("overflow must be 'block', 'drop_oldest' or 'drop_newest', not %r" % (overflow,))
+
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive, not %r" % (maxsize,))
+
+        super().__init__(callable, errors)
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._queue = deque(maxlen=maxsize if overflow == "drop_oldest" else None)
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._all_done = threading.Condition(self._mutex)
+        self._unfinished = 0
+        self._dropped = 0
+        self._dispatcher = None
+        self._closed = False
+        self._buffered = None
+
+    @property
+    def dropped(self)->int:
+        """
+        Number of executions discarded by the overflow policy.
+        """
+        return self._dropped
+
+    def __call__(self, *args:Any, **kwds:Any)->None:
+        """
+        Enqueues an execution of the delegate, the callables are executed later by the dispatcher thread.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            None
+
+        Raises:
+            RuntimeError: The delegate is closed (see join method).
+        """
+        self._enqueue(args, kwds)
+
+    def _enqueue(self, args:tuple, kwds:Dict[str, Any])->None:
+        """
+        Enqueues an execution of the delegate (buffers it while batching), applying the overflow policy.
+
+        Parameters:
+            args (tuple): Positional arguments of the execution.
+            kwds (Dict[str, Any]): Named arguments of the execution.
+
+        Return:
+            None
+
+        Raises:
+            RuntimeError: The delegate is closed (see join method).
+        """
+        with self._mutex:
+            if self._closed:
+                raise RuntimeError("QueuedDelegate is closed")
+
+            if self._buffered is not None:
+                self._buffered._calls.append((args, kwds))
+                return
+
+            queue = self._queue
+
+            if len(queue) >= self._maxsize:
+                overflow = self._overflow
+
+                if overflow == "block":
+                    while len(self._queue) >= self._maxsize and not self._closed:
+                        self._not_full.wait()
+
+                    if self._closed:
+                        raise RuntimeError("QueuedDelegate is closed")
+
+                    queue = self._queue
+                elif overflow == "drop_newest":
+                    self._dropped += 1
+                    return
+                else: # the deque discards the oldest execution
+                    self._dropped += 1
+                    self._unfinished -= 1
+
+            queue.append((args, kwds))
+            self._unfinished += 1
+
+            if len(queue) == 1:
+                if self._dispatcher is None:
+                    self._dispatcher = threading.Thread(target=self._dispatch, name="QueuedDelegate dispatcher", daemon=True)
+                    self._dispatcher.start()
+
+                self._not_empty.notify()
+
+    def invoke(self, *args:Any, **kwds:Any)->None:
+        """
+        Enqueues an execution of the delegate (same as calling it).
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable in the callable collection.
+            **kwds: A variable number of named arguments that are going to be pass to every callable in the callable collection (keyword arguments).
+
+        Return:
+            None
+
+        Raises:
+            RuntimeError: The delegate is closed (see join method).
+        """
+        self._enqueue(args, kwds) # not self(...), a recorded or instrumented delegate would record the execution twice
+
+    def _dispatch(self)->None:
+        """
+        Dispatcher thread loop, takes all the queued executions at once and executes the callables for every one of them.
+
+        Return:
+            None
+        """
+        while True:
+            with self._mutex:
+                while not self._queue and not self._closed:
+                    self._not_empty.wait()
+
+                batch = self._queue
+
+                if not batch: # closed and drained
+                    return
+
+                self._queue = deque(maxlen=batch.maxlen)
+                self._not_full.notify_all()
+
+            for args, kwds in batch:
+                try:
+                    Delegate.invoke(self, *args, **kwds)
+                except Exception:
+                    _logger.exception("exception raised by a callable of a QueuedDelegate")
+
+            with self._mutex:
+                self._unfinished -= len(batch)
+
+                if self._unfinished == 0:
+                    self._all_done.notify_all()
+
+    def flush(self, timeout:float | None = None)->bool:
+        """
+        Waits until every queued execution was dispatched.
+
+        Parameters:
+            timeout (float | None): Maximum time to wait in seconds, None to wait without limit.
+
+        Return:
+            bool: True if every queued execution was dispatched, False if the timeout expired.
+
+        Raises:
+            RuntimeError: flush is called from the dispatcher thread (by a callable of the delegate).
+        """
+        if threading.current_thread() is self._dispatcher:
+            raise RuntimeError("flush can not be called by a callable of the QueuedDelegate")
+
+        with self._mutex:
+            return self._all_done.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def join(self, timeout:float | None = None)->bool:
+        """
+        Closes the delegate (next executions raise RuntimeError), dispatches the queued executions and stops the dispatcher thread.
+
+        Parameters:
+            timeout (float | None): Maximum time to wait in seconds, None to wait without limit.
+
+        Return:
+            bool: True if the dispatcher thread stopped, False if the timeout expired.
+
+        Raises:
+            RuntimeError: join is called from the dispatcher thread (by a callable of the delegate).
+        """
+        if threading.current_thread() is self._dispatcher:
+            raise RuntimeError("join can not be called by a callable of the QueuedDelegate")
+
+        with self._mutex:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+            dispatcher = self._dispatcher
+
+        if dispatcher is not None:
+            dispatcher.join(timeout)
+            return not dispatcher.is_alive()
+
+        return True
+
+    @contextmanager
+    def batch(self, mode:str = "last")->Iterator[None]:
+        """
+        Returns a context manager that buffers the executions of the delegate (instead of enqueuing them) until the context exits, then the
+        coalesced executions are enqueued (see Delegate.batch). Executions enqueued before the context are dispatched as usual.
+
+        Parameters:
+            mode (str): How the buffered executions are coalesced, "last" or "merge".
+
+        Return:
+            Iterator[None]: context manager.
+
+        Raises:
+            ValueError: mode is not valid or it is different to the mode of the active batch.
+        """
+        if mode not in ("last", "merge"):
+            raise ValueError("batch mode must be 'last' or 'merge', not %r" % (mode,))
+
+        with self._mutex:
+            batch = self._buffered
+
+            if batch is None:
+                batch = self._buffered = _Batch(mode)
+            elif batch._mode != mode:
+                raise ValueError("batch mode %r does not match the mode of the active batch %r" % (mode, batch._mode))
+
+            batch._depth += 1
+
+        try:
+            yield
+        finally:
+            with self._mutex:
+                batch._depth -= 1
+                finished = batch._depth == 0
+
+                if finished:
+                    self._buffered = None
+
+            if finished:
+                for args, kwds in batch.coalesce():
+                    self(*args, **kwds)
+
+    invoke_iter = _Unsupported("the callables are executed later by the dispatcher thread, their results are discarded")
+    collect = _Unsupported("the callables are executed later by the dispatcher thread, their results are discarded")
+
+
+class _TimerThread:
+    """
+    _TimerThread is a class that represents the timer shared by every timed operator without event loop (see debounce): a single daemon thread
+    sleeps until the earliest scheduled deadline and executes the callbacks that are due, so thousands of pending operators only need one thread
+    and one heap entry each.
+
+    Callbacks are executed one after another by the timer thread, a slow callback delays the callbacks scheduled after it.
+
+    Attributes:
+        _heap (List[tuple]): (deadline, sequence, callback) of the scheduled callbacks, earliest deadline first.
+        _mutex (threading.Lock): Serializes the access to the heap.
+        _wakeup (threading.Condition): Notified when a callback is scheduled before the earliest deadline.
+        _sequence (Iterator[int]): Breaks the ties of equal deadlines, callbacks are executed in the order they were scheduled.
+        _thread (threading.Thread | None): Timer thread, None if it was not started yet.
+    """
+    __slots__ = ("_heap", "_mutex", "_wakeup", "_sequence", "_thread")
+
+    _heap:List[tuple]
+    _mutex:threading.Lock
+    _wakeup:threading.Condition
+    _sequence:Iterator[int]
+    _thread:threading.Thread | None
+
+    def __init__(self)->None:
+        """
+        _TimerThread constructor, the thread is started with the first scheduled callback.
+
+        Return:
+            None
+        """
+        self._heap = []
+        self._mutex = threading.Lock()
+        self._wakeup = threading.Condition(self._mutex)
+        self._sequence = count()
+        self._thread = None
+
+    def schedule(self, deadline:float, callback:Callable[[], None])->None:
+        """
+        Schedules a callback.
+
+        Parameters:
+            deadline (float): time.monotonic() value at which the callback is executed.
+            callback (Callable[[], None]): callable to execute.
+
+        Return:
+            None
+        """
+        with self._mutex:
+            heap = self._heap
+            heappush(heap, (deadline, next(self._sequence), callback))
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="python_sharp timer", daemon=True)
+                self._thread.start()
+            elif heap[0][2] is callback: # earlier than the deadline the thread is waiting for
+                self._wakeup.notify()
+
+    def _run(self)->None:
+        """
+        Timer thread loop, executes the due callbacks and waits for the next deadline.
+
+        Return:
+            None
+        """
+        heap = self._heap
+
+        while True:
+            with self._mutex:
+                while True:
+                    if not heap:
+                        self._wakeup.wait()
+                        continue
+
+                    now = monotonic()
+                    delay = heap[0][0] - now
+
+                    if delay <= 0:
+                        break
+
+                    self._wakeup.wait(delay)
+
+                due = []
+                while heap and heap[0][0] <= now:
+                    due.append(heappop(heap)[2])
+
+            for callback in due:
+                try:
+                    callback()
+                except Exception:
+                    _logger.exception("exception raised by a timed operator")
+
+            due = callback = None # the fired operators (and their handlers) are not kept alive while waiting
+
+
+class _LoopTimer:
+    """
+    _LoopTimer is a class that represents the timer of the timed operators running on an asyncio event loop (see debounce): callbacks are
+    scheduled with loop.call_at, from any thread.
+
+    Attributes:
+        _loop (asyncio.AbstractEventLoop): Event loop executing the callbacks.
+    """
+    __slots__ = ("_loop",)
+
+    _loop:asyncio.AbstractEventLoop
+
+    def __init__(self, loop:asyncio.AbstractEventLoop)->None:
+        """
+        _LoopTimer constructor.
+
+        Parameters:
+            loop (asyncio.AbstractEventLoop): Event loop executing the callbacks.
+
+        Return:
+            None
+        """
+        self._loop = loop
+
+    def schedule(self, deadline:float, callback:Callable[[], None])->None:
+        """
+        Schedules a callback.
+
+        Parameters:
+            deadline (float): time.monotonic() value at which the callback is executed.
+            callback (Callable[[], None]): callable to execute.
+
+        Return:
+            None
+        """
+        loop = self._loop
+        when = loop.time() + deadline - monotonic()
+
+        if _running_loop() is loop:
+            loop.call_at(when, callback)
+        else:
+            loop.call_soon_threadsafe(loop.call_at, when, callback)
+
+
+def _running_loop()->asyncio.AbstractEventLoop | None:
+    """
+    Gets the event loop running in the current thread.
+
+    Return:
+        asyncio.AbstractEventLoop | None: Running event loop, None if the thread is not running one.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+_timer = _TimerThread()
+
+
+class _TimedOperator(ABC):
+    """
+    _TimedOperator is the base class of the subscribers that decide when a handler is executed based on time (see debounce, throttle, sample
+    and rate_limit). Executions are deferred with a timer shared by every operator, the timer thread, or the event loop of the operator.
+
+    The operators are compared by identity, keep the operator to unsubscribe it. They belong to the owner of the handler (see
+    Delegate.unsubscribe_all).
+
+    Attributes:
+        _handler (Callable[..., Any]): Handler whose executions are controlled.
+        _timer (_TimerThread | _LoopTimer): Timer executing the deferred executions.
+        _loop (asyncio.AbstractEventLoop | None): Event loop executing the deferred executions, None to use the timer thread.
+        _lock (threading.Lock): Serializes the access to the state of the operator.
+        _armed (bool): True if the timer has a callback of the operator scheduled.
+    """
+    __slots__ = ("_handler", "_timer", "_loop", "_lock", "_armed")
+
+    _handler:Callable[..., Any]
+    _timer:"_TimerThread | _LoopTimer"
+    _loop:asyncio.AbstractEventLoop | None
+    _lock:threading.Lock
+    _armed:bool
+
+    def __init__(self, handler:Callable[..., Any], loop:asyncio.AbstractEventLoop | None)->None:
+        """
+        _TimedOperator constructor.
+
+        Parameters:
+            handler (Callable[..., Any]): Handler whose executions are controlled.
+            loop (asyncio.AbstractEventLoop | None): Event loop executing the deferred executions, None to use the timer thread.
+
+        Return:
+            None
+
+        Raises:
+            TypeError: handler is a coroutine function and loop is None.
+        """
+        if loop is None and iscoroutinefunction(handler):
+            raise TypeError("%s is a coroutine function, its operator needs an event loop" % (handler,))
+
+        self._handler = handler
+        self._loop = loop
+        self._timer = _timer if loop is None else _LoopTimer(loop)
+        self._lock = threading.Lock()
+        self._armed = False
+
+    @property
+    def __self__(self)->Any:
+        """
+        Gets the owner of the handler (see Delegate.unsubscribe_all).
+
+        Return:
+            Any: object the handler is bound to, None if it is not a bound method.
+        """
+        return getattr(self._handler, "__self__", None)
+
+    @property
+    def pending(self)->int:
+        """
+        Number of deferred executions.
+        """
+        with self._lock:
+            return len(self._calls())
+
+    def flush(self)->int:
+        """
+        Executes the deferred executions now, in the calling thread.
+
+        Return:
+            int: Number of executions.
+        """
+        with self._lock:
+            calls = self._calls()
+            self._clear()
+
+        for args, kwds in calls:
+            self._execute(args, kwds)
+
+        return len(calls)
+
+    def cancel(self)->int:
+        """
+        Discards the deferred executions.
+
+        Return:
+            int: Number of executions discarded.
+        """
+        with self._lock:
+            calls = self._calls()
+            self._clear()
+
+        return len(calls)
+
+    def _arm(self, deadline:float)->None:
+        """
+        Schedules the timer callback of the operator, if it is not scheduled yet. Called holding _lock.
+
+        Parameters:
+            deadline (float): time.monotonic() value at which the callback is executed.
+
+        Return:
+            None
+        """
+        if not self._armed:
+            self._armed = True
+            self._timer.schedule(deadline, self._fire)
+
+    def _execute(self, args:tuple, kwds:Dict[str, Any])->None:
+        """
+        Executes the handler, awaitables returned by the handler are scheduled as tasks of the event loop.
+
+        Parameters:
+            args (tuple): positional arguments of the execution.
+            kwds (Dict[str, Any]): named arguments of the execution.
+
+        Return:
+            None
+        """
+        result = self._handler(*args, **kwds)
+
+        if self._loop is not None and isawaitable(result):
+            if _running_loop() is self._loop:
+                asyncio.ensure_future(result)
+            else:
+                asyncio.run_coroutine_threadsafe(result, self._loop)
+
+    @abstractmethod
+    def _calls(self)->List[tuple]:
+        """
+        Gets the (args, kwds) of the deferred executions. Called holding _lock.
+        """
+
+    @abstractmethod
+    def _clear(self)->None:
+        """
+        Discards the deferred executions. Called holding _lock.
+        """
+
+    @abstractmethod
+    def _fire(self)->None:
+        """
+        Timer callback of the operator.
+        """
+
+
+class _LatestOperator(_TimedOperator):
+    """
+    _LatestOperator is the base class of the timed operators that defer only the latest execution (see debounce, throttle and sample).
+
+    Attributes:
+        _pending (tuple | None): (args, kwds) of the latest execution, None if there is not a deferred execution.
+    """
+    __slots__ = ("_pending",)
+
+    _pending:tuple | None
+
+    def __init__(self, handler:Callable[..., Any], loop:asyncio.AbstractEventLoop | None)->None:
+        """
+        _LatestOperator constructor.
+
+        Parameters:
+            handler (Callable[..., Any]): Handler whose executions are controlled.
+            loop (asyncio.AbstractEventLoop | None): Event loop executing the deferred executions, None to use the timer thread.
+
+        Return:
+            None
+        """
+        super().__init__(handler, loop)
+        self._pending = None
+
+    def _calls(self)->List[tuple]:
+        """
+        Gets the (args, kwds) of the deferred executions. Called holding _lock.
+
+        Return:
+            List[tuple]: deferred executions.
+        """
+        return [] if self._pending is None else [self._pending]
+
+    def _clear(self)->None:
+        """
+        Discards the deferred executions. Called holding _lock.
+
+        Return:
+            None
+        """
+        self._pending = None
+
+
+class _Debounce(_LatestOperator):
+    """
+    _Debounce is a class that represents a subscriber executing its handler once the executions stop for an interval (see debounce).
+
+    Attributes:
+        _interval (float): Seconds without executions before the handler is executed.
+        _deadline (float): time.monotonic() value at which the handler is executed if there are no more executions.
+    """
+    __slots__ = ("_interval", "_deadline")
+
+    _interval:float
+    _deadline:float
+
+    def __init__(self, handler:Callable[..., Any], interval:float, loop:asyncio.AbstractEventLoop | None)->None:
+        """
+        _Debounce constructor.
+
+        Parameters:
+            handler (Callable[..., Any]): Handler to debounce.
+            interval (float): Seconds without executions before the handler is executed.
+            loop (asyncio.AbstractEventLoop | None): Event loop executing the handler, None to use the timer thread.
+
+        Return:
+            None
+        """
+        super().__init__(handler, loop)
+        self._interval = interval
+        self._deadline = 0.0
+
+    def __call__(self, *args:Any, **kwds:Any)->None:
+        """
+        Defers the execution of the handler, replacing the deferred execution (if any). The timer is not rescheduled, when it expires
+        before the new deadline it is scheduled again, so a burst of executions schedules the timer once.
+
+        Parameters:
+            *args: positional arguments of the execution.
+            **kwds: named arguments of the execution.
+
+        Return:
+            None
+        """
+        deadline = monotonic() + self._interval
+
+        with self._lock:
+            self._pending = (args, kwds)
+            self._deadline = deadline
+            self._arm(deadline)
+
+    def _fire(self)->None:
+        """
+        Timer callback, executes the deferred execution if there were no executions since, otherwise schedules the timer at the new deadline.
+
+        Return:
+            None
+        """
+        with self._lock:
+            pending = self._pending
+
+            if pending is not None and monotonic() < self._deadline:
+                self._timer.schedule(self._deadline, self._fire)
+                return
+
+            self._pending = None
+            self._armed = False
+
+        if pending is not None:
+            self._execute(*pending)
+
+
+class _Throttle(_LatestOperator):
+    """
+    _Throttle is a class that represents a subscriber executing its handler at most once per interval (see throttle).
+
+    Attributes:
+        _interval (float): Minimum seconds between executions of the handler.
+        _next (float): time.monotonic() value from which the handler can be executed again.
+    """
+    __slots__ = ("_interval", "_next")
+
+    _interval:float
+    _next:float
+
+    def __init__(self, handler:Callable[..., Any], interval:float, loop:asyncio.AbstractEventLoop | None)->None:
+        """
+        _Throttle constructor.
+
+        Parameters:
+            handler (Callable[..., Any]): Handler to throttle.
+            interval (float): Minimum seconds between executions of the handler.
+            loop (asyncio.AbstractEventLoop | None): Event loop executing the deferred executions, None to use the timer thread.
+
+        Return:
+            None
+        """
+        super().__init__(handler, loop)
+        self._interval = interval
+        self._next = 0.0
+
+    def __call__(self, *args:Any, **kwds:Any)->None:
+        """
+        Executes the handler now if the interval since the previous execution elapsed, otherwise defers the execution to the end of the
+        interval, replacing the deferred execution (if any).
+
+        Parameters:
+            *args: positional arguments of the execution.
+            **kwds: named arguments of the execution.
+
+        Return:
+            None
+        """
+        now = monotonic()
+
+        with self._lock:
+            if now < self._next or self._armed:
+                self._pending = (args, kwds)
+                self._arm(self._next)
+                return
+
+            self._next = now + self._interval
+
+        self._execute(args, kwds)
+
+    def _fire(self)->None:
+        """
+        Timer callback, executes the deferred execution at the end of the interval and starts a new interval.
+
+        Return:
+            None
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = None
+            self._armed = False
+
+            if pending is not None:
+                self._next = monotonic() + self._interval
+
+        if pending is not None:
+            self._execute(*pending)
+
+
+class _Sample(_LatestOperator):
+    """
+    _Sample is a class that represents a subscriber executing its handler with the latest execution of every period (see sample).
+
+    Attributes:
+        _interval (float): Seconds of every period.
+        _origin (float): time.monotonic() value at which the first period starts.
+    """
+    __slots__ = ("_interval", "_origin")
+
+    _interval:float
+    _origin:float
+
+    def __init__(self, handler:Callable[..., Any], interval:float, loop:asyncio.AbstractEventLoop | None)->None:
+        """
+        _Sample constructor.
+
+        Parameters:
+            handler (Callable[..., Any]): Handler to sample.
+            interval (float): Seconds of every period.
+            loop (asyncio.AbstractEventLoop | None): Event loop executing the handler, None to use the timer thread.
+
+        Return:
+            None
+        """
+        super().__init__(handler, loop)
+        self._interval = interval
+        self._origin = monotonic()
+
+    def __call__(self, *args:Any, **kwds:Any)->None:
+        """
+        Defers the execution of the handler to the end of the current period, replacing the deferred execution (if any).
+
+        Parameters:
+            *args: positional arguments of the execution.
+            **kwds: named arguments of the execution.
+
+        Return:
+            None
+        """
+        now = monotonic()
+
+        with self._lock:
+            self._pending = (args, kwds)
+
+            if not self._armed:
+                interval = self._interval
+                self._arm(self._origin + ((now - self._origin) // interval + 1) * interval)
+
+    def _fire(self)->None:
+        """
+        Timer callback, executes the latest execution of the period.
+
+        Return:
+            None
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = None
+            self._armed = False
+
+        if pending is not None:
+            self._execute(*pending)
+
+
+class _RateLimit(_TimedOperator):
+    """
+    _RateLimit is a class that represents a subscriber executing its handler at a maximum rate with a token bucket (see rate_limit).
+
+    Attributes:
+        _rate (float): Tokens added to the bucket per second.
+        _burst (int): Capacity of the bucket.
+        _tokens (float): Tokens in the bucket at _stamp.
+        _stamp (float): time.monotonic() value of the last refill of the bucket.
+        _queue (deque): (args, kwds) of the executions waiting for a token.
+        _dropped (int): Number of executions discarded because the queue was full.
+    """
+    __slots__ = ("_rate", "_burst", "_tokens", "_stamp", "_queue", "_dropped")
+
+    _rate:float
+    _burst:int
+    _tokens:float
+    _stamp:float
+    _queue:deque
+    _dropped:int
+
+    def __init__(self, handler:Callable[..., Any], rate:float, burst:int, backlog:int | None, loop:asyncio.AbstractEventLoop | None)->None:
+        """
+        _RateLimit constructor.
+
+        Parameters:
+            handler (Callable[..., Any]): Handler to rate limit.
+            rate (float): Maximum executions per second.
+            burst (int): Executions allowed at once after an idle period (capacity of the bucket).
+            backlog (int | None): Maximum executions waiting for a token, None without limit.
+            loop (asyncio.AbstractEventLoop | None): Event loop executing the deferred executions, None to use the timer thread.
+
+        Return:
+            None
+        """
+        super().__init__(handler, loop)
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._stamp = monotonic()
+        self._queue = deque(maxlen=backlog)
+        self._dropped = 0
+
+    @property
+    def dropped(self)->int:
+        """
+        Number of executions discarded because the backlog was full.
+        """
+        return self._dropped
+
+    def __call__(self, *args:Any, **kwds:Any)->None:
+        """
+        Executes the handler now if the bucket has a token, otherwise queues the execution until the bucket has one. When the backlog is
+        full the oldest queued execution is discarded.
+
+        Parameters:
+            *args: positional arguments of the execution.
+            **kwds: named arguments of the execution.
+
+        Return:
+            None
+        """
+        with self._lock:
+            tokens = self._refill()
+
+            if tokens < 1 or self._queue:
+                queue = self._queue
+
+                if len(queue) == queue.maxlen:
+                    self._dropped += 1
+
+                    if not queue.maxlen:
+                        return
+
+                queue.append((args, kwds))
+                self._arm(self._stamp + (1 - tokens) / self._rate)
+                return
+
+            self._tokens = tokens - 1
+
+        self._execute(args, kwds)
+
+    def _refill(self)->float:
+        """
+        Adds the tokens generated since the last refill to the bucket. Called holding _lock.
+
+        Return:
+            float: Tokens in the bucket.
+        """
+        now = monotonic()
+        tokens = self._tokens = min(self._burst, self._tokens + (now - self._stamp) * self._rate)
+        self._stamp = now
+        return tokens
+
+    def _calls(self)->List[tuple]:
+        """
+        Gets the (args, kwds) of the deferred executions. Called holding _lock.
+
+        Return:
+            List[tuple]: deferred executions.
+        """
+        return list(self._queue)
+
+    def _clear(self)->None:
+        """
+        Discards the deferred executions. Called holding _lock.
+
+        Return:
+            None
+        """
+        self._queue.clear()
+
+    def _fire(self)->None:
+        """
+        Timer callback, executes the queued executions the bucket has tokens for and schedules the timer for the next token.
+
+        Return:
+            None
+        """
+        with self._lock:
+            tokens = self._refill()
+            queue = self._queue
+            calls = []
+
+            while queue and tokens >= 1:
+                calls.append(queue.popleft())
+                tokens -= 1
+
+            self._tokens = tokens
+            self._armed = False
+
+            if queue:
+                self._arm(self._stamp + (1 - tokens) / self._rate)
+
+        for args, kwds in calls:
+            self._execute(args, kwds)
+
+
+def _positive(name:str, value:float)->float:
+    """
+    Validates the value of a parameter of a timed operator.
+
+    Parameters:
+        name (str): name of the parameter.
+        value (float): value of the parameter.
+
+    Return:
+        float: value.
+
+    Raises:
+        ValueError: value is not positive.
+    """
+    if not value > 0:
+        raise ValueError("%s must be positive, not %r" % (name, value))
+    return value
+
+
+def debounce(handler:Callable[..., Any], interval:float, loop:asyncio.AbstractEventLoop | None = None)->Callable[..., None]:
+    """
+    Creates a subscriber that executes the handler once the executions stop for interval seconds, with the arguments of the latest
+    execution (trailing edge):
+
+        person.name_changed += debounce(database.save_person, 0.5) # one save after the name stops changing for 0.5 seconds
+
+    The handler is executed by the timer thread shared by every operator, or by loop. Exceptions raised by the handler are logged.
+
+    Parameters:
+        handler (Callable[..., Any]): Handler to debounce, any callable (functions, methods, delegates...).
+        interval (float): Seconds without executions before the handler is executed.
+        loop (asyncio.AbstractEventLoop | None): Event loop executing the handler (awaitables returned by the handler are scheduled as
+            tasks), None to use the timer thread.
+
+    Return:
+        Callable[..., None]: subscriber, see _TimedOperator for its pending, flush and cancel members.
+
+    Raises:
+        ValueError: interval is not positive.
+        TypeError: handler is a coroutine function and loop is None.
+    """
+    return _Debounce(handler, _positive("interval", interval), loop)
+
+
+def throttle(handler:Callable[..., Any], interval:float, loop:asyncio.AbstractEventLoop | None = None)->Callable[..., None]:
+    """
+    Creates a subscriber that executes the handler at most once every interval seconds: the first execution is executed immediately
+    (leading edge) and the latest execution inside the interval is executed at the end of the interval (trailing edge), the rest are
+    discarded:
+
+        person.moved += throttle(window.refresh, 1 / 30) # at most 30 refreshes per second
+
+    Deferred executions are executed by the timer thread shared by every operator, or by loop. Their exceptions are logged.
+
+    Parameters:
+        handler (Callable[..., Any]): Handler to throttle, any callable (functions, methods, delegates...).
+        interval (float): Minimum seconds between executions of the handler.
+        loop (asyncio.AbstractEventLoop | None): Event loop executing the deferred executions, None to use the timer thread.
+
+    Return:
+        Callable[..., None]: subscriber, see _TimedOperator for its pending, flush and cancel members.
+
+    Raises:
+        ValueError: interval is not positive.
+        TypeError: handler is a coroutine function and loop is None.
+    """
+    return _Throttle(handler, _positive("interval", interval), loop)
+
+
+def sample(handler:Callable[..., Any], interval:float, loop:asyncio.AbstractEventLoop | None = None)->Callable[..., None]:
+    """
+    Creates a subscriber that executes the handler at the end of every period of interval seconds with the latest execution of the period,
+    periods without executions do not execute the handler:
+
+        person.moved += sample(minimap.update, 0.25) # minimap updated 4 times per second while the person moves
+
+    The handler is executed by the timer thread shared by every operator, or by loop. Exceptions raised by the handler are logged.
+
+    Parameters:
+        handler (Callable[..., Any]): Handler to sample, any callable (functions, methods, delegates...).
+        interval (float): Seconds of every period, periods start when the subscriber is created.
+        loop (asyncio.AbstractEventLoop | None): Event loop executing the handler, None to use the timer thread.
+
+    Return:
+        Callable[..., None]: subscriber, see _TimedOperator for its pending, flush and cancel members.
+
+    Raises:
+        ValueError: interval is not positive.
+        TypeError: handler is a coroutine function and loop is None.
+    """
+    return _Sample(handler, _positive("interval", interval), loop)
+
+
+def rate_limit(handler:Callable[..., Any], rate:float, burst:int = 1, backlog:int | None = None, loop:asyncio.AbstractEventLoop | None = None)->Callable[..., None]:
+    """
+    Creates a subscriber that executes the handler at most rate times per second (token bucket): executions are executed immediately while
+    the bucket has tokens, the rest wait in order for the next token. No execution is discarded unless backlog is reached (the oldest
+    waiting execution is discarded, backlog 0 discards the executions without token):
+
+        person.moved += rate_limit(api.report_location, 10, burst = 5) # 10 reports per second, up to 5 at once
+
+    Waiting executions are executed by the timer thread shared by every operator, or by loop. Their exceptions are logged.
+
+    Parameters:
+        handler (Callable[..., Any]): Handler to rate limit, any callable (functions, methods, delegates...).
+        rate (float): Maximum executions per second.
+        burst (int): Executions allowed at once after an idle period (capacity of the bucket).
+        backlog (int | None): Maximum executions waiting for a token, None without limit.
+        loop (asyncio.AbstractEventLoop | None): Event loop executing the waiting executions, None to use the timer thread.
+
+    Return:
+        Callable[..., None]: subscriber, see _TimedOperator for its pending, flush and cancel members, and _RateLimit for dropped.
+
+    Raises:
+        ValueError: rate or burst are not positive, or backlog is negative.
+        TypeError: handler is a coroutine function and loop is None.
+    """
+    if backlog is not None and backlog < 0:
+        raise ValueError("backlog can not be negative, not %r" % (backlog,))
+
+    return _RateLimit(handler, _positive("rate", rate), int(_positive("burst", burst)), backlog, loop)
+
+
+class _StrongReference:
+    """
+    _StrongReference is a class that represents a strong reference with the same interface of a weak reference, used by WeakDelegate
+    to store callables that do not support weak references.
+
+    Attributes:
+        _value (Callable): Stores the referenced callable.
+    """
+    __slots__ = ("_value",)
+
+    _value:Callable
+
+    def __init__(self, value:Callable)->None:
+        """
+        _StrongReference constructor.
+
+        Parameters:
+            value (Callable): referenced callable.
+
+        Return:
+            None
+        """
+        self._value = value
+
+    def __call__(self)->Callable:
+        """
+        Gets the referenced callable.
+
+        Return:
+            Callable: referenced callable.
+        """
+        return self._value
+
+    def __eq__(self, other:object)->bool:
+        """
+        Compares the referenced callables.
+
+        Return:
+            bool: True if both references reference equal callables.
+        """
+        if not isinstance(other, _StrongReference):
+            return NotImplemented
+        return self._value == other._value
+
+    def __hash__(self)->int:
+        """
+        Gets the hash of the referenced callable.
+
+        Return:
+            int: hash of the referenced callable.
+        """
+        return hash(self._value)
+
+
+def _weak_reference(value:Callable)->Callable[[], Callable | None]:
+    """
+    Creates the reference used by WeakDelegate to store a callable: WeakMethod for bound methods, weak reference for any other callable
+    and _StrongReference for callables that do not support weak references.
+
+    Parameters:
+        value (Callable): callable to reference.
+
+    Return:
+        Callable[[], Callable | None]: reference to the callable.
+    """
+    try:
+        if hasattr(value, "__self__") and hasattr(value, "__func__"):
+            return WeakMethod(value)
+        return ref(value)
+    except TypeError:
+        return _StrongReference(value)
+
+
+class DispatchStats:
+    """
+    DispatchStats is a class that represents the statistics of the executions of an instrumented delegate (see Delegate.instrument), or of
+    the callables with the same name executed by it: execution count, cumulative and percentile durations and raised exceptions.
+    Percentiles are computed over the durations of the last executions (window).
+
+    Attributes:
+        _name (str): Name of the delegate or callable.
+        _count (int): Number of executions.
+        _total (float): Cumulative duration of the executions, in seconds.
+        _samples (deque): Durations of the last executions, in seconds.
+        _exceptions (Dict[str, int]): Number of exceptions raised, by exception type name.
+        _handlers (Dict[str, DispatchStats]): Statistics of the callables executed by the delegate, by callable name.
+        _lock (threading.Lock): Serializes the updates of the statistics.
+    """
+    _name:str
+    _count:int
+    _total:float
+    _samples:deque
+    _exceptions:Dict[str, int]
+    _handlers:Dict[str, "DispatchStats"]
+    _lock:threading.Lock
+
+    def __init__(self, name:str = "", window:int = 1024)->None:
+        """
+        DispatchStats constructor.
+
+        Parameters:
+            name (str): Name of the delegate or callable.
+            window (int): Number of durations of the last executions used to compute the percentiles.
+
+        Return:
+            None
+        """
+        self._name = name
+        self._count = 0
+        self._total = 0.0
+        self._samples = deque(maxlen=window)
+        self._exceptions = {}
+        self._handlers = {}
+        self._lock = threading.Lock()
+
+    @property
+    def name(self)->str:
+        return self._name
+
+    @property
+    def count(self)->int:
+        return self._count
+
+    @property
+    def total(self)->float:
+        return self._total
+
+    @property
+    def mean(self)->float:
+        return self._total / self._count if self._count else 0.0
+
+    @property
+    def exceptions(self)->Dict[str, int]:
+        return dict(self._exceptions)
+
+    @property
+    def handlers(self)->Dict[str, "DispatchStats"]:
+        return dict(self._handlers)
+
+    def percentile(self, percent:float)->float:
+        """
+        Returns a percentile (nearest rank) of the durations of the last executions.
+
+        Parameters:
+            percent (float): Percentile, from 0 to 100.
+
+        Return:
+            float: Duration in seconds, 0.0 if there are no executions.
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+
+        if not samples:
+            return 0.0
+
+        return samples[min(len(samples) - 1, max(0, round(percent / 100 * len(samples)) - 1))]
+
+    def as_dict(self)->Dict[str, Any]:
+        """
+        Returns the statistics as a dictionary (without the statistics of the callables).
+
+        Return:
+            Dict[str, Any]: count, total, mean, p50, p90, p99 (durations in seconds) and exceptions.
+        """
+        return {
+            "count": self._count,
+            "total": self._total,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "exceptions": self.exceptions,
+        }
+
+    def export(self, sink:Callable[[str, Dict[str, Any]], Any])->None:
+        """
+        Exports the statistics to a metrics sink, the sink is called with (name, as_dict()) for the delegate and for every callable
+        (named '<delegate name>/<callable name>').
+
+        Parameters:
+            sink (Callable[[str, Dict[str, Any]], Any]): metrics sink.
+
+        Return:
+            None
+        """
+        sink(self._name, self.as_dict())
+
+        for name, handler in self.handlers.items():
+            sink("%s/%s" % (self._name, name), handler.as_dict())
+
+    def _handler(self, callable:Callable)->"DispatchStats":
+        """
+        Returns the statistics of a callable (shared by the callables with the same name), they are created if they do not exist.
+
+        Parameters:
+            callable (Callable): callable executed by the delegate.
+
+        Return:
+            DispatchStats: Statistics of the callable.
+        """
+        name = getattr(callable, "__qualname__", None) or type(callable).__qualname__
+
+        with self._lock:
+            handler = self._handlers.get(name)
+
+            if handler is None:
+                handler = self._handlers[name] = DispatchStats(name, self._samples.maxlen)
+
+        return handler
+
+    def _record(self, duration:float, exception:BaseException | None)->None:
+        """
+        Records an execution.
+
+        Parameters:
+            duration (float): Duration of the execution, in seconds.
+            exception (BaseException | None): Exception raised by the execution, None if it did not raise.
+
+        Return:
+            None
+        """
+        with self._lock:
+            self._count += 1
+            self._total += duration
+            self._samples.append(duration)
+
+            if exception is not None:
+                name = type(exception).__name__
+                self._exceptions[name] = self._exceptions.get(name, 0) + 1
+
+
+class _InstrumentedCallable:
+    """
+    _InstrumentedCallable is a class that represents a callable executed by an instrumented delegate, records its executions.
+
+    Attributes:
+        _callable (Callable): Stores the instrumented callable.
+        _stats (DispatchStats): Statistics of the callable.
+    """
+    __slots__ = ("_callable", "_stats")
+
+    _callable:Callable
+    _stats:DispatchStats
+
+    def __init__(self, callable:Callable, stats:DispatchStats)->None:
+        """
+        _InstrumentedCallable constructor.
+
+        Parameters:
+            callable (Callable): callable to instrument.
+            stats (DispatchStats): Statistics of the callable.
+
+        Return:
+            None
+        """
+        self._callable = callable
+        self._stats = stats
+
+    def __call__(self, *args:Any, **kwds:Any)->Any:
+        """
+        Executes the callable recording the execution.
+
+        Return:
+            Any: Result of the callable.
+        """
+        exception = None
+        start = perf_counter()
+
+        try:
+            return self._callable(*args, **kwds)
+        except BaseException as error:
+            exception = error
+            raise
+        finally:
+            self._stats._record(perf_counter() - start, exception)
+
+
+class _InstrumentedAsyncCallable(_InstrumentedCallable):
+    """
+    _InstrumentedAsyncCallable is a class that represents a callable executed by an instrumented AsyncDelegate, the execution is recorded
+    when the awaitable returned by the callable finishes (or right away if the callable does not return an awaitable).
+    """
+    __slots__ = ()
+
+    def __call__(self, *args:Any, **kwds:Any)->Any:
+        """
+        Executes the callable, its awaitable is wrapped to record the execution when it finishes.
+
+        Return:
+            Any: Result of the callable, an awaitable if the callable returned an awaitable.
+        """
+        start = perf_counter()
+
+        try:
+            result = self._callable(*args, **kwds)
+        except BaseException as error:
+            self._stats._record(perf_counter() - start, error)
+            raise
+
+        if not isawaitable(result):
+            self._stats._record(perf_counter() - start, None)
+            return result
+
+        return self._awaited(result, start)
+
+    async def _awaited(self, awaitable:Any, start:float)->Any:
+        """
+        Awaits the awaitable returned by the callable recording the execution.
+
+        Parameters:
+            awaitable (Any): Awaitable returned by the callable.
+            start (float): perf_counter value when the callable was called.
+
+        Return:
+            Any: Result of the awaitable.
+        """
+        exception = None
+
+        try:
+            return await awaitable
+        except BaseException as error:
+            exception = error
+            raise
+        finally:
+            self._stats._record(perf_counter() - start, exception)
+
+
+class _InstrumentedReference:
+    """
+    _InstrumentedReference is a class that represents a reference (of a WeakDelegate) to a callable executed by an instrumented delegate.
+
+    Attributes:
+        _reference (Callable[[], Callable | None]): Stores the reference to the callable.
+        _stats (DispatchStats): Statistics of the callable.
+    """
+    __slots__ = ("_reference", "_stats")
+
+    _reference:Callable[[], Callable | None]
+    _stats:DispatchStats
+
+    def __init__(self, reference:Callable[[], Callable | None], stats:DispatchStats)->None:
+        """
+        _InstrumentedReference constructor.
+
+        Parameters:
+            reference (Callable[[], Callable | None]): reference to the callable to instrument.
+            stats (DispatchStats): Statistics of the callable.
+
+        Return:
+            None
+        """
+        self._reference = reference
+        self._stats = stats
+
+    def __call__(self)->Callable | None:
+        """
+        Returns the instrumented callable.
+
+        Return:
+            Callable | None: instrumented callable, None if the callable was collected.
+        """
+        callable = self._reference()
+        return None if callable is None else _InstrumentedCallable(callable, self._stats)
+
+
+_instrumented_types:Dict[type, type] = {}
+
+
+def _instrumented_type(base:type)->type:
+    """
+    Returns the instrumented subtype of a delegate type (see Delegate.instrument), it records the executions of the delegate and the callables
+    of its snapshot are instrumented when the dispatch plan is built. Instrumented types are created once per delegate type, and delegates
+    that are not instrumented do not execute any of this code.
+
+    Parameters:
+        base (type): Delegate type to instrument, without layers (see _layered_type).
+
+    Return:
+        type: Instrumented delegate type.
+    """
+    instrumented = _instrumented_types.get(base)
+
+    if instrumented is not None:
+        return instrumented
+
+    class InstrumentedDelegate(base):
+        """
+        Instrumented delegate type.
+
+        Attributes:
+            _stats (DispatchStats): Statistics of the delegate.
+            _plain (type): Delegate type that was instrumented.
+            _layers (frozenset): Layers of the type (see _layered_type).
+        """
+        _stats:DispatchStats
+        _plain:type = base
+        _layers:frozenset = frozenset(("instrumented",))
+
+        if issubclass(base, AsyncDelegate): # recorded when the execution is awaited, invoke awaits __call__ so it is recorded once
+            async def __call__(self, *args:Any, **kwds:Any)->Any:
+                """
+                Executes (and awaits) the delegate recording the execution.
+
+                Return:
+                    Any: Result of the delegate.
+                """
+                exception = None
+                start = perf_counter()
+
+                try:
+                    return await super().__call__(*args, **kwds)
+                except BaseException as error:
+                    exception = error
+                    raise
+                finally:
+                    self._stats._record(perf_counter() - start, exception)
+        else:
+            def __call__(self, *args:Any, **kwds:Any)->Any:
+                """
+                Executes the delegate recording the execution.
+
+                Return:
+                    Any: Result of the delegate.
+                """
+                exception = None
+                start = perf_counter()
+
+                try:
+                    return super().__call__(*args, **kwds)
+                except BaseException as error:
+                    exception = error
+                    raise
+                finally:
+                    self._stats._record(perf_counter() - start, exception)
+
+            def invoke(self, *args:Any, **kwds:Any)->None:
+                """
+                Executes the delegate discarding its results, recording the execution.
+
+                Return:
+                    None
+                """
+                exception = None
+                start = perf_counter()
+
+                try:
+                    super().invoke(*args, **kwds)
+                except BaseException as error:
+                    exception = error
+                    raise
+                finally:
+                    self._stats._record(perf_counter() - start, exception)
+
+        def _snapshot(self, args:tuple, kwds:Dict[str, Any])->tuple:
+            """
+            Selects the callables to execute from the dispatch plan, the plan is always used (even without predicates) due it contains
+            the instrumented callables.
+
+            Parameters:
+                args (tuple): Positional arguments of the execution.
+                kwds (Dict[str, Any]): Named arguments of the execution.
+
+            Return:
+                tuple: Instrumented callables to execute, in execution order.
+            """
+            plan = self._plan
+
+            if plan is None:
+                with self._lock:
+                    if self._batch is not None:
+                        invocation = self._invocation = self._batch._invocation
+                        return invocation
+
+                    plan = self._plan = self._dispatch_plan()
+
+            selected = []
+
+            for predicate, callables in plan:
+                if predicate is None or predicate(*args, **kwds):
+                    selected += callables
+
+            return selected
+
+        def _dispatch_plan(self)->tuple:
+            """
+            Builds the dispatch plan with instrumented callables, the lock must be held by the caller.
+
+            Return:
+                tuple: groups (predicate, instrumented callables) in execution order.
+            """
+            stats = self._stats
+            return tuple([
+                (predicate, tuple([self._instrumented_entry(callable, stats) for callable in callables]))
+                for predicate, callables in super()._dispatch_plan()
+            ])
+
+    InstrumentedDelegate.__name__ = InstrumentedDelegate.__qualname__ = base.__name__
+    InstrumentedDelegate.__module__ = base.__module__
+    _instrumented_types[base] = InstrumentedDelegate
+    return InstrumentedDelegate
+
+
+def _layered_type(current:type, layer:str, enabled:bool)->type:
+    """
+    Returns the type of a delegate after adding or removing a layer ("instrumented", see Delegate.instrument, or "recorded", see
+    EventRecorder.record) keeping its other layers. The layers are always applied in the same order over the delegate type (the recorded
+    subtype derives from the instrumented subtype), so the same layers give the same type whatever the order they were added in.
+
+    Parameters:
+        current (type): Current type of the delegate.
+        layer (str): Layer to add or remove.
+        enabled (bool): True to add the layer, False to remove it.
+
+    Return:
+        type: Delegate type with the layers.
+    """
+    plain = getattr(current, "_plain", current)
+    layers = getattr(current, "_layers", frozenset())
+    layers = layers | {layer} if enabled else layers - {layer}
+    layered = plain
+
+    if "instrumented" in layers:
+        layered = _instrumented_type(layered)
+
+    if "recorded" in layers:
+        layered = _recorded_type(layered)
+
+    return layered
+
+
+
+class EventArgs:
+    """
+    EventArgs is a class that represents a object that contains the event arguments (reasons or extra information about why the event was triggered)
+
+    EventArgs (and the EventArgs classes of this module) declare __slots__, so they do not allocate a __dict__ per instance, custom EventArgs can
+    be declared with slots as well using the @eventargs decorator.
+    """
+    __slots__ = ()
+
+
+class CoalescedEventArgs(EventArgs):
+    """
+    CoalescedEventArgs is a class that represents the EventArgs of several executions of an event merged into one (see Delegate.batch).
+
+    Attributes:
+        _events (tuple): Contains the EventArgs of every merged execution, in order.
+    """
+    __slots__ = ("_events",)
+
+    _events:tuple
+
+    def __init__(self, events:List[EventArgs])->None:
+        """
+        CoalescedEventArgs constructor.
+
+        Parameters:
+            events (List[EventArgs]): EventArgs of every merged execution, in order.
+
+        Return:
+            None
+        """
+        super().__init__()
+        self._events = tuple(events)
+
+    @property
+    def events(self)->tuple:
+        """
+        Gets property value.
+
+        Return:
+            tuple: EventArgs of every merged execution, in order.
+        """
+        return self._events
+
+
+class BatchEventArgs(EventArgs):
+    """
+    BatchEventArgs is a class that represents the EventArgs of one execution that reports many items at once (one column per argument),
+    so an event raised for thousands of entities makes one call per subscriber instead of one call (and one EventArgs) per entity.
+
+    Columns are sequences of the same length: NumPy arrays, array.array objects or lists, the columns are given to the subscribers as they
+    are (subscribers can use vectorized operations over them), use per_item to subscribe a handler that expects one EventArgs per item.
+
+        e = BatchEventArgs(ids = ids, deltas = deltas) # e.ids is ids, e.deltas is deltas, len(e) == len(ids)
+
+    Attributes:
+        _columns (Dict[str, Any]): Contains the columns by argument name, in declaration order.
+        _length (int): Contains the number of items of the batch.
+    """
+    __slots__ = ("_columns", "_length")
+
+    _columns:Dict[str, Any]
+    _length:int
+
+    def __init__(self, **columns:Any)->None:
+        """
+        BatchEventArgs constructor.
+
+        Parameters:
+            **columns: Columns by argument name, all of them with the same length.
+
+        Return:
+            None
+
+        Raises:
+            ValueError: The columns do not have the same length.
+        """
+        super().__init__()
+        lengths = {len(column) for column in columns.values()}
+
+        if len(lengths) > 1:
+            raise ValueError("BatchEventArgs columns must have the same length, got %s" % {name: len(column) for name, column in columns.items()})
+
+        self._columns = columns
+        self._length = lengths.pop() if lengths else 0
+
+    @property
+    def columns(self)->Dict[str, Any]:
+        """
+        Gets property value.
+
+        Return:
+            Dict[str, Any]: columns by argument name, in declaration order.
+        """
+        return self._columns
+
+    def __len__(self)->int:
+        """
+        Gets the number of items of the batch.
+
+        Return:
+            int: number of items.
+        """
+        return self._length
+
+    def __getattr__(self, name:str)->Any:
+        """
+        Gets a column by its argument name (only called when name is not a regular attribute).
+
+        Parameters:
+            name (str): argument name.
+
+        Return:
+            Any: column.
+
+        Raises:
+            AttributeError: There is no column with that name.
+        """
+        if not name.startswith("_"): # slots not set yet (e.g. while unpickling) must not look up the columns
+            columns = self._columns
+
+            if name in columns:
+                return columns[name]
+
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+
+    def items(self, type:Callable[..., E], **names:str)->Iterator[E]:
+        """
+        Creates one EventArgs per item of the batch (used to feed handlers that expect one EventArgs per item, see per_item).
+
+        If type is decorated with @eventargs its arguments are taken from the columns with the same name (or the column given in names),
+        otherwise it receives all the columns in declaration order. NumPy arrays and array.array columns are converted to lists first,
+        so the items contain Python values.
+
+            e.items(MovedEventArgs, delta = "deltas") # MovedEventArgs(delta) per item of e.deltas
+
+        Parameters:
+            type (Callable[..., E]): EventArgs type (or factory) of every item.
+            **names: Column name by argument name, for the arguments whose column has a different name.
+
+        Return:
+            Iterator[E]: EventArgs of every item, in order.
+
+        Raises:
+            KeyError: type is decorated with @eventargs and the batch has no column for one of its arguments.
+        """
+        fields = getattr(type, "_fields", None)
+        columns = self._columns.values() if fields is None else [self._columns[names.get(name, name)] for name in fields]
+        return map(type, *[column.tolist() if hasattr(column, "tolist") else column for column in columns])
+
+
+class _PerItem:
+    """
+    _PerItem is a class that represents a subscriber of a BatchEventArgs event that executes a handler once per item of the batch (see per_item).
+
+    Two _PerItem objects with the same handler, type and names are equal, so the subscriber can be unsubscribed creating it again, and it belongs
+    to the owner of the handler (see Delegate.unsubscribe_all).
+
+    Attributes:
+        _handler (Callable[[object, EventArgs], Any]): Handler executed once per item.
+        _type (Callable[..., EventArgs]): EventArgs type (or factory) of every item.
+        _names (Dict[str, str]): Column name by argument name (see BatchEventArgs.items).
+    """
+    __slots__ = ("_handler", "_type", "_names")
+
+    _handler:Callable[[object, EventArgs], Any]
+    _type:Callable[..., EventArgs]
+    _names:Dict[str, str]
+
+    def __init__(self, handler:Callable[[object, EventArgs], Any], type:Callable[..., EventArgs], names:Dict[str, str])->None:
+        """
+        _PerItem constructor.
+
+        Parameters:
+            handler (Callable[[object, EventArgs], Any]): Handler executed once per item.
+            type (Callable[..., EventArgs]): EventArgs type (or factory) of every item.
+            names (Dict[str, str]): Column name by argument name (see BatchEventArgs.items).
+
+        Return:
+            None
+        """
+        self._handler = handler
+        self._type = type
+        self._names = names
+
+    @property
+    def __self__(self)->Any:
+        """
+        Gets the owner of the handler (see Delegate.unsubscribe_all).
+
+        Return:
+            Any: object the handler is bound to, None if it is not a bound method.
+        """
+        return getattr(self._handler, "__self__", None)
+
+    def __call__(self, sender:object, e:BatchEventArgs)->None:
+        """
+        Executes the handler once per item of the batch.
+
+        Parameters:
+            sender (object): Object that raised the event.
+            e (BatchEventArgs): Batch to split.
+
+        Return:
+            None
+        """
+        handler = self._handler
+
+        for item in e.items(self._type, **self._names):
+            handler(sender, item)
+
+    def __eq__(self, other:object)->bool:
+        """
+        Compares the handlers, the types and the names.
+
+        Return:
+            bool: True if both subscribers execute equal handlers with the same type and names.
+        """
+        if not isinstance(other, _PerItem):
+            return NotImplemented
+        return self._handler == other._handler and self._type == other._type and self._names == other._names
+
+    def __hash__(self)->int:
+        """
+        Gets the hash of the handler and the type.
+
+        Return:
+            int: hash of the handler and the type.
+        """
+        return hash((self._handler, self._type))
+
+
+def per_item(handler:Callable[[object, EventArgs], Any], type:Callable[..., EventArgs], **names:str)->Callable[[object, BatchEventArgs], None]:
+    """
+    Adapts a handler that expects one EventArgs per item to a BatchEventArgs event: the returned subscriber executes the handler once
+    per item of every batch (see BatchEventArgs.items).
+
+        person.moved_batch += per_item(school.person_moved, MovedEventArgs, delta = "deltas")
+        person.moved_batch -= per_item(school.person_moved, MovedEventArgs, delta = "deltas")
+
+    Parameters:
+        handler (Callable[[object, EventArgs], Any]): Handler executed once per item.
+        type (Callable[..., EventArgs]): EventArgs type (or factory) of every item.
+        **names: Column name by argument name, for the arguments whose column has a different name.
+
+    Return:
+        Callable[[object, BatchEventArgs], None]: subscriber of the BatchEventArgs event.
+    """
+    return _PerItem(handler, type, names)
+
+
+class CancellableEventArgs(EventArgs):
+    """
+    CancellableEventArgs is a class that represents an EventArg that implements the posibility of cancelling the upcomming event setting the property Cancel to 'True'.
+
+    Attributes:
+        _cancel (bool): Contains the value if the action advertise by the pre-event should continue or not.
+        _cancelled_by (Callable | None): Contains the subscriber that cancelled the event (only reported by CancellableDelegate).
+    """
+    __slots__ = ("_cancel", "_cancelled_by")
+
+    _cancel:bool
+    _cancelled_by:Callable | None
+
+    def __init__(self)->None:
+        """
+        CancellableEventArgs constructor.
+
+        Return:
+            None
+        """
+        super().__init__()
+        self._cancel = False 
+        self._cancelled_by = None
+
+    
+    @property
+    def cancel(self)->bool:
+        """
+        Gets property value.
+
+        Return:
+            bool: current value.
+        """
+        return self._cancel
+    
+    @cancel.setter
+    def cancel(self,value:bool)->None:
+        """
+        Sets a new value.
+
+        Parameters:
+            value (bool): New value to set.
+        """
+        self._cancel = value
+
+    @property
+    def cancelled_by(self)->Callable | None:
+        """
+        Gets property value (only reported by CancellableDelegate).
+
+        Return:
+            Callable | None: subscriber that cancelled the event, None if it was not cancelled by a subscriber.
+        """
+        return self._cancelled_by
+
+
+def eventargs(cls:type)->type:
+    """
+    Class decorator used to declare custom EventArgs with __slots__ (no __dict__ per instance) without writing the constructor and the properties.
+
+    Arguments are declared as annotations in the class body (optionally with a default value), for every argument the decorated class gets
+    a slot (argument name with '_' prefix) and a read-only property, and the constructor receives the arguments in declaration order
+    (arguments of a base class decorated with @eventargs first). Annotations starting with '_' are ignored.
+
+        @eventargs
+        class MovedEventArgs(EventArgs):
+            delta:int
+
+        e = MovedEventArgs(5) # e.delta == 5
+
+    The base class must be EventArgs, a class inheriting from it with a constructor without parameters (like CancellableEventArgs)
+    or another class decorated with @eventargs.
+
+    Parameters:
+        cls (type): class to decorate.
+
+    Return:
+        type: New class with slots, constructor and properties.
+
+    Raises:
+        TypeError: cls does not inherit from EventArgs or an argument without default value follows an argument with default value.
+    """
+    if not issubclass(cls, EventArgs):
+        raise TypeError("@eventargs class %s must inherit from EventArgs" % cls.__name__)
+
+    base = cls.__mro__[1]
+    base_fields = getattr(base, "_fields", ())
+    defaults = dict(getattr(base, "_field_defaults", {}))
+    names = tuple(name for name in cls.__dict__.get("__annotations__", {}) if not name.startswith("_"))
+
+    for name in names:
+        if name in cls.__dict__:
+            defaults[name] = cls.__dict__[name]
+        elif defaults:
+            raise TypeError("@eventargs argument '%s' without default value follows an argument with default value" % name)
+
+    namespace = {key: value for key, value in cls.__dict__.items() if key not in names and key not in ("__dict__", "__weakref__")}
+    namespace["__slots__"] = tuple("_" + name for name in names)
+    namespace["_fields"] = base_fields + names
+    namespace["_field_defaults"] = defaults
+
+    for name in names:
+        namespace[name] = property(attrgetter("_" + name), doc="Gets '%s' argument value." % name)
+
+    # constructor is generated as source (same as dataclasses) so it is as fast as a hand written one
+    parameters = ", ".join(name if name not in defaults else "%s=__defaults[%r]" % (name, name) for name in base_fields + names)
+    body = ["    __base_init(self%s)" % "".join(", " + name for name in base_fields)]
+    body += ["    self._%s = %s" % (name, name) for name in names]
+    source = "def __init__(self%s):\n%s" % (", " + parameters if parameters else "", "\n".join(body))
+    scope = {}
+    exec(source, {"__base_init": base.__init__, "__defaults": defaults}, scope)
+    namespace["__init__"] = scope["__init__"]
+    namespace["__init__"].__qualname__ = "%s.__init__" % cls.__qualname__
+
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+class EventArgsPool(Generic[E]):
+    """
+    EventArgsPool is a class that represents a pool of reusable EventArgs objects of one type. Acquiring an EventArgs from the pool
+    reuses (initializes again) an EventArgs previously released instead of allocating a new one.
+
+    Only use it with events whose subscribers do not keep a reference to the EventArgs once the execution finishes, due a released EventArgs
+    is going to be reused by the next execution.
+
+        pool = EventArgsPool(MovedEventArgs)
+
+        e = pool.acquire(delta)
+        self._moved(self, e)
+        pool.release(e)
+
+    Attributes:
+        _type (type): EventArgs type created by the pool.
+        _init (Callable[..., None]): Constructor of the EventArgs type, used to initialize again a released EventArgs.
+        _free (list): Released EventArgs ready to be reused.
+        _size (int): Maximum number of released EventArgs kept by the pool.
+    """
+    __slots__ = ("_type", "_init", "_free", "_size")
+
+    _type:type
+    _init:Callable[..., None]
+    _free:list
+    _size:int
+
+    def __init__(self, type:type, size:int = 16)->None:
+        """
+        EventArgsPool constructor.
+
+        Parameters:
+            type (type): EventArgs type created by the pool.
+            size (int): Maximum number of released EventArgs kept by the pool.
+
+        Return:
+            None
+        """
+        self._type = type
+        self._init = type.__init__
+        self._free = []
+        self._size = size
+
+    def acquire(self, *args:Any, **kwds:Any)->E:
+        """
+        Gets an EventArgs from the pool (a new one if there is no released EventArgs) initialized with the given arguments.
+
+        Parameters:
+            *args: Positional arguments of the EventArgs constructor.
+            **kwds: Named arguments of the EventArgs constructor.
+
+        Return:
+            E: initialized EventArgs.
+        """
+        try:
+            e = self._free.pop()
+        except IndexError:
+            return self._type(*args, **kwds)
+
+        self._init(e, *args, **kwds)
+        return e
+
+    def release(self, e:E)->None:
+        """
+        Returns an EventArgs to the pool, it must not be used after it is released.
+
+        Parameters:
+            e (E): EventArgs to return.
+
+        Return:
+            None
+        """
+        if len(self._free) < self._size:
+            self._free.append(e)
+
+
+class _EventProxy:
+    """
+    _EventProxy is the base class of the event proxies, it implements the subscriptions with handles (see Subscription) of events implemented
+    with adder and remover functions: the delegate of those events is unknown, so the proxy tracks the callables added through subscribe and
+    subscribe_many to remove them through its handles or unsubscribe_all (callables added with += are not tracked).
+
+    Attributes:
+        _subscriptions (Dict[int, Callable[[object,EventArgs], Any]] | None): Callables added through the proxy by key, None until the first one.
+    """
+    __slots__ = ("_subscriptions",)
+
+    _subscriptions:Dict[int, Callable[[object,EventArgs], Any]] | None
+
+    def subscribe(self, value:Callable[[object,EventArgs], Any], priority:int = 0, predicate:Callable[..., bool] | None = None)->Subscription:
+        """
+        Adds a callable to the event (same as operator +=) and returns its handle.
+
+        Parameters:
+            value (Callable[[object,EventArgs], Any]): callable to be added.
+            priority (int): Execution priority of the callable, only supported by field-like events.
+            predicate (Callable[..., bool] | None): Decides if the callable is executed, only supported by field-like events.
+
+        Return:
+            Subscription: Handle removing the callable when it is unsubscribed.
+
+        Raises:
+            TypeError: priority or predicate are used with an event implemented with adder and remover functions.
+        """
+        if priority or predicate is not None:
+            raise TypeError("priority and predicate are only supported by field-like events, adder and remover functions only receive the callable")
+
+        self.__iadd__(value)
+
+        if self._subscriptions is None:
+            self._subscriptions = {}
+
+        key = next(_subscription_keys)
+        self._subscriptions[key] = value
+        return Subscription(self, key)
+
+    def subscribe_many(self, values:Iterable[Callable[[object,EventArgs], Any]], priority:int = 0, predicate:Callable[..., bool] | None = None)->List[Subscription]:
+        """
+        Adds several callables to the event and returns its handles (see subscribe method).
+
+        Parameters:
+            values (Iterable[Callable[[object,EventArgs], Any]]): callables to be added, in order.
+            priority (int): Execution priority of the callables, only supported by field-like events.
+            predicate (Callable[..., bool] | None): Decides if the callables are executed, only supported by field-like events.
+
+        Return:
+            List[Subscription]: Handle of every callable, in order.
+        """
+        return [self.subscribe(value, priority, predicate) for value in values]
+
+    def unsubscribe_all(self, *owners:Any)->int:
+        """
+        Removes every callable added through subscribe or subscribe_many that belongs to any of the owners (see Delegate.unsubscribe_all).
+
+        Parameters:
+            *owners (Any): owners of the callables to remove.
+
+        Return:
+            int: Number of callables removed.
+        """
+        subscriptions = self._subscriptions
+
+        if not subscriptions:
+            return 0
+
+        owners = {id(owner) for owner in owners if owner is not None}
+        removed = 0
+
+        for key in [key for key, value in subscriptions.items() if _owned_by(value, owners)]:
+            removed += self._unsubscribe(key)
+
+        return removed
+
+    def __reduce_ex__(self, protocol:int)->Any:
+        """
+        Proxies are bound to its instance (or class) and to its descriptor, they are never part of the state of an object, so they can not
+        be pickled nor copied, access the event from the restored object instead.
+
+        Raises:
+            TypeError: always.
+        """
+        raise TypeError("%s proxies are bound to the object implementing the event, they can not be pickled or copied" % (type(self).__qualname__,))
+
+    def _unsubscribe(self, key:int)->bool:
+        """
+        Removes the callable added under a key (see Subscription).
+
+        Parameters:
+            key (int): Key of the callable.
+
+        Return:
+            bool: True if the callable was removed, False if it was already removed.
+        """
+        value = self._subscriptions.pop(key, None)
+
+        if value is None:
+            return False
+
+        try:
+            self.__isub__(value)
+        except ValueError: # already removed with operator -=
+            return False
+
+        return True
+
+
+_subscription_keys = count()
+
+
+class BaseEvent(ABC):
+    """
+    BaseEvent an abstaract class to define a base event
+
+    Attributes:
+        _fadd (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for adding a callable value.
+        _fremove (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for removing a callable value.
+        _name (str | None): Name of the class member the descriptor is assigned to, None if it was not assigned in a class body.
+    """
+    _fadd: Callable[[Callable[[object,EventArgs], None]], None] | None
+    _fremove:Callable[[Callable[[object,EventArgs], None]], None] | None
+    _name: str | None
+
+    def __init__(
+        self,
+        fadd:Callable[[Callable[[object,EventArgs], None]], None] | None = None,
+        fremove:Callable[[Callable[[object,EventArgs], None]], None] | None = None
+    )->None:
+        """
+        event constructor.
+
+        Parameters:
+            fadd (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for adding a callable value.
+            fremove (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for removing a callable value.
+        Return:
+            None
+        """
+        self._fadd = None
+        self._fremove = None
+
+        self.adder(fadd)
+        self.remover(fremove)
+
+        self._name = None
+
+    
+    def adder(self,fadd:Callable[[Callable[[object,EventArgs], None]], None] | None)->"BaseEvent":
+        """
+        Allows provide the function will be use to add a callable.
+
+        Parameters:
+            fadd (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for adding a callable value.
+        Return:
+            BaseEvent: Current instance with the new fadd function
+        """
+        if fadd is not None and self._fremove is not None and self._fremove.__name__ != fadd.__name__:
+            raise AttributeError("adder function '%s'and remover function '%s' name missmatch, both members must have same name" % (fadd.__name__,self._fremove.__name__))
+
+        self._fadd = fadd
+        return self
+
+    def remover(self,fremove:Callable[[Callable[[object,EventArgs], None]], None] | None)->"BaseEvent":
+        """
+        Allows provide the function will be use to remove a callable.
+
+        Parameters:
+            fremove (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for removing a callable value.
+        Return:
+            BaseEvent: Current instance with the new fremove function
+        """
+        if fremove is not None and self._fadd is not None and self._fadd.__name__ != fremove.__name__:
+            raise AttributeError("remover function '%s'and adder function '%s' name missmatch, both members must have same name" % (fremove.__name__,self._fadd.__name__))
+
+        self._fremove = fremove
+        return self
+    
+    def __set_name__(self, owner:type, name:str)->None:
+        """
+        Method called when the owning class is created, stores the name of the member the descriptor is assigned to
+        and validates the descriptor (once, instead of on every access). Descriptors that are not assigned in a class body are validated
+        by its first access instead.
+
+        Parameters:
+            owner (type): The type of the owning class.
+            name (str): Name of the member the descriptor is assigned to.
+
+        Return:
+            None
+
+        Raises:
+            NotImplementedError: adder or remover function is missing (Python 3.11 raises it from the class statement as the __cause__ of a
+                RuntimeError, later versions raise it directly).
+        """
+        self._validate(owner)
+        self._name = name
+
+    def _validate(self, owner:type)->None:
+        """
+        Validates the descriptor has both functions (adder/remover) assigned.
+
+        Parameters:
+            owner (type): The type of the owning class.
+
+        Return:
+            None
+
+        Raises:
+            NotImplementedError: adder or remover function is missing.
+        """
+        if self._fadd is None or self._fremove is None:
+            error_message = ""
+
+            if self._fadd is None and self._fremove is None:
+                error_message = "event in %s is not defining any function (adder/remover)" % owner
+            else:
+                function_info= (self._fremove,"adder") if self._fadd is None else (self._fadd,"remover") 
+                error_message = "event %s does not have '%s' function assigned in %s" % (function_info[0].__name__,function_info[1],owner)
+            
+            raise NotImplementedError(error_message) 
+
+    @abstractmethod
+    def _get_proxy(self, instance: Any, owner: type) -> Any:
+        """
+        Allows provide the specific proxy use for every child of this class
+
+        Parameters:
+            instance (Any): The instance of the owning class. This parameter
+                is `None` when accessed from the class instead of from the instance.
+            owner (type): The type of the owning class.
+
+        Return:
+            Any: Descriptor proxy.
+        """
+        pass
+
+    def __get__(self, instance:Any, owner:type)->Any:
+        """
+        Method to get descriptor value.
+
+        Parameters:
+            instance (Any): The instance of the owning class. This parameter
+                is `None` when accessed from the class instead of from the instance.
+            owner (type): The type of the owning class.
+
+        Return:
+            Any: Descriptor proxy.
+        """
+        return self._get_proxy(instance,owner) 
+
+
+class event(BaseEvent):
+    """
+    event attribute, used to define a managed callback in an instance
+
+    The proxy of every instance is created only once and cached by the descriptor, keyed by the identity of the instance. Proxies only keep a weak
+    reference to its instance, and the cached proxy is discarded when the instance is collected, so the descriptor does not keep instances alive
+    and nothing is stored in the instance (pickling or copying the instance is not affected by the proxies). Instances that do not support weak
+    references get a new proxy on every access. When the owning class is created (__set_name__) the descriptor creates its own proxy type
+    calling _fadd and _fremove directly, so += and -= do not look them up in the descriptor.
+
+    Attributes:
+        _delegate_type (type): Delegate type created by field-like events (see field method).
+        _backing (str | None): Name of the instance attribute storing the delegate of a field-like event (assigned at __set_name__),
+            None if it is not a field-like event.
+        _proxy_type (type): Proxy type created for every instance, event.Event until the owning class is created.
+        _proxies (Dict[int, event.Event]): Cached proxy of every instance, by id of the instance.
+    """
+    _delegate_type:type = Delegate
+    _backing:str | None
+    _proxy_type:type
+    _proxies:Dict[int, "event.Event"]
+
+    class Event(_EventProxy):
+        """
+        Event is class used as proxy for the 'event' descriptor. its responsability is execute _fadd and _fremove when operators += and -- are used over the member marked as @event.
+
+        Attributes:
+            _reference (Callable[[], Any]): Weak reference (or _StrongReference) to the object using @event as memeber (the object implementing the event).
+            _event_descriptor (event): Stores the descriptor that is using the instance as proxy.
+        """
+        __slots__ = ("_reference", "_event_descriptor")
+
+        _reference:Callable[[], Any]
+        _event_descriptor:"event"
+
+        def __init__(self, reference:Callable[[], Any], event_descriptor:"event")->None:
+            """
+            Event constructor.
+
+            Parameters:
+                reference (Callable[[], Any]): Weak reference (or _StrongReference) to the object using @event as memeber (the object implementing the event).
+                event_descriptor (event): descriptor that is going to use this instance as proxy.
+            Return:
+                None
+            """
+            self._reference = reference
+            self._event_descriptor = event_descriptor
+            self._subscriptions = None
+
+        @property
+        def _instance(self)->Any:
+            """
+            Gets the object using @event as memeber (the object implementing the event).
+
+            Return:
+                Any: object implementing the event.
+            """
+            return self._reference()
+
+        def __iadd__(self, value:Callable[[object,EventArgs], None])->"event.Event":
+            """
+            Executes the _fadd (responsible of describe how the callable sholud be added) passing the callable as parameter.
+
+            Parameters:
+                value (Callable[[object,EventArgs], None]): callable to be passed as parammeter to _fadd.
+
+            Return:
+                event.Event: Current instance.
+            """
+            self._event_descriptor._fadd(self._instance, value)
+            return self
+
+        def __isub__(self, value:Callable[[object,EventArgs], None])->"event.Event":
+            """
+            Executes the _fremove (responsible of describe how the callable sholud be removed) passing the callable as parameter.
+
+            Parameters:
+                value (Callable[[object,EventArgs], None]): callable to be passed as parammeter to _fremove.
+
+            Return:
+                event.Event: Current instance.
+            """
+            self._event_descriptor._fremove(self._instance, value)
+            return self
+
+        def subscribe(self, value:Callable[[object,EventArgs], Any], priority:int = 0, predicate:Callable[..., bool] | None = None)->Subscription:
+            """
+            Adds a callable to the event (same as operator +=) and returns its handle. Field-like events add the callable to its delegate
+            (see Delegate.subscribe), so they support priority and predicate.
+
+            Parameters:
+                value (Callable[[object,EventArgs], Any]): callable to be added.
+                priority (int): Execution priority of the callable, higher first.
+                predicate (Callable[..., bool] | None): Decides if the callable is executed, None to execute it always.
+
+            Return:
+                Subscription: Handle removing the callable when it is unsubscribed.
+
+            Raises:
+                TypeError: priority or predicate are used with an event that is not a field-like event.
+            """
+            if self._event_descriptor._backing is None:
+                return super().subscribe(value, priority, predicate)
+
+            return self._field_delegate().subscribe(value, priority, predicate)
+
+        def subscribe_many(self, values:Iterable[Callable[[object,EventArgs], Any]], priority:int = 0, predicate:Callable[..., bool] | None = None)->List[Subscription]:
+            """
+            Adds several callables to the event and returns its handles, field-like events add them to its delegate in one operation
+            (see Delegate.subscribe_many).
+
+            Parameters:
+                values (Iterable[Callable[[object,EventArgs], Any]]): callables to be added, in order.
+                priority (int): Execution priority of the callables, higher first.
+                predicate (Callable[..., bool] | None): Decides if the callables are executed, None to execute them always.
+
+            Return:
+                List[Subscription]: Handle of every callable, in order.
+            """
+            if self._event_descriptor._backing is None:
+                return super().subscribe_many(values, priority, predicate)
+
+            return self._field_delegate().subscribe_many(values, priority, predicate)
+
+        def unsubscribe_all(self, *owners:Any)->int:
+            """
+            Removes every callable that belongs to any of the owners in one operation (see Delegate.unsubscribe_all). Events that are not
+            field-like events only remove the callables added through subscribe and subscribe_many.
+
+            Parameters:
+                *owners (Any): owners of the callables to remove.
+
+            Return:
+                int: Number of callables removed.
+            """
+            backing = self._event_descriptor._backing
+
+            if backing is None:
+                return super().unsubscribe_all(*owners)
+
+            delegate = self._instance.__dict__.get(backing)
+            return 0 if delegate is None else delegate.unsubscribe_all(*owners)
+
+        def instrument(self, stats:DispatchStats | None = None)->DispatchStats:
+            """
+            Starts recording the executions of the delegate of a field-like event (see Delegate.instrument), the delegate is created if
+            the event does not have subscribers yet. Delegates of other events are instrumented directly by its class.
+
+            Parameters:
+                stats (DispatchStats | None): Statistics where executions are recorded, None to create new ones (named as the event).
+
+            Return:
+                DispatchStats: Statistics of the delegate.
+
+            Raises:
+                TypeError: The event is not a field-like event.
+            """
+            descriptor = self._event_descriptor
+
+            if descriptor._backing is None:
+                raise TypeError("event '%s' is not a field-like event, instrument its delegate instead" % descriptor._name)
+
+            return self._field_delegate().instrument(stats or DispatchStats(descriptor._name))
+
+        def _field_delegate(self)->Delegate:
+            """
+            Gets the delegate of a field-like event, it is created if the event does not have subscribers yet.
+
+            Return:
+                Delegate: Delegate of the event.
+            """
+            descriptor = self._event_descriptor
+            attributes = self._instance.__dict__
+            delegate = attributes.get(descriptor._backing)
+
+            if delegate is None:
+                delegate = attributes.setdefault(descriptor._backing, descriptor._delegate_type())
+
+            return delegate
+
+
+    def __init__(
+        self,
+        fadd:Callable[[Callable[[object,EventArgs], None]], None] | None = None,
+        fremove:Callable[[Callable[[object,EventArgs], None]], None] | None = None
+    )->None:
+        """
+        event constructor.
+
+        Parameters:
+            fadd (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for adding a callable value.
+            fremove (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for removing a callable value.
+        Return:
+            None
+        """
+        super().__init__(fadd, fremove)
+        self._backing = None
+        self._proxy_type = self.Event
+        self._proxies = {}
+
+    @classmethod
+    def field(cls, delegate_type:type | None = None)->"event":
+        """
+        Creates a field-like event (same as C# field-like events), adder and remover are generated, and the delegate storing the subscribers
+        is created per instance only when the first subscriber is added. The delegate is stored in the instance under the event name with '_'
+        prefix, until it is created that attribute resolves to an empty delegate defined in the class, so the class can always raise the event
+        executing it, and instances without subscribers do not allocate any delegate:
+
+            class Person:
+                moved = event.field()
+
+                def _on_moved(self,e:MovedEventArgs)->None:
+                    self._moved(self,e)
+
+        Parameters:
+            delegate_type (type | None): Delegate type to create (Delegate, WeakDelegate, CancellableDelegate...), None to use the default
+                delegate type of the descriptor (Delegate for event, AsyncDelegate for asyncevent).
+
+        Return:
+            event: field-like event descriptor.
+        """
+        descriptor = cls()
+        descriptor._delegate_type = delegate_type or cls._delegate_type
+        descriptor._backing = ""
+        descriptor._fadd, descriptor._fremove = _field_functions(descriptor._backing, descriptor._delegate_type)
+        return descriptor
+
+    def __set_name__(self, owner:type, name:str)->None:
+        """
+        Method called when the owning class is created, stores the name of the member the descriptor is assigned to
+        and validates the descriptor (once, instead of on every access). Field-like events define their empty delegate in the owning class.
+
+        Parameters:
+            owner (type): The type of the owning class.
+            name (str): Name of the member the descriptor is assigned to.
+
+        Return:
+            None
+
+        Raises:
+            NotImplementedError: adder or remover function is missing (Python 3.11 raises it from the class statement as the __cause__ of a
+                RuntimeError, later versions raise it directly).
+            AttributeError: The owning class already defines the attribute used to store the delegate of a field-like event.
+        """
+        super().__set_name__(owner, name)
+
+        if self._backing is not None:
+            backing = "_" + name
+
+            if backing in owner.__dict__:
+                raise AttributeError("field-like event '%s' needs the attribute '%s', already defined in %s" % (name, backing, owner))
+
+            self._backing = backing
+            self._fadd, self._fremove = _field_functions(backing, self._delegate_type)
+            setattr(owner, backing, _EmptyDelegate(self._delegate_type))
+
+        self._proxy_type = self._bound_proxy_type(owner, name)
+
+    def _bound_proxy_type(self, owner:type, name:str)->type:
+        """
+        Creates the proxy type of the descriptor, a subtype of Event whose += and -= call _fadd and _fremove directly.
+
+        Parameters:
+            owner (type): The type of the owning class.
+            name (str): Name of the member the descriptor is assigned to.
+
+        Return:
+            type: Proxy type.
+        """
+        return _bound_proxy_type(self.Event, self._fadd, self._fremove, owner, name)
+
+    def _get_proxy(self, instance: Any, owner: type) -> "event.Event":
+        """
+        Allows provide the specific proxy use for every child of this class
+
+        Parameters:
+            instance (Any): The instance of the owning class. This parameter
+                is `None` when accessed from the class instead of from the instance.
+            owner (type): The type of the owning class.
+
+        Return:
+            event.Event: Descriptor proxy.
+        """
+        proxies = self._proxies
+        proxy = proxies.get(id(instance))
+
+        if proxy is not None and proxy._reference() is instance:
+            return proxy
+
+        if self._name is None: # not assigned in a class body, __set_name__ did not validate it
+            self._validate(owner)
+
+        if instance is None:
+            return self._proxy_type(_StrongReference(None), self)
+
+        key = id(instance)
+
+        try:
+            reference = ref(instance, lambda reference: proxies.pop(key, None))
+        except TypeError: # instances without weak references support can not cache the proxy
+            return self._proxy_type(_StrongReference(instance), self)
+
+        return proxies.setdefault(key, self._proxy_type(reference, self))
+
+    def __get__(self, instance:Any, owner:type)->"event.Event":
+        """
+        Method to get descriptor value, returns the cached proxy of the instance (see _get_proxy).
+
+        Parameters:
+            instance (Any): The instance of the owning class. This parameter
+                is `None` when accessed from the class instead of from the instance.
+            owner (type): The type of the owning class.
+
+        Return:
+            event.Event: Descriptor proxy.
+        """
+        proxy = self._proxies.get(id(instance))
+
+        if proxy is not None and proxy._reference() is instance:
+            return proxy
+
+        return self._get_proxy(instance, owner)
+
+    def __set__(self, instance:Any, value:Any)->None:
+        """
+        Method called when the event is assigned, operators += and -= assign the proxy of the instance back to the event (instance.event += value
+        is instance.event = instance.event.__iadd__(value)), that assignment does nothing, any other value can not be assigned.
+
+        Parameters:
+            instance (Any): The instance of the owning class.
+            value (Any): Assigned value.
+
+        Return:
+            None
+
+        Raises:
+            AttributeError: value is not the proxy of the instance.
+        """
+        if not (isinstance(value, event.Event) and value._event_descriptor is self and value._reference() is instance):
+            raise AttributeError("event '%s' can not be assigned, use operators += and -=" % (self._name,))
+ 
+
+class asyncevent(event):
+    """
+    async event attribute, used to define a managed callback in an instance whose subscribers are coroutine functions (normally implemented with an AsyncDelegate).
+    Subscribing a callable that is not a coroutine function raises a TypeError, due a regular function would block the event loop.
+    """
+    _delegate_type:type = AsyncDelegate
+
+    class Event(event.Event):
+        """
+        Event is class used as proxy for the 'asyncevent' descriptor. its responsability is execute _fadd and _fremove when operators += and -- are used over the member marked as @asyncevent.
+        """
+        __slots__ = ()
+
+        def __iadd__(self, value:Callable[[object,EventArgs], Any])->"asyncevent.Event":
+            """
+            Executes the _fadd (responsible of describe how the callable sholud be added) passing the callable as parameter.
+
+            Parameters:
+                value (Callable[[object,EventArgs], Any]): coroutine function to be passed as parammeter to _fadd.
+
+            Return:
+                asyncevent.Event: Current instance.
+
+            Raises:
+                TypeError: value is not a coroutine function.
+            """
+            _require_coroutine_function(value)
+            return super().__iadd__(value)
+
+        def subscribe(self, value:Callable[[object,EventArgs], Any], priority:int = 0, predicate:Callable[..., bool] | None = None)->Subscription:
+            """
+            Adds a coroutine function to the event and returns its handle (see event.Event.subscribe).
+
+            Parameters:
+                value (Callable[[object,EventArgs], Any]): coroutine function to be added.
+                priority (int): Execution priority of the callable, higher first.
+                predicate (Callable[..., bool] | None): Decides if the callable is executed, None to execute it always.
+
+            Return:
+                Subscription: Handle removing the callable when it is unsubscribed.
+
+            Raises:
+                TypeError: value is not a coroutine function.
+            """
+            _require_coroutine_function(value)
+            return super().subscribe(value, priority, predicate)
+
+        def subscribe_many(self, values:Iterable[Callable[[object,EventArgs], Any]], priority:int = 0, predicate:Callable[..., bool] | None = None)->List[Subscription]:
+            """
+            Adds several coroutine functions to the event and returns its handles (see event.Event.subscribe_many).
+
+            Parameters:
+                values (Iterable[Callable[[object,EventArgs], Any]]): coroutine functions to be added, in order.
+                priority (int): Execution priority of the callables, higher first.
+                predicate (Callable[..., bool] | None): Decides if the callables are executed, None to execute them always.
+
+            Return:
+                List[Subscription]: Handle of every callable, in order.
+
+            Raises:
+                TypeError: a value is not a coroutine function.
+            """
+            values = list(values)
+
+            for value in values:
+                _require_coroutine_function(value)
+
+            return super().subscribe_many(values, priority, predicate)
+
+    def _bound_proxy_type(self, owner:type, name:str)->type:
+        """
+        Creates the proxy type of the descriptor, a subtype of Event whose += and -= call _fadd and _fremove directly,
+        += validates the callable is a coroutine function before calling _fadd.
+
+        Parameters:
+            owner (type): The type of the owning class.
+            name (str): Name of the member the descriptor is assigned to.
+
+        Return:
+            type: Proxy type.
+        """
+        fadd = self._fadd
+
+        def add(instance:Any, value:Callable[[object,EventArgs], Any])->None:
+            _require_coroutine_function(value)
+            fadd(instance, value)
+
+        return _bound_proxy_type(self.Event, add, self._fremove, owner, name)
+
+
+def _require_coroutine_function(value:Callable[..., Any])->None:
+    """
+    Validates a subscriber of an asyncevent is a coroutine function.
+
+    Parameters:
+        value (Callable[..., Any]): callable to validate.
+
+    Return:
+        None
+
+    Raises:
+        TypeError: value is not a coroutine function.
+    """
+    if not (iscoroutinefunction(value) or iscoroutinefunction(getattr(value, "__call__", None))):
+        raise TypeError("%s is not a coroutine function, asyncevent subscribers must be coroutine functions" % (value,))
+
+
+def _bound_proxy_type(proxy_type:type, fadd:Callable[..., None], fremove:Callable[..., None], owner:type, name:str)->type:
+    """
+    Creates a subtype of an event proxy type whose += and -= call the adder and remover received instead of looking them up
+    in the descriptor of the proxy (see event.__set_name__). The type is named after the event (Person.moved.<proxy>), it is not a module
+    attribute and its instances can not be pickled (see _EventProxy.__reduce_ex__).
+
+    Parameters:
+        proxy_type (type): Proxy type of the descriptor (event.Event, asyncevent.Event...).
+        fadd (Callable[..., None]): function to be used for adding a callable value.
+        fremove (Callable[..., None]): function to be used for removing a callable value.
+        owner (type): The type of the owning class.
+        name (str): Name of the event.
+
+    Return:
+        type: Proxy type.
+    """
+    class BoundEvent(proxy_type):
+        __slots__ = ()
+
+        def __iadd__(self, value:Callable[[object,EventArgs], Any])->"BoundEvent":
+            fadd(self._instance, value)
+            return self
+
+        def __isub__(self, value:Callable[[object,EventArgs], Any])->"BoundEvent":
+            fremove(self._instance, value)
+            return self
+
+    BoundEvent.__name__ = proxy_type.__name__
+    BoundEvent.__qualname__ = "%s.%s.<proxy>" % (owner.__qualname__, name)
+    BoundEvent.__module__ = owner.__module__
+    return BoundEvent
+
+
+def _field_functions(backing:str, delegate_type:type)->tuple:
+    """
+    Creates the adder and remover of a field-like event (see event.field), the name of the attribute storing the delegate and the delegate type
+    are fixed when they are created, so adding and removing does not read them from the descriptor.
+
+    Parameters:
+        backing (str): Name of the instance attribute storing the delegate.
+        delegate_type (type): Delegate type to create when the first callable is added.
+
+    Return:
+        tuple: (adder, remover) functions.
+    """
+    def add(instance:Any, value:Callable[[object,EventArgs], None])->None:
+        attributes = instance.__dict__
+        delegate = attributes.get(backing)
+
+        if delegate is None:
+            delegate = attributes.setdefault(backing, delegate_type())
+
+        delegate += value
+
+    def remove(instance:Any, value:Callable[[object,EventArgs], None])->None:
+        delegate = instance.__dict__.get(backing)
+
+        if delegate is None:
+            raise ValueError("%s is not in the delegate" % (value,))
+
+        delegate -= value
+
+    return add, remove
+
+
+class _EmptyDelegate:
+    """
+    _EmptyDelegate is a class that represents the delegate of a field-like event (see event.field) of an instance without subscribers,
+    it is defined once in the owning class. Executing it executes an empty delegate, and adding a callable (operator +=) returns a new
+    delegate with the callable, in this way assigning the result stores the new delegate in the instance.
+
+    Attributes:
+        _delegate (Delegate): Empty delegate executed instead, it is never modified.
+    """
+    __slots__ = ("_delegate",)
+
+    _delegate:Delegate
+
+    def __init__(self, delegate_type:type)->None:
+        """
+        _EmptyDelegate constructor.
+
+        Parameters:
+            delegate_type (type): Delegate type of the field-like event.
+
+        Return:
+            None
+        """
+        self._delegate = delegate_type()
+
+    def __iadd__(self, value:Callable[..., Any])->Delegate:
+        """
+        Creates a new delegate with the callable.
+
+        Parameters:
+            value (Callable[..., Any]): callable to be added.
+
+        Return:
+            Delegate: New delegate containing the callable.
+        """
+        return type(self._delegate)(value)
+
+    def __isub__(self, value:Callable[..., Any])->"_EmptyDelegate":
+        """
+        Removing a callable from an empty delegate always fails.
+
+        Raises:
+            ValueError: always, the callable is not in the delegate.
+        """
+        raise ValueError("%s is not in the delegate" % (value,))
+
+    def __call__(self, *args:Any, **kwds:Any)->Any:
+        """
+        Executes the empty delegate.
+
+        Return:
+            Any: Result of the empty delegate (empty tuple, or an awaitable of it for AsyncDelegate).
+        """
+        return self._delegate(*args, **kwds)
+
+    def invoke(self, *args:Any, **kwds:Any)->Any:
+        """
+        Executes the empty delegate discarding the results.
+
+        Return:
+            Any: Result of invoke of the empty delegate (None, or an awaitable for AsyncDelegate).
+        """
+        return self._delegate.invoke(*args, **kwds)
+
+    def batch(self, mode:str = "last")->Any:
+        """
+        There is nothing to batch without subscribers.
+
+        Return:
+            Any: context manager that does nothing.
+        """
+        return nullcontext()
+
+
+class staticevent(BaseEvent):
+    """
+    static event attribute, used to define a managed callback in a class
+
+    The proxy is created once, when the owning class is created (__set_name__), and returned directly on every access.
+
+    Field-like static events (see field method) store the subscribers per class, so a class and each of its subclasses have its own
+    subscribers, and raising the event for a class executes the subscribers of the class and of its base classes (see _StaticDispatch).
+
+    Attributes:
+    _proxy: StaticEvent | None: Object to be use as proxy for the descriptor (field-like static events use a proxy per class, see _proxies)
+    _delegate_type (type): Delegate type created by field-like static events (see field method).
+    _backing (str | None): Name of the class attribute raising a field-like static event (assigned at __set_name__), None if it is not
+        a field-like static event.
+    _delegates (WeakKeyDictionary[type, Delegate]): Delegate of every class with subscribers (field-like static events), weakly keyed so
+        classes created at runtime can be collected.
+    _proxies (WeakKeyDictionary[type, StaticEvent]): Proxy of every class (field-like static events).
+    _dispatchers (WeakKeyDictionary[type, _StaticDispatch]): Object raising the event of every class (field-like static events).
+    _version (int): Incremented every time the subscribers change, the delegates cached by _StaticDispatch are computed again when it
+        changes (field-like static events).
+    _lock (threading.Lock): Serializes the creation of the delegates and the caching of the chains (field-like static events).
+    """
+
+    _proxy:"StaticEvent | None"
+    _delegate_type:type = Delegate
+    _backing:str | None
+    _delegates:"WeakKeyDictionary[type, Delegate]"
+    _proxies:"WeakKeyDictionary[type, staticevent.StaticEvent]"
+    _dispatchers:"WeakKeyDictionary[type, _StaticDispatch]"
+    _version:int
+    _lock:threading.Lock
+
+    class StaticEvent(_EventProxy):
+        """
+        StaticEvent is class used as proxy for the 'staticevent' descriptor. its responsability is execute _fadd and _fremove when operators += and -- are used over the member marked as @staticevent.
+
+        Attributes:
+            _event_descriptor (staticevent): Stores the descriptor that is using the instance as proxy.
+            _add (Callable[[Callable[[object,EventArgs], None]], None]): _fadd of the descriptor.
+            _remove (Callable[[Callable[[object,EventArgs], None]], None]): _fremove of the descriptor.
+            _owner (ref | None): Weak reference to the class whose subscribers are managed by the proxy (field-like static events), None
+                for other static events.
+        """
+        __slots__ = ("_event_descriptor", "_add", "_remove", "_owner")
+
+        _event_descriptor: "staticevent"
+        _add:Callable[[Callable[[object,EventArgs], None]], None]
+        _remove:Callable[[Callable[[object,EventArgs], None]], None]
+        _owner:ref | None
+
+
+        def __init__(self, event_descriptor: "staticevent", owner:type | None = None) -> None:
+            """
+            StaticEvent constructor.
+
+            Parameters:
+                event_descriptor (staticevent): descriptor that is going to use this instance as proxy.
+                owner (type | None): Class whose subscribers are managed by the proxy (field-like static events), None for other static events.
+            Return:
+                None
+            """
+            self._event_descriptor = event_descriptor
+            self._owner = None if owner is None else ref(owner)
+            self._add, self._remove = (event_descriptor._fadd, event_descriptor._fremove) if owner is None else event_descriptor._class_functions(owner)
+            self._subscriptions = None
+
+        def __get__(self, instance:Any, owner:type)->"staticevent.StaticEvent":
+            """
+            Operators += and -= used through a class (Person.created += value) assign the proxy to the class attribute replacing the
+            descriptor, the proxy then resolves itself through the descriptor so every class keeps getting its own proxy.
+
+            Parameters:
+                instance (Any): The instance of the owning class, None when accessed from the class.
+                owner (type): Class it is accessed from.
+
+            Return:
+                staticevent.StaticEvent: Descriptor proxy.
+            """
+            return self._event_descriptor.__get__(instance, owner)
+
+
+        def __iadd__(self, value: Callable[[object, EventArgs], None]) -> "staticevent.StaticEvent":
+            """
+            Executes the _fadd (responsible of describe how the callable sholud be added) passing the callable as parameter.
+
+            Parameters:
+                value (Callable[[object,EventArgs], None]): callable to be passed as parammeter to _fadd.
+
+            Return:
+                staticevent.StaticEvent: Current instance.
+            """
+            self._add(value)
+            return self
+
+        def __isub__(self, value: Callable[[object, EventArgs], None]) -> "staticevent.StaticEvent":
+            """
+            Executes the _fremove (responsible of describe how the callable sholud be removed) passing the callable as parameter.
+
+            Parameters:
+                value (Callable[[object,EventArgs], None]): callable to be passed as parammeter to _fremove.
+
+            Return:
+                staticevent.StaticEvent: Current instance.
+            """
+            self._remove(value)
+            return self
+
+        def subscribe(self, value:Callable[[object,EventArgs], Any], priority:int = 0, predicate:Callable[..., bool] | None = None)->Subscription:
+            """
+            Adds a callable to the event (same as operator +=) and returns its handle. Field-like static events add the callable to the
+            delegate of the class (see Delegate.subscribe), so they support priority and predicate.
+
+            Parameters:
+                value (Callable[[object,EventArgs], Any]): callable to be added.
+                priority (int): Execution priority of the callable, higher first.
+                predicate (Callable[..., bool] | None): Decides if the callable is executed, None to execute it always.
+
+            Return:
+                Subscription: Handle removing the callable when it is unsubscribed.
+
+            Raises:
+                TypeError: priority or predicate are used with a static event that is not a field-like static event.
+            """
+            if self._owner is None:
+                return super().subscribe(value, priority, predicate)
+
+            descriptor = self._event_descriptor
+            subscription = descriptor._class_delegate(self._owner()).subscribe(value, priority, predicate)
+            descriptor._invalidate()
+            return subscription
+
+        def subscribe_many(self, values:Iterable[Callable[[object,EventArgs], Any]], priority:int = 0, predicate:Callable[..., bool] | None = None)->List[Subscription]:
+            """
+            Adds several callables to the event and returns its handles, field-like static events add them to the delegate of the class
+            in one operation (see Delegate.subscribe_many).
+
+            Parameters:
+                values (Iterable[Callable[[object,EventArgs], Any]]): callables to be added, in order.
+                priority (int): Execution priority of the callables, higher first.
+                predicate (Callable[..., bool] | None): Decides if the callables are executed, None to execute them always.
+
+            Return:
+                List[Subscription]: Handle of every callable, in order.
+            """
+            if self._owner is None:
+                return super().subscribe_many(values, priority, predicate)
+
+            descriptor = self._event_descriptor
+            subscriptions = descriptor._class_delegate(self._owner()).subscribe_many(values, priority, predicate)
+            descriptor._invalidate()
+            return subscriptions
+
+        def unsubscribe_all(self, *owners:Any)->int:
+            """
+            Removes every callable that belongs to any of the owners in one operation (see Delegate.unsubscribe_all). Static events that are
+            not field-like static events only remove the callables added through subscribe and subscribe_many.
+
+            Parameters:
+                *owners (Any): owners of the callables to remove.
+
+            Return:
+                int: Number of callables removed.
+            """
+            if self._owner is None:
+                return super().unsubscribe_all(*owners)
+
+            descriptor = self._event_descriptor
+            delegate = descriptor._delegates.get(self._owner())
+
+            if delegate is None:
+                return 0
+
+            removed = delegate.unsubscribe_all(*owners)
+            descriptor._invalidate()
+            return removed
+
+
+    def __init__(
+        self,
+        fadd:Callable[[Callable[[object,EventArgs], None]], None] | None = None,
+        fremove:Callable[[Callable[[object,EventArgs], None]], None] | None = None
+    )->None:
+        """
+        staticevent constructor.
+
+        Parameters:
+            fadd (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for adding a callable value.
+            fremove (Callable[[Callable[[object,EventArgs], None]], None] | None): function to be used for removing a callable value.
+        Return:
+            None
+        """
+        super().__init__(fadd, fremove)
+        self._proxy = None
+        self._backing = None
+
+    @classmethod
+    def field(cls, delegate_type:type | None = None)->"staticevent":
+        """
+        Creates a field-like static event, adder and remover are generated and the subscribers are stored per class: subscribing through a
+        class (Person.created += ...) only adds the subscriber to that class, and raising the event for a class executes the subscribers
+        of the class and then the subscribers of its base classes (in MRO order), so subscribing through a base class receives the raises
+        of the base class and of all its subclasses. The event is raised through the event name with '_' prefix, which resolves to the
+        class it is accessed from (the class of the instance when it is accessed from an instance):
+
+            class Person:
+                created = staticevent.field()
+
+                def __init__(self)->None:
+                    self._created(self, EventArgs()) # executes Student.created subscribers (if self is a Student), then Person.created subscribers
+
+            class Student(Person):
+                pass
+
+        The delegates of every class to execute are computed once and cached, the cache is discarded only when the subscribers of the event
+        change (through the proxies), so raising the event does not walk the class hierarchy.
+
+        Parameters:
+            delegate_type (type | None): Delegate type created per class (Delegate, WeakDelegate, CancellableDelegate...), None to use Delegate.
+                With CancellableDelegate a subscriber cancelling the CancellableEventArgs also stops the subscribers of the base classes.
+
+        Return:
+            staticevent: field-like static event descriptor.
+        """
+        descriptor = cls()
+        descriptor._delegate_type = delegate_type or cls._delegate_type
+        descriptor._backing = ""
+        descriptor._delegates = WeakKeyDictionary()
+        descriptor._proxies = WeakKeyDictionary()
+        descriptor._dispatchers = WeakKeyDictionary()
+        descriptor._version = 0
+        descriptor._lock = threading.Lock()
+        return descriptor
+
+    def __set_name__(self, owner:type, name:str)->None:
+        """
+        Method called when the owning class is created, validates the descriptor and creates its proxy. Field-like static events define
+        the attribute raising the event in the owning class instead.
+
+        Parameters:
+            owner (type): The type of the owning class.
+            name (str): Name of the member the descriptor is assigned to.
+
+        Return:
+            None
+
+        Raises:
+            NotImplementedError: adder or remover function is missing (Python 3.11 raises it from the class statement as the __cause__ of a
+                RuntimeError, later versions raise it directly).
+            AttributeError: The owning class already defines the attribute used to raise a field-like static event.
+        """
+        super().__set_name__(owner, name)
+
+        if self._backing is None:
+            self._proxy = self.StaticEvent(self)
+            return
+
+        backing = "_" + name
+
+        if backing in owner.__dict__:
+            raise AttributeError("field-like static event '%s' needs the attribute '%s', already defined in %s" % (name, backing, owner))
+
+        self._backing = backing
+        self._fadd, self._fremove = self._class_functions(owner)
+        setattr(owner, backing, _StaticBacking(self))
+
+    def _validate(self, owner:type)->None:
+        """
+        Validates the descriptor has both functions (adder/remover) assigned, field-like static events generate them.
+
+        Parameters:
+            owner (type): The type of the owning class.
+
+        Return:
+            None
+
+        Raises:
+            NotImplementedError: adder or remover function is missing.
+        """
+        if self._backing is None:
+            super()._validate(owner)
+
+    def _class_functions(self, owner:type)->tuple:
+        """
+        Creates the adder and remover of a class of a field-like static event, they reference the class weakly.
+
+        Parameters:
+            owner (type): Class whose subscribers are added and removed.
+
+        Return:
+            tuple: (adder, remover) functions.
+        """
+        owner = ref(owner)
+
+        def add(value:Callable[[object,EventArgs], None])->None:
+            delegate = self._class_delegate(owner())
+            delegate += value
+            self._invalidate()
+
+        def remove(value:Callable[[object,EventArgs], None])->None:
+            delegate = self._delegates.get(owner())
+
+            if delegate is None:
+                raise ValueError("%s is not in the delegate" % (value,))
+
+            delegate -= value
+            self._invalidate()
+
+        return add, remove
+
+    def _class_delegate(self, owner:type)->Delegate:
+        """
+        Gets the delegate of a class of a field-like static event, it is created if the class does not have subscribers yet.
+
+        Parameters:
+            owner (type): Class of the delegate.
+
+        Return:
+            Delegate: Delegate of the class.
+        """
+        delegate = self._delegates.get(owner)
+
+        if delegate is None:
+            with self._lock:
+                delegate = self._delegates.get(owner)
+
+                if delegate is None:
+                    delegate = self._delegates[owner] = self._delegate_type()
+
+        return delegate
+
+    def _invalidate(self)->None:
+        """
+        Discards the cached delegates of every class incrementing the version (see _StaticDispatch), they are computed again by the next
+        raise of every class.
+
+        Return:
+            None
+        """
+        with self._lock:
+            self._version += 1
+
+    def _dispatcher(self, owner:type)->"_StaticDispatch":
+        """
+        Gets the object raising a field-like static event for a class, created once per class.
+
+        Parameters:
+            owner (type): Class raising the event.
+
+        Return:
+            _StaticDispatch: Object raising the event.
+        """
+        dispatcher = self._dispatchers.get(owner)
+
+        if dispatcher is None:
+            dispatcher = self._dispatchers.setdefault(owner, _StaticDispatch(self, owner))
+
+        return dispatcher
+
+    def _get_proxy(self, instance: Any, owner: type) -> "staticevent.StaticEvent":
+        """
+        Allows provide the specific proxy use for every child of this class
+
+        Parameters:
+            instance (Any): The instance of the owning class. This parameter
+                is `None` when accessed from the class instead of from the instance.
+            owner (type): The type of the owning class.
+
+        Return:
+            staticevent.StaticEvent: Descriptor proxy.
+        """
+        if self._backing is not None:
+            proxy = self._proxies.get(owner)
+            return proxy if proxy is not None else self._proxies.setdefault(owner, self.StaticEvent(self, owner))
+
+        if self._proxy is None:
+            self._validate(owner) # not assigned in a class body, __set_name__ did not validate it
+            self._proxy = self.StaticEvent(self)
+        return self._proxy
+
+    def __get__(self, instance:Any, owner:type)->"staticevent.StaticEvent":
+        """
+        Method to get descriptor value, returns the proxy created when the owning class was created (the proxy of the class for field-like
+        static events).
+
+        Parameters:
+            instance (Any): The instance of the owning class. This parameter
+                is `None` when accessed from the class instead of from the instance.
+            owner (type): The type of the owning class.
+
+        Return:
+            staticevent.StaticEvent: Descriptor proxy.
+        """
+        proxy = self._proxy
+        return proxy if proxy is not None else self._get_proxy(instance, owner)
+
+
+class _StaticBacking:
+    """
+    _StaticBacking is a class that represents the attribute raising a field-like static event (see staticevent.field), it is defined once
+    in the owning class and resolves to the object raising the event for the class it is accessed from.
+
+    Attributes:
+        _event (staticevent): Field-like static event.
+    """
+    __slots__ = ("_event",)
+
+    _event:staticevent
+
+    def __init__(self, event:staticevent)->None:
+        """
+        _StaticBacking constructor.
+
+        Parameters:
+            event (staticevent): Field-like static event.
+
+        Return:
+            None
+        """
+        self._event = event
+
+    def __get__(self, instance:Any, owner:type)->"_StaticDispatch":
+        """
+        Gets the object raising the event for the class it is accessed from.
+
+        Parameters:
+            instance (Any): The instance of the owning class, None when accessed from the class.
+            owner (type): Class it is accessed from (class of the instance when accessed from an instance).
+
+        Return:
+            _StaticDispatch: Object raising the event.
+        """
+        dispatcher = self._event._dispatchers.get(owner)
+        return dispatcher if dispatcher is not None else self._event._dispatcher(owner)
+
+
+class _StaticDispatch:
+    """
+    _StaticDispatch is a class that represents the raise of a field-like static event for a class (see staticevent.field): it executes
+    the delegates with subscribers of the class and of its base classes, in MRO order. The delegates are computed walking the MRO of the
+    class once, and cached until the subscribers of the event change (the version of the event changes).
+
+    Attributes:
+        _event (staticevent): Field-like static event.
+        _owner (ref): Weak reference to the class raising the event.
+        _chain (tuple): Delegates with subscribers to execute in order.
+        _version (int): Version of the event the delegates were computed for, -1 if they were never computed.
+    """
+    __slots__ = ("_event", "_owner", "_chain", "_version")
+
+    _event:staticevent
+    _owner:ref
+    _chain:tuple
+    _version:int
+
+    def __init__(self, event:staticevent, owner:type)->None:
+        """
+        _StaticDispatch constructor.
+
+        Parameters:
+            event (staticevent): Field-like static event.
+            owner (type): Class raising the event.
+
+        Return:
+            None
+        """
+        self._event = event
+        self._owner = ref(owner)
+        self._chain = ()
+        self._version = -1
+
+    def __call__(self, *args:Any, **kwds:Any)->tuple:
+        """
+        Executes the delegates of the class and of its base classes.
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable.
+            **kwds: A variable number of named arguments that are going to be pass to every callable (keyword arguments).
+
+        Return:
+            tuple: results of every executed callable, in execution order.
+        """
+        chain = self._chain if self._version == self._event._version else self._build() # _build stores the delegates before the version
+
+        if len(chain) == 1:
+            return chain[0](*args, **kwds)
+
+        results = []
+
+        for delegate in chain:
+            results += delegate(*args, **kwds)
+
+        return tuple(results)
+
+    def invoke(self, *args:Any, **kwds:Any)->None:
+        """
+        Executes the delegates of the class and of its base classes discarding its results (see Delegate.invoke).
+
+        Parameters:
+            *args: A variable number of positional arguments that are going to be pass to every callable.
+            **kwds: A variable number of named arguments that are going to be pass to every callable (keyword arguments).
+
+        Return:
+            None
+        """
+        chain = self._chain if self._version == self._event._version else self._build() # _build stores the delegates before the version
+
+        for delegate in chain:
+            delegate.invoke(*args, **kwds)
+
+    def _build(self)->tuple:
+        """
+        Computes the delegates with subscribers of the class and of its base classes, in MRO order. The delegates are cached only if the
+        subscribers did not change while they were computed, a raise computing them before a subscription must not hide it from the
+        next raises.
+
+        Return:
+            tuple: Delegates to execute.
+        """
+        event = self._event
+        version = event._version
+        owner = self._owner()
+
+        if owner is None:
+            return ()
+
+        delegates = event._delegates
+        chain = tuple(delegate for delegate in map(delegates.get, owner.__mro__) if delegate is not None and delegate._callables)
+
+        with event._lock:
+            if event._version == version:
+                self._chain, self._version = chain, version
+
+        return chain
+
+
+class _TopicTrie:
+    """
+    _TopicTrie is a class that represents a node of the trie used by EventBus to match topics against wildcard topics, every node is a segment
+    of the topic (segments are separated by '.'), '*' matches exactly one segment and '#' matches zero or more segments.
+
+    Attributes:
+        _children (Dict[str, _TopicTrie]): Stores the child node of every segment.
+        _delegate (Delegate | None): Delegate of the wildcard topic ending in this node, None if no wildcard topic ends in this node.
+    """
+    __slots__ = ("_children", "_delegate")
+
+    _children:Dict[str, "_TopicTrie"]
+    _delegate:Delegate | None
+
+    def __init__(self)->None:
+        """
+        _TopicTrie constructor.
+
+        Return:
+            None
+        """
+        self._children = {}
+        self._delegate = None
+
+    def insert(self, segments:List[str])->"_TopicTrie":
+        """
+        Returns the node of a wildcard topic, the missing nodes are created.
+
+        Parameters:
+            segments (List[str]): Segments of the wildcard topic.
+
+        Return:
+            _TopicTrie: Node of the wildcard topic.
+        """
+        node = self
+
+        for segment in segments:
+            child = node._children.get(segment)
+
+            if child is None:
+                child = node._children[segment] = _TopicTrie()
+
+            node = child
+
+        return node
+
+    def find(self, segments:List[str])->"_TopicTrie | None":
+        """
+        Returns the node of a wildcard topic.
+
+        Parameters:
+            segments (List[str]): Segments of the wildcard topic.
+
+        Return:
+            _TopicTrie | None: Node of the wildcard topic, None if it does not exist.
+        """
+        node = self
+
+        for segment in segments:
+            node = node._children.get(segment)
+
+            if node is None:
+                return None
+
+        return node
+
+    def match(self, segments:List[str], index:int, found:List[Delegate])->None:
+        """
+        Appends the delegates of the wildcard topics matching the segments of a topic.
+
+        Parameters:
+            segments (List[str]): Segments of the topic.
+            index (int): Index of the segment matched by this node.
+            found (List[Delegate]): Delegates of the matching wildcard topics.
+
+        Return:
+            None
+        """
+        children = self._children
+        multiple = children.get("#")
+
+        if multiple is not None:
+            for skip in range(index, len(segments) + 1):
+                multiple.match(segments, skip, found)
+
+        if index == len(segments):
+            if self._delegate is not None:
+                found.append(self._delegate)
+            return
+
+        for segment in (segments[index], "*"):
+            child = children.get(segment)
+
+            if child is not None:
+                child.match(segments, index + 1, found)
+
+
+class EventBus:
+    """
+    EventBus is a class that represents a global event bus, publishers and subscribers do not know each other, subscribers subscribe to a topic
+    and publishers publish EventArgs to a topic. A topic is a string (segments separated by '.', like "person.moved") or an EventArgs subclass:
+
+        - EventArgs subclass: publishing an EventArgs without topic reaches the subscribers of its type and of all its base classes, so publishing
+          a LocationChangingEventArgs reaches LocationChangingEventArgs, CancellableEventArgs and EventArgs subscribers (most specific first).
+        - string: publishing to a topic reaches the subscribers of the topic and of the wildcard topics matching it, where the segment '*' matches
+          exactly one segment and '#' matches zero or more segments ("person.*", "#.moved", "#"). Wildcard topics are stored in a trie.
+
+    Every topic is stored as a Delegate. The delegates a published topic reaches are resolved (type hierarchy or trie) only the first time the
+    topic is published and cached, the cache is discarded only when a new topic is subscribed, in this way publishing is a dictionary lookup
+    plus the execution of the delegates, no matter how many topics the bus has. Topics reaching no delegate are not cached (they are resolved
+    on every publish), so publishing to unbounded topics (ids in the topic, for example) does not grow the cache.
+
+    Attributes:
+        _delegate_type (type): Delegate type created for every topic.
+        _topics (Dict[str | type, Delegate]): Stores the delegate of every topic (not wildcard).
+        _patterns (_TopicTrie): Trie of the wildcard topics.
+        _routes (Dict[str | type, tuple]): Cache of the delegates reached by every published topic that reaches some delegate.
+        _lock (threading.Lock): Serializes the changes of the topics and the resolution of the routes.
+    """
+    _delegate_type:type
+    _topics:Dict[Union[str, type], Delegate]
+    _patterns:_TopicTrie
+    _routes:Dict[Union[str, type], tuple]
+    _lock:threading.Lock
+
+    def __init__(self, delegate_type:type = Delegate)->None:
+        """
+        EventBus constructor.
+
+        Parameters:
+            delegate_type (type): Delegate type created for every topic (Delegate, WeakDelegate...).
+
+        Return:
+            None
+        """
+        self._delegate_type = delegate_type
+        self._topics = {}
+        self._patterns = _TopicTrie()
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def _delegate(self, topic:Union[str, type])->Delegate:
+        """
+        Returns the delegate of a topic, it is created (discarding the cached routes) if the topic does not have one, the lock must be held by the caller.
+
+        Parameters:
+            topic (str | type): Topic string, wildcard topic or EventArgs subclass.
+
+        Return:
+            Delegate: Delegate of the topic.
+
+        Raises:
+            TypeError: topic is not a string nor an EventArgs subclass.
+        """
+        if isinstance(topic, str):
+            segments = topic.split(".")
+
+            if "*" in segments or "#" in segments:
+                node = self._patterns.insert(segments)
+
+                if node._delegate is None:
+                    node._delegate = self._delegate_type()
+                    self._routes = {}
+
+                return node._delegate
+        elif not (isinstance(topic, type) and issubclass(topic, EventArgs)):
+            raise TypeError("topic must be a string or an EventArgs subclass, not %r" % (topic,))
+
+        delegate = self._topics.get(topic)
+
+        if delegate is None:
+            delegate = self._topics[topic] = self._delegate_type()
+            self._routes = {}
+
+        return delegate
+
+    def subscribe(self, topic:Union[str, type], value:Callable[[object, EventArgs], Any], priority:int = 0, predicate:Callable[..., bool] | None = None)->Subscription:
+        """
+        Subscribes a callable to a topic, with a priority and/or a predicate (see Delegate.subscribe).
+
+        Parameters:
+            topic (str | type): Topic string, wildcard topic or EventArgs subclass.
+            value (Callable[[object, EventArgs], Any]): callable to be subscribed.
+            priority (int): Execution priority of the callable in the topic, higher first.
+            predicate (Callable[..., bool] | None): Decides if the callable is executed, None to execute it always.
+
+        Return:
+            Subscription: Handle removing exactly this callable from the topic when it is unsubscribed.
+
+        Raises:
+            TypeError: topic is not a string nor an EventArgs subclass.
+        """
+        with self._lock:
+            delegate = self._delegate(topic)
+
+        return delegate.subscribe(value, priority, predicate)
+
+    def unsubscribe(self, topic:Union[str, type], value:Callable[[object, EventArgs], Any])->None:
+        """
+        Unsubscribes a callable from a topic.
+
+        Parameters:
+            topic (str | type): Topic string, wildcard topic or EventArgs subclass.
+            value (Callable[[object, EventArgs], Any]): callable to be unsubscribed.
+
+        Return:
+            None
+
+        Raises:
+            ValueError: The callable is not subscribed to the topic.
+        """
+        with self._lock:
+            segments = topic.split(".") if isinstance(topic, str) else ()
+
+            if "*" in segments or "#" in segments:
+                node = self._patterns.find(segments)
+                delegate = None if node is None else node._delegate
+            else:
+                delegate = self._topics.get(topic)
+
+        if delegate is None:
+            raise ValueError("%s is not subscribed to %r" % (value, topic))
+
+        delegate -= value
+
+    def _resolve(self, topic:Union[str, type])->tuple:
+        """
+        Resolves the delegates reached by a published topic, cached only when the topic reaches some delegate: topics nobody subscribed
+        (arbitrary strings, types created at runtime) would grow the cache without bound.
+
+        Parameters:
+            topic (str | type): Topic string or EventArgs subclass.
+
+        Return:
+            tuple: Delegates reached by the topic, in execution order.
+        """
+        with self._lock:
+            if isinstance(topic, str):
+                found = [self._topics[topic]] if topic in self._topics else []
+                self._patterns.match(topic.split("."), 0, found)
+            else:
+                found = [self._topics[base] for base in topic.__mro__ if base in self._topics]
+
+            routes = tuple({id(delegate): delegate for delegate in found}.values())
+
+            if routes:
+                self._routes[topic] = routes
+
+        return routes
+
+    def publish(self, sender:object, e:EventArgs, topic:str | None = None)->None:
+        """
+        Publishes an EventArgs, executing the subscribers of the topic (discarding its results).
+
+        Parameters:
+            sender (object): Object publishing the EventArgs.
+            e (EventArgs): EventArgs to be passed to the subscribers.
+            topic (str | None): Topic string, None to publish to the type of e (and its base classes).
+
+        Return:
+            None
+        """
+        if topic is None:
+            topic = e.__class__
+
+        routes = self._routes.get(topic)
+
+        if routes is None:
+            routes = self._resolve(topic)
+
+        for delegate in routes:
+            delegate.invoke(sender, e)
+
+
+class EventRecorder:
+    """
+    EventRecorder is a class that records the executions (raises) of delegates and field-like events into an append-only, memory-mapped binary log,
+    the log can be replayed later against other subscribers (see replay method), to reproduce an incident or to load-test subscribers offline:
+
+        with EventRecorder("person.log") as recorder:
+            recorder.record(person.moved)
+            recorder.record(Person._person_created, "person_created") # static events are recorded through its delegate
+            ...
+
+        EventRecorder.replay("person.log", {"moved": new_subscriber.person_moved})
+
+    Recording a delegate turns it into an instance of a recorded subtype of its type (same as Delegate.instrument), a raise only appends
+    (event id, timestamp, arguments) to a buffer before the callables are executed, without serializing the arguments. EventArgs are captured
+    as (type, attribute values) at that moment, so they are recorded as raised even if the subscribers change them (a CancellableEventArgs
+    cancelled by a subscriber is recorded not cancelled), other arguments are kept by reference. When the buffer is full (or on flush/close)
+    the buffered raises are serialized together and copied into the memory mapped file, so there are no write calls per raise.
+
+    Log format (little endian): 16 bytes header (magic, length of the log) followed by blocks. Every block is (kind:uint8, count:uint32, size:uint32)
+    and its body: names blocks contain the pickled (event id, name) pairs of the recorded events, raise blocks contain count event ids (uint32),
+    timestamps (int64, ns since epoch), sender ids (uint64, id of the sender, 0 for None) and flags (uint8), followed by the pickled arguments.
+
+    Attributes:
+        _path (str): Path of the log file.
+        _file (Any): Log file.
+        _map (mmap.mmap): Memory map of the log file.
+        _length (int): Length of the log (bytes written).
+        _buffer (List[tuple]): Buffered raises (event id, timestamp, sender id, flags, payload).
+        _capacity (int): Number of raises buffered before serializing them.
+        _names (Dict[str, int]): Event id of every recorded name.
+        _sources (List[Delegate]): Recorded delegates.
+        _lock (threading.Lock): Serializes the access to the buffer and the writes into the log.
+        _dropped (int): Number of raises whose arguments could not be serialized.
+    """
+    _MAGIC = b"PYSHLOG1"
+    _HEADER = struct.Struct("<8sQ")
+    _BLOCK = struct.Struct("<BII")
+    _NAMES = 1
+    _RAISES = 2
+    _SENDER = 1
+
+    _layouts:Dict[type, tuple] = {}
+
+    _path:str
+    _file:Any
+    _map:mmap.mmap
+    _length:int
+    _buffer:List[tuple]
+    _capacity:int
+    _names:Dict[str, int]
+    _sources:List[Delegate]
+    _lock:threading.Lock
+    _dropped:int
+
+    def __init__(self, path:str, buffer:int = 1024, size:int = 1 << 20)->None:
+        """
+        EventRecorder constructor, creates (or overwrites) the log file.
+
+        Parameters:
+            path (str): Path of the log file.
+            buffer (int): Number of raises buffered before serializing them into the log.
+            size (int): Initial size of the memory mapped file in bytes, it is doubled every time the log does not fit.
+
+        Return:
+            None
+        """
+        self._path = path
+        self._file = open(path, "w+b")
+        self._file.truncate(max(size, self._HEADER.size))
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._length = self._HEADER.size
+        self._buffer = []
+        self._capacity = buffer
+        self._names = {}
+        self._sources = []
+        self._lock = threading.Lock()
+        self._dropped = 0
+        self._HEADER.pack_into(self._map, 0, self._MAGIC, self._length)
+
+    @property
+    def dropped(self)->int:
+        """
+        Gets the number of raises that were not recorded due its arguments could not be serialized.
+
+        Return:
+            int: Number of raises not recorded.
+        """
+        return self._dropped
+
+    def record(self, source:Any, name:str | None = None)->None:
+        """
+        Starts recording the raises of a delegate or a field-like event (its delegate is created if the event does not have subscribers yet).
+        Events implemented with adder and remover functions and static events are recorded through its delegate.
+
+        Parameters:
+            source (Any): Delegate or field-like event (person.moved).
+            name (str | None): Name of the event in the log (used by replay), None to use the event name (delegate type name for delegates).
+
+        Return:
+            None
+
+        Raises:
+            TypeError: source is an event that is not a field-like event, or AsyncDelegate/ExecutorDelegate.
+        """
+        if isinstance(source, event.Event):
+            descriptor = source._event_descriptor
+
+            if descriptor._backing is None:
+                raise TypeError("event '%s' is not a field-like event, record its delegate instead" % descriptor._name)
+
+            name = name or descriptor._name
+            source = source._field_delegate()
+
+        if isinstance(source, (AsyncDelegate, ExecutorDelegate)):
+            raise TypeError("%s does not support recording" % type(source).__name__)
+
+        name = name or type(source).__name__
+
+        with self._lock:
+            event_id = self._names.get(name)
+
+            if event_id is None:
+                event_id = self._names[name] = len(self._names)
+                self._write(self._NAMES, 1, pickle.dumps([(event_id, name)], pickle.HIGHEST_PROTOCOL))
+
+            with source._lock:
+                source.__class__ = _layered_type(source.__class__, "recorded", True)
+                source._recorder = self
+                source._event_id = event_id
+
+            self._sources.append(source)
+
+    def stop(self, source:Any)->None:
+        """
+        Stops recording the raises of a delegate or a field-like event.
+
+        Parameters:
+            source (Any): Delegate or field-like event.
+
+        Return:
+            None
+        """
+        if isinstance(source, event.Event):
+            source = source._instance.__dict__.get(source._event_descriptor._backing)
+
+        with self._lock:
+            if source in self._sources:
+                self._sources.remove(source)
+                self._unrecord(source)
+
+    def _unrecord(self, source:Delegate)->None:
+        """
+        Restores the type of a recorded delegate, an instrumented delegate is still instrumented.
+
+        Parameters:
+            source (Delegate): Recorded delegate.
+
+        Return:
+            None
+        """
+        with source._lock:
+            if "recorded" in getattr(source.__class__, "_layers", ()):
+                source.__class__ = _layered_type(source.__class__, "recorded", False)
+                source._recorder = None
+
+    def _append(self, event_id:int, args:tuple, kwds:Dict[str, Any])->None:
+        """
+        Buffers a raise before the callables are executed, the buffer is serialized into the log when it is full.
+
+        Parameters:
+            event_id (int): Id of the raised event.
+            args (tuple): Positional arguments of the raise.
+            kwds (Dict[str, Any]): Named arguments of the raise.
+
+        Return:
+            None
+        """
+        # payloads are (type, slot values, __dict__ copy) for (sender, EventArgs) arguments and (None, arguments after the sender, named arguments)
+        # for any other raise, they are built inline due a method call per raise would double the cost of recording
+        try:
+            if len(args) == 2 and not kwds and isinstance(args[1], EventArgs):
+                e = args[1]
+                layout = self._layouts.get(e.__class__) or self._layout(e.__class__)
+                attributes = getattr(e, "__dict__", None)
+                payload = (e.__class__, layout[1](e), None if attributes is None else attributes.copy())
+            else:
+                payload = (None, args[1:], kwds)
+        except Exception: # slots without value
+            self._drop(event_id)
+            return
+
+        if args:
+            sender = args[0]
+            item = (event_id, time_ns(), 0 if sender is None else id(sender), self._SENDER, payload)
+        else:
+            item = (event_id, time_ns(), 0, 0, payload)
+
+        with self._lock:
+            buffer = self._buffer
+            buffer.append(item)
+            full = len(buffer) >= self._capacity
+
+        if full:
+            self.flush()
+
+    def flush(self)->None:
+        """
+        Serializes the buffered raises into the log.
+
+        Return:
+            None
+        """
+        with self._lock:
+            buffer = self._buffer
+
+            if not buffer or self._map is None:
+                return
+
+            self._buffer = []
+            raises = buffer
+
+            try:
+                payloads = pickle.dumps([item[4] for item in raises], pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                payloads = None
+
+            if payloads is None: # some arguments can not be pickled, only those raises are dropped
+                raises = [item for item in raises if self._picklable(item)]
+                payloads = pickle.dumps([item[4] for item in raises], pickle.HIGHEST_PROTOCOL)
+
+            if raises:
+                ids, timestamps, senders, flags, _ = zip(*raises)
+                body = b"".join((array("I", ids).tobytes(), array("q", timestamps).tobytes(), array("Q", senders).tobytes(), bytes(flags), payloads))
+                self._write(self._RAISES, len(raises), body)
+
+    def _picklable(self, item:tuple)->bool:
+        """
+        Checks if the payload of a buffered raise can be pickled, the raise is dropped if it can not.
+
+        Parameters:
+            item (tuple): (event id, timestamp, sender id, flags, payload) of the raise.
+
+        Return:
+            bool: True if the payload can be pickled.
+        """
+        try:
+            pickle.dumps(item[4], pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            self._count_drop(item[0])
+            return False
+
+        return True
+
+    def _drop(self, event_id:int)->None:
+        """
+        Counts (and logs) a raise that can not be recorded due its arguments can not be serialized.
+
+        Parameters:
+            event_id (int): Id of the raised event.
+
+        Return:
+            None
+        """
+        with self._lock:
+            self._count_drop(event_id)
+
+    def _count_drop(self, event_id:int)->None:
+        """
+        Counts (and logs) a raise that can not be recorded, the lock must be held by the caller (see _drop).
+
+        Parameters:
+            event_id (int): Id of the raised event.
+
+        Return:
+            None
+        """
+        self._dropped += 1
+        _logger.warning("raise of event %d not recorded, its arguments can not be serialized", event_id, exc_info=True)
+
+    @classmethod
+    def _layout(cls, type:type)->tuple:
+        """
+        Gets the slot names of an EventArgs type (declared by the type and its base classes) and a getter of its values, computed once per type.
+
+        Parameters:
+            type (type): EventArgs type.
+
+        Return:
+            tuple: (slot names, getter returning a tuple with the slot values).
+        """
+        layout = cls._layouts.get(type)
+
+        if layout is None:
+            slots = []
+
+            for klass in reversed(type.__mro__):
+                declared = klass.__dict__.get("__slots__", ())
+                slots += [slot for slot in ((declared,) if isinstance(declared, str) else declared) if slot not in ("__dict__", "__weakref__")]
+
+            layout = cls._layouts[type] = (tuple(slots), _tuple_getter(slots))
+
+        return layout
+
+    def _write(self, kind:int, count:int, body:bytes)->None:
+        """
+        Appends a block to the log, the lock must be held by the caller.
+
+        Parameters:
+            kind (int): Block kind (names or raises).
+            count (int): Number of items of the block.
+            body (bytes): Block body.
+
+        Return:
+            None
+        """
+        start = self._length
+        end = start + self._BLOCK.size + len(body)
+
+        if end > len(self._map):
+            size = len(self._map)
+
+            while size < end:
+                size *= 2
+
+            self._map.close()
+            self._file.truncate(size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+
+        self._BLOCK.pack_into(self._map, start, kind, count, len(body))
+        self._map[start + self._BLOCK.size:end] = body
+        self._length = end
+        self._HEADER.pack_into(self._map, 0, self._MAGIC, end)
+
+    def close(self)->None:
+        """
+        Stops recording every recorded delegate, serializes the buffered raises and closes the log (the file is truncated to the log length).
+
+        Return:
+            None
+        """
+        for source in list(self._sources):
+            self._unrecord(source)
+
+        self._sources.clear()
+        self.flush()
+
+        with self._lock:
+            if self._map is not None:
+                self._map.flush()
+                self._map.close()
+                self._map = None
+                self._file.truncate(self._length)
+                self._file.close()
+
+    def __enter__(self)->"EventRecorder":
+        """
+        Return:
+            EventRecorder: Current instance.
+        """
+        return self
+
+    def __exit__(self, *exc_info:Any)->None:
+        """
+        Closes the log.
+        """
+        self.close()
+
+    @classmethod
+    def read(cls, path:str)->Iterator[tuple]:
+        """
+        Reads the raises recorded in a log.
+
+        Parameters:
+            path (str): Path of the log file.
+
+        Return:
+            Iterator[tuple]: (name, timestamp in ns, sender id, positional arguments, named arguments) of every raise, in order. The sender
+                of the raise is not recorded, the sender id (id of the object, 0 for None) is the first positional argument.
+
+        Raises:
+            ValueError: path is not an EventRecorder log.
+        """
+        names = {}
+
+        for kind, count, body in cls._blocks(path):
+            if kind == cls._NAMES:
+                names.update(pickle.loads(body))
+                continue
+
+            for event_id, timestamp, sender, flags, payload in cls._raises(count, body):
+                arguments = cls._arguments(payload)
+                yield names[event_id], timestamp, sender, ((sender,) if flags & cls._SENDER else ()) + arguments[0], arguments[1]
+
+    @classmethod
+    def replay(cls, path:str, targets:Dict[str, Callable[..., Any]], senders:Callable[[int], Any] | None = None)->int:
+        """
+        Replays the raises recorded in a log at full speed (without waiting between raises), executing the target of every raise with the
+        recorded arguments. Raises of events without target are skipped.
+
+        Parameters:
+            path (str): Path of the log file.
+            targets (Dict[str, Callable[..., Any]]): Callable (Delegate, subscriber...) executed for every recorded event name.
+            senders (Callable[[int], Any] | None): Resolves the sender passed to the targets from the recorded sender id, None to pass the sender id.
+
+        Return:
+            int: Number of raises replayed.
+
+        Raises:
+            ValueError: path is not an EventRecorder log.
+        """
+        by_id = {}
+        replayed = 0
+
+        for kind, count, body in cls._blocks(path):
+            if kind == cls._NAMES:
+                by_id.update((event_id, targets.get(name)) for event_id, name in pickle.loads(body))
+                continue
+
+            for event_id, timestamp, sender, flags, payload in cls._raises(count, body):
+                target = by_id[event_id]
+
+                if target is None:
+                    continue
+
+                if senders is not None:
+                    sender = senders(sender)
+
+                args, kwds = cls._arguments(payload)
+
+                if flags & cls._SENDER:
+                    target(sender, *args, **kwds)
+                else:
+                    target(*args, **kwds)
+
+                replayed += 1
+
+        return replayed
+
+    @classmethod
+    def _blocks(cls, path:str)->Iterator[tuple]:
+        """
+        Reads the blocks of a log.
+
+        Parameters:
+            path (str): Path of the log file.
+
+        Return:
+            Iterator[tuple]: (kind, count, body) of every block.
+
+        Raises:
+            ValueError: path is not an EventRecorder log.
+        """
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, length = cls._HEADER.unpack_from(data, 0)
+
+            if magic != cls._MAGIC:
+                raise ValueError("%s is not an EventRecorder log" % path)
+
+            position = cls._HEADER.size
+
+            while position < length:
+                kind, count, size = cls._BLOCK.unpack_from(data, position)
+                position += cls._BLOCK.size
+                yield kind, count, data[position:position + size]
+                position += size
+
+    @classmethod
+    def _raises(cls, count:int, body:bytes)->Iterator[tuple]:
+        """
+        Decodes the raises of a raises block.
+
+        Parameters:
+            count (int): Number of raises of the block.
+            body (bytes): Block body.
+
+        Return:
+            Iterator[tuple]: (event id, timestamp, sender id, flags, payload) of every raise.
+        """
+        view = memoryview(body)
+        ids = view[:4 * count].cast("I")
+        timestamps = view[4 * count:12 * count].cast("q")
+        senders = view[12 * count:20 * count].cast("Q")
+        flags = view[20 * count:21 * count]
+        return zip(ids, timestamps, senders, flags, pickle.loads(view[21 * count:]))
+
+    @classmethod
+    def _arguments(cls, payload:tuple)->tuple:
+        """
+        Rebuilds the arguments of a raise (without the sender) from its payload.
+
+        Parameters:
+            payload (tuple): Payload of the raise, (type, slot values, __dict__) for a raise with (sender, EventArgs) arguments,
+                (None, arguments after the sender, named arguments) for any other raise.
+
+        Return:
+            tuple: (positional arguments, named arguments).
+        """
+        type, values, attributes = payload
+
+        if type is None:
+            return values, attributes
+
+        e = type.__new__(type)
+
+        for slot, value in zip(cls._layout(type)[0], values):
+            object.__setattr__(e, slot, value)
+
+        if attributes:
+            e.__dict__.update(attributes)
+
+        return (e,), {}
+
+
+def _tuple_getter(names:List[str])->Callable[[Any], tuple]:
+    """
+    Creates a getter returning a tuple with the values of several attributes (attrgetter returns a single value for one attribute).
+
+    Parameters:
+        names (List[str]): Attribute names.
+
+    Return:
+        Callable[[Any], tuple]: getter.
+    """
+    if len(names) > 1:
+        return attrgetter(*names)
+
+    if not names:
+        return lambda value: ()
+
+    getter = attrgetter(names[0])
+    return lambda value: (getter(value),)
+
+
+_recorded_types:Dict[type, type] = {}
+
+
+def _recorded_type(base:type)->type:
+    """
+    Returns the recorded subtype of a delegate type (see EventRecorder.record), it buffers every execution of the delegate into its recorder before
+    executing it. Recorded types are created once per delegate type, and delegates that are not recorded do not execute any of this code.
+
+    Parameters:
+        base (type): Delegate type to record, without layers or instrumented (see _layered_type).
+
+    Return:
+        type: Recorded delegate type.
+    """
+    recorded = _recorded_types.get(base)
+
+    if recorded is not None:
+        return recorded
+
+    class RecordedDelegate(base):
+        """
+        Recorded delegate type.
+
+        Attributes:
+            _recorder (EventRecorder): Recorder of the executions.
+            _event_id (int): Id of the delegate in the log.
+            _plain (type): Delegate type that was recorded (without layers).
+            _layers (frozenset): Layers of the type (see _layered_type).
+        """
+        _recorder:EventRecorder
+        _event_id:int
+        _plain:type = getattr(base, "_plain", base)
+        _layers:frozenset = getattr(base, "_layers", frozenset()) | {"recorded"}
+
+        def __call__(self, *args:Any, **kwds:Any)->Any:
+            """
+            Records the execution and executes the delegate.
 
             Return:
-                staticevent.StaticEvent: Current instance.
+                Any: Result of the delegate.
             """
-            self._event_descriptor._fadd(value)
-            return self
+            self._recorder._append(self._event_id, args, kwds)
+            return base.__call__(self, *args, **kwds)
+
+        def invoke(self, *args:Any, **kwds:Any)->Any:
+            """
+            Records the execution and executes the delegate discarding its results.
+
+            Return:
+                Any: Result of invoke of the delegate.
+            """
+            self._recorder._append(self._event_id, args, kwds)
+            return base.invoke(self, *args, **kwds)
+
+        if hasattr(base, "invoke_iter"): # not hidden by the delegate type (see _Unsupported)
+            def invoke_iter(self, *args:Any, **kwds:Any)->Iterator[Any]:
+                """
+                Records the execution and executes the delegate lazily.
+
+                Return:
+                    Iterator[Any]: Generator of the results of the callables.
+                """
+                self._recorder._append(self._event_id, args, kwds)
+                return base.invoke_iter(self, *args, **kwds)
+
+    RecordedDelegate.__name__ = RecordedDelegate.__qualname__ = base.__name__
+    RecordedDelegate.__module__ = base.__module__
+    _recorded_types[base] = RecordedDelegate
+    return RecordedDelegate
+
+
+class RemoteDelegate(Delegate[T]):
+    """
+    RemoteDelegate is a Delegate whose executions (raises) are forwarded to the RemoteListener objects of other processes of the same host
+    connected to its name, besides executing its own callables. It can replace the Delegate of any event, so events raised in a process
+    can be subscribed from other processes:
+
+        self._moved = RemoteDelegate("person-moved") # publisher process, the event is implemented as usual
+
+        listener = RemoteListener("person-moved")   # subscriber process
+        listener += school.person_moved
+        listener.start()                             # or listener.poll(timeout) from an existing loop
+
+    Transports:
+        - "ring": a broadcast ring buffer in a memory mapped file (in /dev/shm when it exists), every listener reads the raises at its own
+          pace without any system call on the publisher. The publisher never waits for the listeners, a listener falling behind more than
+          the ring size loses raises (see RemoteListener.overruns). Only available on x86, it relies on its memory ordering (see _RingWriter).
+        - "socket": a Unix domain socket, raises are sent to every connected listener, the publisher waits (backpressure) when a listener
+          does not read them. Used when the ring can not be created (when transport is None). Listeners waiting for raises are woken up
+          by the socket instead of polling the ring, so the latency of sparse raises is lower.
+
+    Raises are encoded after the callables of the delegate are executed, so a raise that can not be encoded never prevents the local
+    dispatch: the sender is not forwarded (listeners receive themselves as sender) and the only argument after it must be a slotted EventArgs
+    (see @eventargs) whose slot values are None, bool, int, float, str or bytes, encoded as its type name and slot values (any other argument
+    is a TypeError handled by the error policy of the delegate, see _forward). Values changed by the callables (cancel...) are forwarded.
+    Nothing is pickled, listeners only build EventArgs of types already imported by its process. Encoded raises are buffered and sent
+    together when batch raises are buffered, call flush to send the buffered raises before (at the end of a tick, for example).
+
+    Transports are created with mode 0600 in a directory of the current user (python_sharp-<uid>, mode 0700), listeners refuse transports
+    of other users, so only processes of the same user can publish raises to a listener.
+
+    Attributes:
+        _name (str): Name of the delegate, listeners connect to it.
+        _transport (str): Transport, "ring" or "socket".
+        _writer (_RingWriter | _SocketWriter): Sends the raises to the listeners.
+        _pending (List[bytes]): Encoded raises not sent yet.
+        _capacity (int): Number of raises buffered before sending them.
+        _sending (threading.Lock): Serializes the buffer and the transport.
+    """
+    _name:str
+    _transport:str
+    _writer:"_RingWriter | _SocketWriter"
+    _pending:List[bytes]
+    _capacity:int
+    _sending:threading.Lock
+
+    def __init__(self, name:str, callable:Callable[..., T] | None = None, batch:int = 1, transport:str | None = None, size:int = 1 << 20, errors:str = "raise_first")->None:
+        """
+        RemoteDelegate constructor, creates the transport (replacing the transport of a previous RemoteDelegate with the same name).
+
+        Parameters:
+            name (str): Name of the delegate, listeners connect to it.
+            callable (Callable[..., T] | None): first callable to be added to the collection of callables.
+            batch (int): Number of raises buffered before sending them, 1 to send every raise when it is executed.
+            transport (str | None): "ring", "socket" or None to use the ring, or the socket when the ring can not be created.
+            size (int): Size of the ring in bytes (ring transport), the raises buffered by batch must fit in it.
+            errors (str): Error policy of the callables of the delegate (see Delegate constructor).
+
+        Return:
+            None
+
+        Raises:
+            ValueError: transport is not a valid transport, batch is not positive or name contains a path separator.
+            OSError: The transport can not be created.
+        """
+        if transport not in (None, "ring", "socket"):
+            raise ValueError("transport must be 'ring', 'socket' or None, not %r" % (transport,))
+
+        if batch < 1:
+            raise ValueError("batch must be positive, not %r" % (batch,))
+
+        super().__init__(callable, errors)
+        self._name = name
+        self._pending = []
+        self._capacity = batch
+        self._sending = threading.Lock()
+
+        if transport == "ring" or (transport is None and _RING_ORDERED): # the socket is used right away where the ring is refused
+            try:
+                self._writer = _RingWriter(_remote_address(name, "ring"), size)
+                self._transport = "ring"
+                return
+            except OSError:
+                if transport == "ring":
+                    raise
+                _logger.warning("ring of RemoteDelegate '%s' can not be created, using a socket", name, exc_info=True)
+
+        self._writer = _SocketWriter(_remote_address(name, "socket"))
+        self._transport = "socket"
+
+    @property
+    def name(self)->str:
+        """
+        Gets property value.
+
+        Return:
+            str: name of the delegate.
+        """
+        return self._name
+
+    @property
+    def transport(self)->str:
+        """
+        Gets property value.
+
+        Return:
+            str: transport, "ring" or "socket".
+        """
+        return self._transport
+
+    def __call__(self, *args:Any, **kwds:Any)->tuple:
+        """
+        Executes the delegate and forwards the execution to the listeners (also when a callable raises an exception).
+
+        Return:
+            tuple: Result of the delegate.
+
+        Raises:
+            TypeError: The arguments can not be encoded and the error policy is "raise_first", the delegate is not executed (see _forward).
+        """
+        return self._forward(super().__call__, args, kwds)
+
+    def invoke(self, *args:Any, **kwds:Any)->None:
+        """
+        Executes the delegate discarding its results and forwards the execution to the listeners (also when a callable raises an exception).
+
+        Return:
+            None
+
+        Raises:
+            TypeError: The arguments can not be encoded and the error policy is "raise_first", the delegate is not executed (see _forward).
+        """
+        self._forward(super().invoke, args, kwds)
+
+    def invoke_iter(self, *args:Any, **kwds:Any)->Iterator[T]:
+        """
+        Executes the delegate lazily, the execution is forwarded to the listeners when the iterator is created.
+
+        Return:
+            Iterator[T]: Generator of the results of the callables.
+
+        Raises:
+            TypeError: The arguments can not be encoded and the error policy is "raise_first" (see _forward).
+        """
+        return self._forward(super().invoke_iter, args, kwds)
+
+    def _forward(self, execute:Callable[..., Any], args:tuple, kwds:Dict[str, Any])->Any:
+        """
+        Encodes a raise, executes it locally and then buffers it for the listeners. Arguments that can not be encoded are handled by the
+        error policy: the TypeError is raised before the local execution ("raise_first"), or after it, raised in an ExceptionGroup
+        ("continue_and_aggregate") or logged ("log_and_continue"). The local outcome always reaches the caller: when the local execution
+        raises an exception, errors encoding or sending the raise are logged instead of replacing it.
+
+        Parameters:
+            execute (Callable[..., Any]): Local execution (__call__, invoke or invoke_iter of Delegate).
+            args (tuple): Positional arguments of the raise.
+            kwds (Dict[str, Any]): Named arguments of the raise.
+
+        Return:
+            Any: Result of the local execution.
+
+        Raises:
+            TypeError: The arguments can not be encoded (see _encode_arguments) and the error policy is "raise_first".
+            ExceptionGroup: The arguments can not be encoded and the error policy is "continue_and_aggregate".
+        """
+        record = failure = None
+
+        try:
+            record = _encode_arguments(args, kwds)
+        except TypeError as error:
+            if self._errors == "raise_first":
+                raise
+            failure = error
+
+        try:
+            result = execute(*args, **kwds)
+        except BaseException:
+            try:
+                if failure is not None:
+                    raise failure
+                self._send(record)
+            except Exception:
+                _logger.exception("raise of RemoteDelegate '%s' not forwarded", self._name)
+            raise
+
+        if failure is not None:
+            self._raise_or_log([failure])
+        else:
+            self._send(record)
+
+        return result
+
+    def _send(self, record:bytes)->None:
+        """
+        Buffers an encoded raise, the buffered raises are sent when the buffer is full.
+
+        Parameters:
+            record (bytes): Encoded raise.
+
+        Return:
+            None
+        """
+        with self._sending:
+            pending = self._pending
+            pending.append(record)
+
+            if len(pending) >= self._capacity:
+                self._flush()
+
+    def flush(self)->None:
+        """
+        Sends the buffered raises to the listeners.
+
+        Return:
+            None
+        """
+        with self._sending:
+            self._flush()
+
+    def _flush(self)->None:
+        """
+        Sends the buffered raises to the listeners as one frame, the sending lock must be held by the caller.
+
+        Return:
+            None
+        """
+        pending = self._pending
+
+        if pending:
+            self._pending = []
+            body = b"".join(pending)
+            self._writer.send(_REMOTE_FRAME.pack(len(body), len(pending)) + body)
+
+    def close(self)->None:
+        """
+        Sends the buffered raises and closes the transport (listeners do not receive more raises).
+
+        Return:
+            None
+        """
+        with self._sending:
+            try:
+                self._flush()
+            finally:
+                self._writer.close()
+
+    def __enter__(self)->"RemoteDelegate":
+        """
+        Return:
+            RemoteDelegate: Current instance.
+        """
+        return self
+
+    def __exit__(self, *exc_info:Any)->None:
+        """
+        Closes the transport.
+        """
+        self.close()
+
+
+class RemoteListener(Delegate[T]):
+    """
+    RemoteListener is a Delegate executed with the raises of a RemoteDelegate of another process (see RemoteDelegate), its callables receive
+    the listener as sender and the arguments of the raise after the sender.
+
+    Raises are received by poll (from an existing loop) or by a daemon thread (see start). A listener only receives the raises sent after it
+    connected to the RemoteDelegate (ring transport) or sent after the RemoteDelegate accepted its connection, on its next send (socket transport).
+
+    Attributes:
+        _transport (str): Transport, "ring" or "socket".
+        _reader (_RingReader | _SocketReader): Receives the raises.
+        _received (deque): Decoded raises (args, kwds) not executed yet.
+        _thread (threading.Thread | None): Thread receiving the raises, None if it was not started.
+        _closed (bool): True when the listener does not receive more raises.
+    """
+    _transport:str
+    _reader:"_RingReader | _SocketReader"
+    _received:deque
+    _thread:threading.Thread | None
+    _closed:bool
+
+    def __init__(self, name:str, callable:Callable[..., T] | None = None, transport:str | None = None, errors:str = "raise_first")->None:
+        """
+        RemoteListener constructor, connects to the transport of a RemoteDelegate.
+
+        Parameters:
+            name (str): Name of the RemoteDelegate.
+            callable (Callable[..., T] | None): first callable to be added to the collection of callables.
+            transport (str | None): "ring", "socket" or None to use the transport created by the RemoteDelegate.
+            errors (str): Error policy of the callables of the listener (see Delegate constructor).
+
+        Return:
+            None
+
+        Raises:
+            ValueError: transport is not a valid transport or name contains a path separator.
+            FileNotFoundError: There is no RemoteDelegate with that name.
+            OSError: The transport can not be opened.
+        """
+        if transport not in (None, "ring", "socket"):
+            raise ValueError("transport must be 'ring', 'socket' or None, not %r" % (transport,))
+
+        super().__init__(callable, errors)
+        self._received = deque()
+        self._thread = None
+        self._closed = False
+
+        if transport is None:
+            transport = "ring" if os.path.exists(_remote_address(name, "ring")) else "socket"
+
+        self._reader = _RingReader(_remote_address(name, "ring")) if transport == "ring" else _SocketReader(_remote_address(name, "socket"))
+        self._transport = transport
+
+    @property
+    def transport(self)->str:
+        """
+        Gets property value.
+
+        Return:
+            str: transport, "ring" or "socket".
+        """
+        return self._transport
+
+    @property
+    def overruns(self)->int:
+        """
+        Gets the number of times the listener fell behind the ring of the RemoteDelegate and lost raises (always 0 with the socket transport).
+
+        Return:
+            int: Number of overruns.
+        """
+        return self._reader.overruns
+
+    def poll(self, timeout:float = 0.0)->int:
+        """
+        Receives the raises sent by the RemoteDelegate (waiting for them up to timeout seconds) and executes the listener once per raise, in order.
+        If a callable raises an exception (see the error policy) the raises not executed yet are executed by the next poll.
+
+        Parameters:
+            timeout (float): Maximum seconds waiting for raises, 0 to return right away.
+
+        Return:
+            int: Number of raises executed.
+        """
+        received = self._received
+
+        if not received:
+            data = self._reader.receive(timeout)
+
+            if data:
+                received.extend(_decode_frames(data))
+
+        executed = 0
+
+        while received:
+            args, kwds = received.popleft()
+            self.invoke(self, *args, **kwds)
+            executed += 1
+
+        return executed
+
+    def start(self)->None:
+        """
+        Starts a daemon thread receiving the raises and executing the listener (exceptions raised by the callables are logged), the thread
+        stops when the listener is closed.
+
+        Return:
+            None
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._listen, name="RemoteListener", daemon=True)
+            self._thread.start()
+
+    def _listen(self)->None:
+        """
+        Receives the raises until the listener is closed (target of the thread started by start method).
+
+        Return:
+            None
+        """
+        while not self._closed:
+            try:
+                self.poll(0.05)
+            except Exception:
+                _logger.exception("RemoteListener callable raised an exception")
+
+    def close(self)->None:
+        """
+        Stops receiving raises (waiting for the thread started by start method) and closes the transport.
+
+        Return:
+            None
+        """
+        self._closed = True
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+        self._reader.close()
+
+    def __enter__(self)->"RemoteListener":
+        """
+        Return:
+            RemoteListener: Current instance.
+        """
+        return self
+
+    def __exit__(self, *exc_info:Any)->None:
+        """
+        Closes the transport.
+        """
+        self.close()
+
+
+def _remote_address(name:str, transport:str)->str:
+    """
+    Gets the path of the transport of a RemoteDelegate: ring files are created in /dev/shm (memory backed) when it exists, sockets in the
+    temporary directory, both inside a directory of the current user (see _remote_directory).
+
+    Parameters:
+        name (str): Name of the RemoteDelegate.
+        transport (str): "ring" or "socket".
+
+    Return:
+        str: Path of the ring file or the socket.
+
+    Raises:
+        ValueError: name contains a path separator.
+        PermissionError: The directory of the user belongs to another user or other users can access it.
+    """
+    if os.sep in name or (os.altsep and os.altsep in name):
+        raise ValueError("RemoteDelegate name must not contain a path separator, got %r" % (name,))
+
+    if transport == "ring":
+        return os.path.join(_remote_directory("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()), "%s.ring" % name)
+
+    return os.path.join(_remote_directory(tempfile.gettempdir()), "%s.sock" % name)
+
+
+def _remote_directory(base:str)->str:
+    """
+    Gets the directory of the transports of the current user in a shared directory (python_sharp-<uid>), created with mode 0700 so other
+    users can not create, replace or read the transports of the user.
+
+    Parameters:
+        base (str): Shared directory (/dev/shm or the temporary directory).
+
+    Return:
+        str: Path of the directory.
+
+    Raises:
+        PermissionError: The directory belongs to another user or other users can access it.
+    """
+    path = os.path.join(base, "python_sharp-%d" % _remote_uid())
+
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+
+    status = os.lstat(path)
+
+    if not stat.S_ISDIR(status.st_mode) or not _remote_owned(status) or (_remote_uid() and status.st_mode & 0o077):
+        raise PermissionError("%s is not a private directory of the current user" % path)
+
+    return path
+
+
+def _remote_uid()->int:
+    """
+    Gets the user id of the process, 0 where user ids are not supported (Windows, the temporary directory already belongs to the user).
+
+    Return:
+        int: User id.
+    """
+    return os.getuid() if hasattr(os, "getuid") else 0
+
+
+def _remote_owned(status:os.stat_result)->bool:
+    """
+    Checks if a transport file belongs to the current user, the transports of other users are never opened.
+
+    Parameters:
+        status (os.stat_result): Status of the file.
+
+    Return:
+        bool: True if the file belongs to the current user.
+    """
+    return not hasattr(os, "getuid") or status.st_uid == os.getuid()
+
+
+class _RingWriter:
+    """
+    _RingWriter is a class that represents the publisher side of a broadcast ring buffer in a memory mapped file (see RemoteDelegate).
+
+    Ring format (little endian): 32 bytes header (magic, write position, capacity, reserved position) followed by capacity bytes of data.
+    Like a seqlock, the reserved position is increased by the frame size before the frame is copied at write position % capacity (wrapping
+    around the end of the data), and then the write position is increased too, so readers never see the position of a frame before its
+    bytes, and a reader checks the reserved position after copying the frames to detect a frame being copied over them. Python can not issue memory fences, so this relies on the stores of the publisher
+    being seen in order by the other cores and on loads not being reordered, as x86 guarantees: the ring is refused on any other architecture
+    (ARM, POWER... see _RING_ORDERED) and RemoteDelegate falls back to the socket transport. The write position only grows, readers compare
+    it with its own position.
+
+    Attributes:
+        _path (str): Path of the ring file.
+        _file (Any): Ring file.
+        _map (mmap.mmap | None): Memory map of the ring file, None once closed.
+        _cursor (memoryview): Write position in the header (uint64).
+        _reserved (memoryview): Reserved position in the header (uint64), end of the frame being copied.
+        _capacity (int): Size of the ring data in bytes.
+        _position (int): Write position (bytes written since the ring was created).
+    """
+    _MAGIC = b"PYSHRNG2"
+    _HEADER = struct.Struct("<8sQQQ")
+
+    _path:str
+    _file:Any
+    _map:mmap.mmap | None
+    _cursor:memoryview
+    _reserved:memoryview
+    _capacity:int
+    _position:int
+
+    def __init__(self, path:str, size:int)->None:
+        """
+        _RingWriter constructor, creates the ring file with mode 0600 (a previous file is unlinked first, readers still mapping it are not
+        affected).
+
+        Parameters:
+            path (str): Path of the ring file.
+            size (int): Size of the ring data in bytes.
+
+        Return:
+            None
+
+        Raises:
+            OSError: The architecture does not order the stores of the ring (see _RING_ORDERED).
+        """
+        _check_ring_ordered()
+
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+        self._path = path
+        self._file = open(os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o600), "r+b")
+
+        try:
+            self._file.truncate(self._HEADER.size + size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        except BaseException:
+            self._file.close()
+            os.unlink(path)
+            raise
+
+        self._capacity = size
+        self._position = 0
+        self._HEADER.pack_into(self._map, 0, self._MAGIC, 0, size, 0)
+        self._cursor = _ring_cursor(self._map)
+        self._reserved = _ring_cursor(self._map, 24)
+
+    def send(self, frame:bytes)->None:
+        """
+        Copies a frame into the ring, reserving its bytes first (see _RingReader._read).
+
+        Parameters:
+            frame (bytes): Frame to copy.
+
+        Return:
+            None
+
+        Raises:
+            ValueError: The frame is larger than the ring or the ring is closed.
+        """
+        if self._map is None:
+            raise ValueError("ring is closed")
 
-        def __isub__(self, value: Callable[[object, EventArgs], None]) -> "staticevent.StaticEvent":
-            """
-            Executes the _fremove (responsible of describe how the callable sholud be removed) passing the callable as parameter.
+        size = len(frame)
+        capacity = self._capacity
 
-            Parameters:
-                value (Callable[[object,EventArgs], None]): callable to be passed as parammeter to _fremove.
+        if size > capacity:
+            raise ValueError("frame of %d bytes does not fit in a ring of %d bytes (use a larger size or a smaller batch)" % (size, capacity))
 
-            Return:
-                staticevent.StaticEvent: Current instance.
-            """
-            self._event_descriptor._fremove(value)
-            return self
+        start = self._HEADER.size + self._position % capacity
+        end = self._HEADER.size + capacity
+        head = end - start
+        self._reserved[0] = self._position + size
 
+        if size <= head:
+            self._map[start:start + size] = frame
+        else:
+            self._map[start:end] = frame[:head]
+            self._map[self._HEADER.size:self._HEADER.size + size - head] = frame[head:]
 
-    def _get_proxy(self, instance: Any, owner: type) -> "staticevent.StaticEvent":
+        self._position += size
+        self._cursor[0] = self._position
+
+    def close(self)->None:
         """
-        Allows provide the specific proxy use for every child of this class
+        Closes and unlinks the ring file.
+
+        Return:
+            None
+        """
+        if self._map is not None:
+            self._cursor.release()
+            self._reserved.release()
+            self._map.close()
+            self._map = None
+            self._file.close()
+
+            try:
+                os.unlink(self._path)
+            except FileNotFoundError: # replaced by another RemoteDelegate with the same name
+                pass
+
+
+class _RingReader:
+    """
+    _RingReader is a class that represents a listener side of a broadcast ring buffer (see _RingWriter), it reads the frames written since
+    it was created. If the writer overwrites frames that were not read yet, they are lost and the reader continues from the write position.
+
+    Attributes:
+        _file (Any): Ring file.
+        _map (mmap.mmap): Read only memory map of the ring file.
+        _cursor (memoryview): Write position in the header (uint64).
+        _reserved (memoryview): Reserved position in the header (uint64), end of the frame being copied by the writer.
+        _capacity (int): Size of the ring data in bytes.
+        _position (int): Read position (bytes read since the ring was created).
+        _overruns (int): Number of times frames were lost.
+    """
+    _file:Any
+    _map:mmap.mmap
+    _cursor:memoryview
+    _reserved:memoryview
+    _capacity:int
+    _position:int
+    _overruns:int
+
+    def __init__(self, path:str)->None:
+        """
+        _RingReader constructor, maps the ring file.
 
         Parameters:
-            instance (Any): The instance of the owning class. This parameter
-                is `None` when accessed from the class instead of from the instance.
-            owner (type): The type of the owning class.
+            path (str): Path of the ring file.
 
         Return:
-            staticevent.StaticEvent: Descriptor proxy.
+            None
+
+        Raises:
+            ValueError: path is not a ring file.
+            PermissionError: The ring file belongs to another user.
+            OSError: The architecture does not order the loads of the ring (see _RING_ORDERED).
         """
-        if self._proxy is None:
-            self._proxy = staticevent.StaticEvent(self)
-        return self._proxy
+        _check_ring_ordered()
+        self._file = open(path, "rb")
+
+        try:
+            if not _remote_owned(os.fstat(self._file.fileno())):
+                raise PermissionError("%s belongs to another user" % path)
+
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self._position, self._capacity, _ = _RingWriter._HEADER.unpack_from(self._map, 0)
+        except BaseException:
+            self._file.close()
+            raise
+
+        if magic != _RingWriter._MAGIC:
+            self._map.close()
+            self._file.close()
+            raise ValueError("%s is not a RemoteDelegate ring" % path)
+
+        self._cursor = _ring_cursor(self._map)
+        self._reserved = _ring_cursor(self._map, 24)
+        self._overruns = 0
+
+    @property
+    def overruns(self)->int:
+        """
+        Gets property value.
+
+        Return:
+            int: number of times frames were lost.
+        """
+        return self._overruns
+
+    def receive(self, timeout:float)->bytes:
+        """
+        Reads the frames written since the last call, waiting for them up to timeout seconds (polling with an increasing sleep).
+
+        Parameters:
+            timeout (float): Maximum seconds waiting for frames.
+
+        Return:
+            bytes: Complete frames read, empty if there are no frames.
+        """
+        data = self._read()
+
+        if data or timeout <= 0:
+            return data
+
+        deadline = perf_counter() + timeout
+        delay = 0.00001
+
+        while not data and perf_counter() < deadline:
+            sleep(delay)
+            delay = min(delay * 2, 0.001)
+            data = self._read()
+
+        return data
+
+    def _read(self)->bytes:
+        """
+        Reads the frames written since the last call. The copy is discarded if the reserved position shows that the writer started to
+        copy a frame over the bytes being read (even if it did not finish it yet).
+
+        Return:
+            bytes: Complete frames read, empty if there are no frames.
+        """
+        data_map = self._map
+        position = self._position
+        written = self._cursor[0]
+
+        if written <= position:
+            return b""
+
+        capacity = self._capacity
+        offset = _RingWriter._HEADER.size
+
+        if written - position <= capacity:
+            start = offset + position % capacity
+            size = written - position
+            head = offset + capacity - start
+            data = data_map[start:start + size] if size <= head else data_map[start:start + head] + data_map[offset:offset + size - head]
+            current = self._reserved[0]
+
+            if current - position <= capacity: # no frame was copied over them while they were copied
+                self._position = written
+                return data
+
+            current = self._cursor[0]
+        else:
+            current = written
+
+        self._overruns += 1
+        self._position = current
+        _logger.warning("RemoteListener fell behind the ring, %d bytes of raises lost", current - position)
+        return b""
+
+    def close(self)->None:
+        """
+        Closes the ring file.
+
+        Return:
+            None
+        """
+        self._cursor.release()
+        self._reserved.release()
+        self._map.close()
+        self._file.close()
+
+
+# architectures whose memory model keeps the stores (and the loads) of a core in program order, the only ones where the ring can be used
+_RING_ORDERED = platform.machine().lower() in ("x86_64", "amd64", "x86", "i386", "i486", "i586", "i686")
+
+
+def _check_ring_ordered()->None:
+    """
+    Checks if the ring transport can be used in this architecture (see _RingWriter).
+
+    Return:
+        None
+
+    Raises:
+        OSError: The architecture may reorder the stores or the loads of the ring.
+    """
+    if not _RING_ORDERED:
+        raise OSError("the ring transport requires x86 memory ordering, %s may reorder its stores (use the socket transport)" % (platform.machine() or "this architecture",))
+
+
+def _ring_cursor(map:mmap.mmap, offset:int = 8)->memoryview:
+    """
+    Gets a view of a position in the header of a ring. The position is read and written through the view (a single 8 bytes copy)
+    and not with struct, due struct.pack_into clears the bytes before packing them and readers would see a position of 0.
+
+    Parameters:
+        map (mmap.mmap): Memory map of the ring file.
+        offset (int): Offset of the position in the header, 8 for the write position and 24 for the reserved position.
+
+    Return:
+        memoryview: uint64 view of the position, it must be released before closing the map.
+    """
+    return memoryview(map)[offset:offset + 8].cast("Q")
+
+
+class _SocketWriter:
+    """
+    _SocketWriter is a class that represents the publisher side of a Unix domain socket transport (see RemoteDelegate), it sends every frame
+    to every connected listener. Pending connections are accepted before sending a frame, so the publisher does not need a thread.
+
+    Attributes:
+        _path (str): Path of the socket.
+        _socket (socket.socket | None): Listening socket, None once closed.
+        _connections (List[socket.socket]): Connected listeners.
+    """
+    _path:str
+    _socket:socket.socket | None
+    _connections:List[socket.socket]
+
+    def __init__(self, path:str)->None:
+        """
+        _SocketWriter constructor, creates the socket with mode 0600 (a previous socket with the same path is unlinked first).
+
+        Parameters:
+            path (str): Path of the socket.
+
+        Return:
+            None
+        """
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+        self._path = path
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            self._socket.bind(path)
+            os.chmod(path, 0o600)
+            self._socket.listen()
+        except BaseException:
+            self._socket.close()
+            raise
+
+        self._socket.setblocking(False)
+        self._connections = []
+
+    @property
+    def overruns(self)->int:
+        """
+        Return:
+            int: always 0, frames are never lost.
+        """
+        return 0
+
+    def send(self, frame:bytes)->None:
+        """
+        Sends a frame to every connected listener (listeners that are gone are discarded).
+
+        Parameters:
+            frame (bytes): Frame to send.
+
+        Return:
+            None
+
+        Raises:
+            ValueError: The socket is closed.
+        """
+        if self._socket is None:
+            raise ValueError("socket is closed")
+
+        while True:
+            try:
+                connection, _ = self._socket.accept()
+            except (BlockingIOError, InterruptedError):
+                break
+
+            connection.setblocking(True)
+            self._connections.append(connection)
+
+        for connection in list(self._connections):
+            try:
+                connection.sendall(frame)
+            except OSError:
+                self._connections.remove(connection)
+                connection.close()
+
+    def close(self)->None:
+        """
+        Closes the connections and unlinks the socket.
+
+        Return:
+            None
+        """
+        if self._socket is not None:
+            for connection in self._connections:
+                connection.close()
+
+            self._connections.clear()
+            self._socket.close()
+            self._socket = None
+
+            try:
+                os.unlink(self._path)
+            except FileNotFoundError:
+                pass
+
+
+class _SocketReader:
+    """
+    _SocketReader is a class that represents a listener side of a Unix domain socket transport (see _SocketWriter).
+
+    Attributes:
+        _socket (socket.socket): Connected socket.
+        _pending (bytearray): Bytes received of an incomplete frame.
+        _closed (bool): True when the publisher closed the connection.
+    """
+    _socket:socket.socket
+    _pending:bytearray
+    _closed:bool
+
+    def __init__(self, path:str)->None:
+        """
+        _SocketReader constructor, connects to the socket.
+
+        Parameters:
+            path (str): Path of the socket.
+
+        Return:
+            None
+
+        Raises:
+            PermissionError: The socket belongs to another user.
+        """
+        if not _remote_owned(os.lstat(path)):
+            raise PermissionError("%s belongs to another user" % path)
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            self._socket.connect(path)
+        except BaseException:
+            self._socket.close()
+            raise
+
+        self._pending = bytearray()
+        self._closed = False
+
+    @property
+    def overruns(self)->int:
+        """
+        Return:
+            int: always 0, frames are never lost.
+        """
+        return 0
+
+    def receive(self, timeout:float)->bytes:
+        """
+        Receives the frames sent by the publisher, waiting for them up to timeout seconds.
+
+        Parameters:
+            timeout (float): Maximum seconds waiting for frames.
+
+        Return:
+            bytes: Complete frames received, empty if there are no frames.
+        """
+        if self._closed:
+            sleep(timeout) # same as waiting for frames that are never sent
+            return b""
+
+        self._socket.settimeout(timeout if timeout > 0 else 0.0)
+
+        try:
+            chunk = self._socket.recv(1 << 16)
+        except (BlockingIOError, TimeoutError, InterruptedError):
+            return b""
+
+        if not chunk:
+            self._closed = True
+            return b""
+
+        pending = self._pending
+        pending += chunk
+        end = 0
+
+        while end + _REMOTE_FRAME.size <= len(pending):
+            size = _REMOTE_FRAME.unpack_from(pending, end)[0] + _REMOTE_FRAME.size
+
+            if end + size > len(pending):
+                break
+
+            end += size
+
+        data = bytes(pending[:end])
+        del pending[:end]
+        return data
+
+    def close(self)->None:
+        """
+        Closes the socket.
+
+        Return:
+            None
+        """
+        self._socket.close()
+
+
+# frames are (size of the raises:uint32, number of raises:uint32) followed by the raises, every raise is a kind (uint8) followed by:
+#   - _REMOTE_PACKED: key length (uint16), key ("module:qualname|format", format of the slot values) and the slot values packed with that
+#     format, used for slotted EventArgs whose values are int64, float64 or bool.
+#   - _REMOTE_SLOTTED: type name length (uint16), type name ("module:qualname"), number of values (uint16) and the tagged slot values.
+# tagged values are a tag (uint8) followed by the value: nothing (None, False, True), int64, float64, or length (uint32) and bytes (utf-8 str
+# or bytes). Nothing is pickled, listeners only build EventArgs of types already imported by its process.
+_REMOTE_FRAME = struct.Struct("<II")
+_REMOTE_PACKED, _REMOTE_SLOTTED = 0, 1
+_VALUE_NONE, _VALUE_FALSE, _VALUE_TRUE, _VALUE_INT, _VALUE_FLOAT, _VALUE_STR, _VALUE_BYTES = range(7)
+_PACKED_FORMATS = {int: "q", float: "d", bool: "?"}
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
+
+_remote_names:Dict[type, bytes] = {}
+_remote_packers:Dict[tuple, struct.Struct | None] = {}
+_remote_types:Dict[bytes, type | None] = {}
+_remote_layouts:Dict[bytes, tuple] = {}
+
+
+def _encode_arguments(args:tuple, kwds:Dict[str, Any])->bytes:
+    """
+    Encodes the arguments of a raise (without the sender) for the listeners of a RemoteDelegate, only slotted EventArgs can be encoded (the
+    listeners never unpickle nor import what they receive).
+
+    Parameters:
+        args (tuple): Positional arguments of the raise.
+        kwds (Dict[str, Any]): Named arguments of the raise.
+
+    Return:
+        bytes: Encoded raise.
+
+    Raises:
+        TypeError: The arguments are not a slotted EventArgs after the sender, or some slot value can not be encoded.
+    """
+    if len(args) == 2 and not kwds:
+        e = args[1]
+        cls = e.__class__
+        name = _remote_names.get(cls)
+
+        if name is None:
+            name = _remote_name(cls)
+
+        if name:
+            values = (EventRecorder._layouts.get(cls) or EventRecorder._layout(cls))[1](e)
+            kinds = (cls, tuple(map(type, values)))
+            packer = _remote_packers.get(kinds, False)
+
+            if packer is False:
+                packer = _remote_packer(name, kinds)
+
+            if packer is not None:
+                try:
+                    return packer.pack(packer.prefix, *values)
+                except struct.error: # int out of the int64 range, encoded as tagged values
+                    pass
+
+            return _encode_values(name, values)
+
+    raise TypeError("RemoteDelegate only forwards a slotted EventArgs after the sender (see @eventargs), got %s" % (
+        ", ".join(type(arg).__qualname__ for arg in args[1:]) or "no arguments",))
+
+
+def _encode_values(name:bytes, values:tuple)->bytes:
+    """
+    Encodes the slot values of a slotted EventArgs as tagged values.
+
+    Parameters:
+        name (bytes): Type name.
+        values (tuple): Slot values.
+
+    Return:
+        bytes: Encoded raise.
+
+    Raises:
+        TypeError: Some value is not None, a bool, an int, a float, a str or bytes.
+    """
+    formats = ["<BH%dsH" % len(name)]
+    items = [_REMOTE_SLOTTED, len(name), name, len(values)]
+
+    # one struct.pack per raise, a pack per value would cost more than pickling the whole EventArgs
+    for value in values:
+        kind = value.__class__
+
+        if kind is int and -0x8000000000000000 <= value <= 0x7FFFFFFFFFFFFFFF:
+            formats.append("Bq")
+            items += (_VALUE_INT, value)
+        elif kind is float:
+            formats.append("Bd")
+            items += (_VALUE_FLOAT, value)
+        elif value is None or kind is bool:
+            formats.append("B")
+            items.append(_VALUE_NONE if value is None else _VALUE_TRUE if value else _VALUE_FALSE)
+        else:
+            if kind is str:
+                tag, value = _VALUE_STR, value.encode()
+            elif kind is bytes:
+                tag = _VALUE_BYTES
+            else:
+                raise TypeError("RemoteDelegate can not encode a %s slot value, only None, bool, int, float, str and bytes" % (kind.__qualname__,))
+
+            formats.append("BI%ds" % len(value))
+            items += (tag, len(value), value)
+
+    return struct.pack("".join(formats), *items)
+
+
+class _Packer(struct.Struct):
+    """
+    _Packer is a struct.Struct packing a _REMOTE_PACKED raise (see _remote_packer).
+
+    Attributes:
+        prefix (bytes): Kind, key length and key of the raise, packed before the values.
+    """
+    prefix:bytes
+
+
+def _remote_packer(name:bytes, kinds:tuple)->_Packer | None:
+    """
+    Creates the struct packing the raises of a slotted EventArgs type whose slot values have the given types, created once per type and value types.
+
+    Parameters:
+        name (bytes): Type name.
+        kinds (tuple): (EventArgs type, types of the slot values).
+
+    Return:
+        _Packer | None: Struct packing (prefix, *values), None if some value is not an int, a float or a bool (encoded as tagged values).
+    """
+    formats = [_PACKED_FORMATS.get(kind) for kind in kinds[1]]
+
+    if None in formats:
+        packer = None
+    else:
+        key = name + b"|" + "".join(formats).encode()
+        prefix = struct.pack("<BH%ds" % len(key), _REMOTE_PACKED, len(key), key)
+        packer = _Packer("<%ds%s" % (len(prefix), "".join(formats)))
+        packer.prefix = prefix
+
+    _remote_packers[kinds] = packer
+    return packer
+
+
+def _remote_name(type:type)->bytes:
+    """
+    Gets the name used to encode the EventArgs of a type ("module:qualname"), computed once per type.
+
+    Parameters:
+        type (type): Type of the argument after the sender.
+
+    Return:
+        bytes: Type name, empty if the arguments of the type can not be forwarded (not a slotted EventArgs, or not importable by its name).
+    """
+    slotted = issubclass(type, EventArgs) and not type.__dictoffset__ and "<locals>" not in type.__qualname__
+    name = _remote_names[type] = ("%s:%s" % (type.__module__, type.__qualname__)).encode() if slotted else b""
+    return name
+
+
+def _remote_type(name:bytes)->type | None:
+    """
+    Resolves the EventArgs type of an encoded name (see _remote_name), resolved once per name. Modules are never imported, the type must
+    belong to a module already imported by the listener process (usually it is, to subscribe to the events of that type).
+
+    Parameters:
+        name (bytes): Type name.
+
+    Return:
+        type | None: EventArgs type, None if the name can not be resolved (the raise is discarded).
+    """
+    try:
+        return _remote_types[name]
+    except KeyError:
+        pass
+
+    module, _, qualname = name.decode().partition(":")
+
+    try:
+        resolved = sys.modules[module]
+
+        for part in qualname.split("."):
+            resolved = getattr(resolved, part)
+
+        if not (isinstance(resolved, type) and (_remote_names.get(resolved) or _remote_name(resolved)) == name):
+            raise TypeError("%s is not a slotted EventArgs type" % qualname)
+    except Exception:
+        _logger.warning("EventArgs type %s can not be resolved, its raises are discarded", name.decode(), exc_info=True)
+        resolved = None
+
+    _remote_types[name] = resolved
+    return resolved
+
+
+def _remote_layout(key:bytes)->tuple:
+    """
+    Resolves the EventArgs type and the struct of the values of a _REMOTE_PACKED key, resolved once per key.
+
+    Parameters:
+        key (bytes): "module:qualname|format" key.
+
+    Return:
+        tuple: (EventArgs type or None if the type can not be resolved, struct of the values, slot names).
+    """
+    name, _, formats = key.rpartition(b"|")
+    type = _remote_type(name)
+    layout = _remote_layouts[key] = (type, struct.Struct("<" + formats.decode()), EventRecorder._layout(type)[0] if type is not None else ())
+    return layout
+
+
+def _decode_frames(data:bytes)->Iterator[tuple]:
+    """
+    Decodes the raises of several frames (see _encode_arguments).
+
+    Parameters:
+        data (bytes): Complete frames.
+
+    Return:
+        Iterator[tuple]: (positional arguments after the sender, named arguments) of every raise, in order.
+    """
+    position = 0
+    set_slot = object.__setattr__
+
+    while position < len(data):
+        _, count = _REMOTE_FRAME.unpack_from(data, position)
+        position += _REMOTE_FRAME.size
+
+        for _ in range(count):
+            kind = data[position]
+
+            if kind == _REMOTE_PACKED:
+                (size,) = _UINT16.unpack_from(data, position + 1)
+                position += 3 + size
+                key = data[position - size:position]
+                type, packed, slots = _remote_layouts.get(key) or _remote_layout(key)
+                position += packed.size
+
+                if type is not None:
+                    e = type.__new__(type)
+
+                    for slot, value in zip(slots, packed.unpack_from(data, position - packed.size)):
+                        set_slot(e, slot, value)
+
+                    yield (e,), {}
+
+                continue
+
+            (size,) = _UINT16.unpack_from(data, position + 1)
+            position += 3 + size
+            name = data[position - size:position]
+            (length,) = _UINT16.unpack_from(data, position)
+            position += 2
+            values = []
+
+            for _ in range(length):
+                tag = data[position]
+                position += 1
+
+                if tag == _VALUE_INT:
+                    values.append(_INT64.unpack_from(data, position)[0])
+                    position += 8
+                elif tag == _VALUE_FLOAT:
+                    values.append(_FLOAT64.unpack_from(data, position)[0])
+                    position += 8
+                elif tag <= _VALUE_TRUE:
+                    values.append(None if tag == _VALUE_NONE else tag == _VALUE_TRUE)
+                else:
+                    (size,) = _UINT32.unpack_from(data, position)
+                    position += 4 + size
+                    value = data[position - size:position]
+                    values.append(value.decode() if tag == _VALUE_STR else value)
+
+            type = _remote_type(name)
 
+            if type is not None:
+                yield EventRecorder._arguments((type, values, None))
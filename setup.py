@@ -15,7 +15,7 @@ setup(
         "License :: OSI Approved :: MIT License",  # Type of license
         "Operating System :: OS Independent",  # Compatible operating systems
     ],
-    python_requires=">=3.6",  # Minimum required Python version
+    python_requires=">=3.11",  # Minimum required Python version (ExceptionGroup)
     install_requires=[  # Dependencies needed by package
     ],
     keywords=[
@@ -40,7 +40,7 @@ class Person:
     _location:int
     _name_changed:Delegate
     _moved:Delegate
-    _location_changing:Delegate
+    _location_changing:CancellableDelegate
     _died:Delegate
 
     def __init__(self,name:str)->None:
@@ -49,7 +49,7 @@ class Person:
         self._location = 0
         self._name_changed = Delegate()
         self._moved = Delegate()
-        self._location_changing = Delegate()
+        self._location_changing = CancellableDelegate()
         self._died = Delegate()
         Person._on_person_created(EventArgs())
         